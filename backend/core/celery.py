@@ -4,6 +4,7 @@ Backend에서 task를 send하기 위한 Celery 클라이언트
 """
 
 import os
+import threading
 from celery import Celery
 
 # Redis URL 환경변수에서 가져오기
@@ -17,9 +18,11 @@ celery_app = Celery(
 )
 
 # Celery 설정
+# msgpack은 JSON 대비 인코딩이 빠르고 페이로드가 작다 (worker도 msgpack 허용)
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
+    task_serializer="msgpack",
+    task_protocol=2,
+    accept_content=["msgpack", "json"],
     result_serializer="json",
     timezone="Asia/Seoul",
     enable_utc=True,
@@ -27,3 +30,33 @@ celery_app.conf.update(
     task_time_limit=30 * 60,  # 30분
     task_soft_time_limit=25 * 60,  # 25분
 )
+
+# result backend 클래스를 import 시점에 1회 해석 (send 경로의 지연 해석 제거)
+_ = celery_app.backend
+
+# 모듈 수준 producer 연결 (send 경로의 per-call 연결 획득 제거)
+# producer는 스레드 안전하지 않으므로 전송은 락으로 직렬화한다
+_producer = None
+_producer_lock = threading.Lock()
+
+
+def get_producer():
+    """캐시된 producer 연결 획득 (최초 1회 연결 후 재사용)"""
+    global _producer
+    if _producer is None:
+        _producer = celery_app.producer_pool.acquire(block=True)
+    return _producer
+
+
+def release_producer() -> None:
+    """lifespan 종료 시 producer 연결 반환"""
+    global _producer
+    if _producer is not None:
+        _producer.release()
+        _producer = None
+
+
+def send_task_pooled(name, kwargs=None, **options):
+    """캐시된 producer 연결로 task 전송"""
+    with _producer_lock:
+        return celery_app.send_task(name, kwargs=kwargs, producer=get_producer(), **options)
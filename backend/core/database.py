@@ -1,4 +1,9 @@
 from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from ..config import DATABASE_URL
@@ -13,9 +18,30 @@ engine = create_engine(
     echo=False
 )
 
+# 비동기 엔진 생성 (asyncpg 기반, async 라우터용)
+ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    connect_args={
+        "server_settings": {"application_name": "ragit_backend"}
+    },
+    echo=False
+)
+
 # 세션 로컬 클래스 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 세션 로컬 클래스 생성
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # Base 클래스 생성
 Base = declarative_base()
 
@@ -27,6 +53,11 @@ def get_db():
     finally:
         db.close()
 
+# 의존성 주입을 위한 비동기 데이터베이스 세션 생성 함수
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
 # 모든 테이블 생성
 def create_tables():
     """모든 테이블을 생성합니다."""
@@ -91,6 +122,23 @@ def _add_missing_columns():
             print(f"⚠️  error_message 컬럼 추가 중 오류 (무시 가능): {e}")
             conn.rollback()
 
+        try:
+            # repositories 테이블에 collection_name 컬럼 추가 + 기존 행 백필
+            conn.execute(text("""
+                ALTER TABLE repositories
+                ADD COLUMN IF NOT EXISTS collection_name VARCHAR(100);
+            """))
+            conn.execute(text("""
+                UPDATE repositories
+                SET collection_name = 'repo_' || replace(id::text, '-', '_')
+                WHERE collection_name IS NULL;
+            """))
+            conn.commit()
+            print("✅ repositories.collection_name 컬럼 추가 완료")
+        except Exception as e:
+            print(f"⚠️  collection_name 컬럼 추가 중 오류 (무시 가능): {e}")
+            conn.rollback()
+
 
 def _create_default_users():
     """기본 사용자(admin, user) 생성"""
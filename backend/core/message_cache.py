@@ -0,0 +1,71 @@
+"""
+ChatMessage 목록 캐시
+단일 책임: get_messages 응답의 Redis 캐싱 및 방 버전 키 관리
+
+버전 키(room_ver:{room_id})는 메시지 생성/삭제 시 증가하며, 캐시 키에
+버전이 포함되므로 이전 버전 항목은 명시적 삭제 없이 도달 불가능해진다.
+"""
+
+from typing import Optional
+
+import redis.asyncio as redis_async
+
+from ..config import REDIS_URL
+
+# 버전 키가 무효화를 담당하므로 TTL은 안전망 역할만 한다
+MESSAGE_CACHE_TTL = 30  # seconds
+
+_redis_client = redis_async.from_url(REDIS_URL, decode_responses=True)
+
+
+def _cache_key(room_id: str, user_id: str, version: str, limit: int) -> str:
+    # 권한이 사용자별로 다를 수 있으므로 user_id를 키에 포함
+    return f"msgs:{room_id}:{user_id}:{limit}:v{version}"
+
+
+async def get_room_version(room_id: str) -> Optional[str]:
+    """방의 현재 버전 조회 (Redis 장애 시 None → 캐시 우회)"""
+    try:
+        return await _redis_client.get(f"room_ver:{room_id}") or "0"
+    except Exception:
+        return None
+
+
+async def bump_room_version(room_id: str) -> None:
+    """메시지 생성/삭제 후 버전 증가 (이전 캐시 항목 무효화)"""
+    try:
+        await _redis_client.incr(f"room_ver:{room_id}")
+    except Exception:
+        # Redis 장애 시 TTL 만료로 자연 무효화
+        pass
+
+
+async def get_cached_messages(
+    room_id: str,
+    user_id: str,
+    version: str,
+    limit: int
+) -> Optional[str]:
+    """캐시된 메시지 목록 JSON 조회"""
+    try:
+        return await _redis_client.get(_cache_key(room_id, user_id, version, limit))
+    except Exception:
+        return None
+
+
+async def set_cached_messages(
+    room_id: str,
+    user_id: str,
+    version: str,
+    limit: int,
+    payload: str
+) -> None:
+    """메시지 목록 JSON을 캐시에 저장"""
+    try:
+        await _redis_client.setex(
+            _cache_key(room_id, user_id, version, limit),
+            MESSAGE_CACHE_TTL,
+            payload
+        )
+    except Exception:
+        pass
@@ -0,0 +1,130 @@
+"""
+parsed_repository JSON 캐시
+단일 책임: 파싱된 저장소 JSON 파일의 메모리 캐싱 (mtime 기반 무효화)
+
+같은 파일을 반복 조회하는 코드 히스토리 요청에서 디스크 I/O와
+JSON 파싱을 제거한다. 파일이 재파싱되어 mtime이 바뀌면 자동 갱신되며,
+캐시 적재 시 start_line 기준 정렬 인덱스를 함께 만들어 라인→노드
+탐색을 이진 탐색으로 처리한다.
+"""
+
+import os
+import time
+
+import orjson
+from bisect import bisect_right
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+PARSED_CACHE_TTL = 300  # seconds
+NEGATIVE_CACHE_TTL = 30  # seconds (없는 파일의 stat 재시도 간격)
+_PARSED_CACHE_MAX_SIZE = 256
+
+# 추적 대상 노드 타입
+_NAMED_TYPES = ('function', 'async_function', 'class')
+_SPAN_TYPES = ('module', 'script')
+
+# 캐시 항목: (만료 시각, mtime_ns, 파싱된 항목 리스트, 정렬된 start_line, 정렬된 노드)
+# mtime_ns가 None이면 "파일 없음"을 캐시한 negative 항목
+_CacheEntry = Tuple[float, Optional[int], Optional[List[Any]], Optional[List[int]], Optional[List[Any]]]
+_parsed_cache: Dict[str, _CacheEntry] = {}
+
+
+@lru_cache(maxsize=4096)
+def resolve_parsed_path(repo_id: str, file_path: str) -> Path:
+    """
+    (repo_id, file_path) → parsed JSON 경로 해석
+
+    순수 문자열 연산이므로 영구 캐시가 안전하다. 존재 여부 확인은
+    load_parsed_file의 stat이 겸한다.
+    """
+    return (
+        Path("parsed_repository")
+        / f"repo_{repo_id.replace('-', '_')}"
+        / file_path.replace('.py', '.json')
+    )
+
+
+def _build_line_index(items: List[Any]) -> Tuple[List[int], List[Any]]:
+    """start_line 기준 정렬 인덱스 생성 (이진 탐색용)"""
+    nodes = [
+        item for item in items
+        if isinstance(item, dict) and isinstance(item.get('start_line'), int)
+    ]
+    nodes.sort(key=lambda item: item['start_line'])
+    starts = [item['start_line'] for item in nodes]
+    return starts, nodes
+
+
+def _get_entry(json_file_path: Path) -> Optional[_CacheEntry]:
+    """캐시 항목 조회 (미스 시 로드 + 인덱스 빌드, 파일 없으면 None)"""
+    key = str(json_file_path)
+    now = time.monotonic()
+
+    entry = _parsed_cache.get(key)
+    if entry and entry[0] > now and entry[1] is None:
+        # 최근에 "파일 없음"으로 확인됨 → stat 생략
+        return None
+
+    try:
+        stat = os.stat(json_file_path)
+    except OSError:
+        # 파일 없음도 짧은 TTL로 캐시하여 반복 stat 제거
+        _parsed_cache[key] = (now + NEGATIVE_CACHE_TTL, None, None, None, None)
+        return None
+
+    if entry and entry[0] > now and entry[1] == stat.st_mtime_ns:
+        return entry
+
+    # orjson은 stdlib json 대비 수 배 빠른 SIMD 기반 파서
+    items = orjson.loads(json_file_path.read_bytes())
+    starts, nodes = _build_line_index(items) if isinstance(items, list) else ([], [])
+
+    if len(_parsed_cache) >= _PARSED_CACHE_MAX_SIZE:
+        # 가장 오래된 항목부터 제거 (삽입 순서 유지)
+        _parsed_cache.pop(next(iter(_parsed_cache)), None)
+    entry = (now + PARSED_CACHE_TTL, stat.st_mtime_ns, items, starts, nodes)
+    _parsed_cache[key] = entry
+
+    return entry
+
+
+def load_parsed_file(json_file_path: Path) -> Optional[List[Any]]:
+    """
+    파싱된 JSON 파일 로드 (캐시 우선)
+
+    Args:
+        json_file_path: parsed_repository 내 JSON 파일 경로
+
+    Returns:
+        파싱된 항목 리스트 (파일이 없으면 None)
+    """
+    entry = _get_entry(json_file_path)
+    return entry[2] if entry else None
+
+
+def find_node_at_line(json_file_path: Path, line: int) -> Optional[Dict[str, Any]]:
+    """
+    해당 라인을 포함하는 추적 가능한 노드 조회
+
+    정렬된 start_line에 대한 bisect로 가장 가까운 후보로 점프한 뒤,
+    라인을 포함하면서 추적 가능한 타입(이름 있는 function/class 또는
+    module/script)이 나올 때까지 좌측으로 스캔한다.
+    """
+    entry = _get_entry(json_file_path)
+    if entry is None or not entry[3]:
+        return None
+
+    starts, nodes = entry[3], entry[4]
+    idx = bisect_right(starts, line) - 1
+    while idx >= 0:
+        node = nodes[idx]
+        end_line = node.get('end_line', node['start_line'])
+        if end_line is not None and end_line >= line:
+            name = node.get('name', '')
+            node_type = node.get('type', 'function')
+            if (name and node_type in _NAMED_TYPES) or node_type in _SPAN_TYPES:
+                return node
+        idx -= 1
+    return None
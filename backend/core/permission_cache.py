@@ -0,0 +1,147 @@
+"""
+Repository 권한 캐시
+단일 책임: (user_id, repo_id) 권한 확인 결과의 L1(프로세스 내) + L2(Redis) 캐싱
+"""
+
+import time
+from typing import Dict, Optional, Tuple
+
+import redis
+import redis.asyncio as redis_async
+
+from ..config import REDIS_URL
+
+# 권한 행은 드물게 변경되므로 짧은 TTL로 캐시 (멤버십 변경 시 즉시 무효화)
+PERMISSION_CACHE_TTL = 120  # seconds
+
+# L1: 프로세스 내 캐시 {key: (만료 시각, 권한 여부)}
+_LOCAL_CACHE_MAX_SIZE = 4096
+_local_cache: Dict[str, Tuple[float, bool]] = {}
+
+# L2: Redis 캐시 (Celery broker와 동일한 인스턴스 사용)
+_redis_client = redis_async.from_url(REDIS_URL, decode_responses=True)
+_redis_sync_client = redis.from_url(REDIS_URL, decode_responses=True)
+
+
+def _cache_key(repo_id: str, user_id: str, required_role: Optional[str] = None) -> str:
+    return f"perm:{repo_id}:{user_id}:{required_role or ''}"
+
+
+def _local_get(key: str) -> Optional[bool]:
+    entry = _local_cache.get(key)
+    if not entry:
+        return None
+    expires_at, allowed = entry
+    if expires_at < time.monotonic():
+        _local_cache.pop(key, None)
+        return None
+    return allowed
+
+
+def _local_set(key: str, allowed: bool) -> None:
+    if len(_local_cache) >= _LOCAL_CACHE_MAX_SIZE:
+        # 가장 오래된 항목부터 제거 (삽입 순서 유지)
+        _local_cache.pop(next(iter(_local_cache)), None)
+    _local_cache[key] = (time.monotonic() + PERMISSION_CACHE_TTL, allowed)
+
+
+async def get_cached_permission(
+    repo_id: str,
+    user_id: str,
+    required_role: Optional[str] = None
+) -> Optional[bool]:
+    """캐시된 권한 확인 결과 조회 (L1 → L2 순서, 미스 시 None)"""
+    key = _cache_key(repo_id, user_id, required_role)
+
+    # L1: 프로세스 내 캐시
+    allowed = _local_get(key)
+    if allowed is not None:
+        return allowed
+
+    # L2: Redis 캐시
+    try:
+        value = await _redis_client.get(key)
+    except Exception:
+        # Redis 장애 시 캐시 미스로 처리하고 DB로 폴백
+        return None
+
+    if value is None:
+        return None
+
+    allowed = value == "1"
+    _local_set(key, allowed)
+    return allowed
+
+
+async def set_cached_permission(
+    repo_id: str,
+    user_id: str,
+    allowed: bool,
+    required_role: Optional[str] = None
+) -> None:
+    """권한 확인 결과를 L1 + L2에 저장"""
+    key = _cache_key(repo_id, user_id, required_role)
+    _local_set(key, allowed)
+
+    try:
+        await _redis_client.setex(key, PERMISSION_CACHE_TTL, "1" if allowed else "0")
+    except Exception:
+        # Redis 장애 시 L1만으로 동작
+        pass
+
+
+def get_cached_permission_sync(
+    repo_id: str,
+    user_id: str,
+    required_role: Optional[str] = None
+) -> Optional[bool]:
+    """캐시된 권한 확인 결과 조회 (동기 경로용, L1 → L2 순서)"""
+    key = _cache_key(repo_id, user_id, required_role)
+
+    allowed = _local_get(key)
+    if allowed is not None:
+        return allowed
+
+    try:
+        value = _redis_sync_client.get(key)
+    except Exception:
+        return None
+
+    if value is None:
+        return None
+
+    allowed = value == "1"
+    _local_set(key, allowed)
+    return allowed
+
+
+def set_cached_permission_sync(
+    repo_id: str,
+    user_id: str,
+    allowed: bool,
+    required_role: Optional[str] = None
+) -> None:
+    """권한 확인 결과를 L1 + L2에 저장 (동기 경로용)"""
+    key = _cache_key(repo_id, user_id, required_role)
+    _local_set(key, allowed)
+
+    try:
+        _redis_sync_client.setex(key, PERMISSION_CACHE_TTL, "1" if allowed else "0")
+    except Exception:
+        pass
+
+
+def invalidate_repository_permissions(repo_id: str) -> None:
+    """Repository 멤버십 변경 시 해당 Repository의 권한 캐시 전체 무효화"""
+    prefix = f"perm:{repo_id}:"
+
+    for key in [k for k in _local_cache if k.startswith(prefix)]:
+        _local_cache.pop(key, None)
+
+    try:
+        keys = list(_redis_sync_client.scan_iter(match=f"{prefix}*"))
+        if keys:
+            _redis_sync_client.delete(*keys)
+    except Exception:
+        # Redis 장애 시 TTL 만료로 자연 무효화
+        pass
@@ -0,0 +1,33 @@
+"""
+커스텀 라우팅 구성 요소
+단일 책임: 요청 본문 파싱을 orjson으로 교체하는 APIRoute 제공
+"""
+
+from typing import Any, Callable, Coroutine
+
+import orjson
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+
+class ORJSONRequest(Request):
+    """요청 본문을 stdlib json 대신 orjson으로 파싱하는 Request"""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """핸들러에 ORJSONRequest를 전달하는 APIRoute"""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_route_handler = super().get_route_handler()
+
+        async def custom_route_handler(request: Request) -> Response:
+            return await original_route_handler(
+                ORJSONRequest(request.scope, request.receive)
+            )
+
+        return custom_route_handler
@@ -0,0 +1,89 @@
+"""
+Celery Task 배치 디스패처
+단일 책임: 요청 경로의 task 전송을 잠시 모아 하나의 producer 연결로 flush
+
+요청 핸들러가 task마다 broker에 왕복하는 대신 asyncio.Queue에 적재하고,
+백그라운드 flusher가 5ms 간격으로 큐를 비워 N개의 전송을 한 번의
+연결 획득으로 처리한다.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from .celery import celery_app
+
+logger = logging.getLogger(__name__)
+
+# 버스트를 모으기에 충분하면서 체감 지연은 없는 flush 간격
+FLUSH_INTERVAL = 0.005  # 5 ms
+
+_task_queue: "asyncio.Queue[Tuple[str, Dict[str, Any]]]" = asyncio.Queue()
+_flusher_task: Optional["asyncio.Task[None]"] = None
+
+
+async def enqueue_task(name: str, kwargs: Dict[str, Any]) -> None:
+    """task 전송을 백그라운드 flusher에 위임 (fire-and-forget)"""
+    await _task_queue.put((name, kwargs))
+
+
+def _send_batch(batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+    """하나의 producer 연결로 배치 전체 전송 (task당 TCP connect 제거)"""
+    with celery_app.producer_pool.acquire(block=True) as producer:
+        for name, kwargs in batch:
+            # 디스패처 경로는 fire-and-forget이므로 result backend 기록 생략
+            task = celery_app.send_task(
+                name, kwargs=kwargs, producer=producer, ignore_result=True
+            )
+            logger.info(f"✅ Task sent: {name} (Task ID: {task.id})")
+
+
+async def _flusher() -> None:
+    """큐를 주기적으로 비우며 배치 전송"""
+    while True:
+        batch = [await _task_queue.get()]
+
+        # 짧게 대기하여 버스트로 들어온 task를 같은 배치로 묶는다
+        await asyncio.sleep(FLUSH_INTERVAL)
+        while True:
+            try:
+                batch.append(_task_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        try:
+            # send_task는 블로킹 I/O이므로 스레드로 offload
+            await asyncio.to_thread(_send_batch, batch)
+        except Exception as e:
+            logger.error(f"❌ Failed to dispatch task batch: {str(e)}", exc_info=True)
+
+
+def start_dispatcher() -> None:
+    """lifespan 시작 시 flusher 기동"""
+    global _flusher_task
+    if _flusher_task is None or _flusher_task.done():
+        _flusher_task = asyncio.create_task(_flusher())
+
+
+async def stop_dispatcher() -> None:
+    """lifespan 종료 시 남은 배치를 flush하고 flusher 중단"""
+    global _flusher_task
+    if _flusher_task is None:
+        return
+
+    _flusher_task.cancel()
+    try:
+        await _flusher_task
+    except asyncio.CancelledError:
+        pass
+    _flusher_task = None
+
+    # 종료 시점에 큐에 남은 task는 즉시 전송
+    remaining: List[Tuple[str, Dict[str, Any]]] = []
+    while True:
+        try:
+            remaining.append(_task_queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    if remaining:
+        await asyncio.to_thread(_send_batch, remaining)
@@ -1,11 +1,15 @@
 import logging
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .config import CORS_ORIGINS
-from .core.database import init_db
+from .core.celery import release_producer
+from .core.database import async_engine, init_db
+from .core.task_dispatcher import start_dispatcher, stop_dispatcher
 from .routers import auth
 from .routers import repository
 from .routers import chat
@@ -47,11 +51,24 @@ def setup_logging() -> None:
 # 로깅 초기화
 setup_logging()
 
+# 애플리케이션 생명주기 관리
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """시작 시 데이터베이스 초기화 및 task 디스패처 기동, 종료 시 정리"""
+    init_db()
+    start_dispatcher()
+    yield
+    await stop_dispatcher()
+    release_producer()
+    await async_engine.dispose()
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="RAG Agent Backend",
     description="Backend API for RAG Agent with PostgreSQL and JWT authentication",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS 설정
@@ -68,12 +85,6 @@ app.include_router(auth.router)
 app.include_router(repository.router)
 app.include_router(chat.router)
 
-# 데이터베이스 초기화
-@app.on_event("startup")
-async def startup_event():
-    """애플리케이션 시작 시 데이터베이스 초기화"""
-    init_db()
-
 # 기본 엔드포인트
 @app.get("/")
 async def root():
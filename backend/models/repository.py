@@ -26,6 +26,7 @@ class Repository(Base):
     description = Column(Text)
     url = Column(String(255), nullable=False)
     owner_id = Column(GUID(), ForeignKey("users.id"), nullable=False)
+    collection_name = Column(String(100))  # 파생 식별자: repo_{id의 하이픈을 _로 치환}
     stars = Column(Integer, default=0)
     language = Column(String(50))
     status = Column(String(20), default="pending")  # pending, syncing, active, error
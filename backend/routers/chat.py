@@ -3,151 +3,214 @@ Chat API 라우터
 단일 책임: Chat 관련 HTTP 요청 처리
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-
-from ..core.database import get_db
+import asyncio
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.database import get_async_db
+from ..core.message_cache import (
+    bump_room_version,
+    get_cached_messages,
+    get_room_version,
+    set_cached_messages
+)
+from ..core.parsed_repository import find_node_at_line, resolve_parsed_path
+from ..core.routing import ORJSONRoute
+from ..core.task_dispatcher import enqueue_task
 from ..services.chat_service import ChatRoomService, ChatMessageService
 from ..services.repository_service import RepositoryService
 from ..services.auth_service import get_current_active_user
+from .repository import _serialize_repo
 from ..schemas.chat import (
     ChatRoomCreate,
     ChatRoomUpdate,
     ChatRoomResponse,
     ChatMessageCreate,
-    ChatMessageResponse
+    ChatMessageResponse,
+    CodeHistoryBatchRequest,
+    CodeHistoryRequest
 )
 from ..models.user import User
 
-router = APIRouter(prefix="/api/repositories", tags=["chat"])
+router = APIRouter(prefix="/api/repositories", tags=["chat"], route_class=ORJSONRoute)
+
+# 캐시 저장용 메시지 목록 직렬화 어댑터
+_message_list_adapter = TypeAdapter(List[ChatMessageResponse])
+_room_list_adapter = TypeAdapter(List[ChatRoomResponse])
+
+# 브라우저/프록시 재검증 정책 (ETag와 함께 사용)
+_CACHE_CONTROL = "private, max-age=5, must-revalidate"
+
+
+def _room_etag(room) -> str:
+    """ChatRoom의 약한 ETag (updated_at + message_count 기반)"""
+    stamp = room.updated_at or room.created_at
+    return f'W/"{stamp.timestamp()}-{room.message_count or 0}"'
+
+
+def _room_list_etag(rooms) -> str:
+    """ChatRoom 목록의 약한 ETag (가장 최근 변경 시각 + 개수 기반)"""
+    if not rooms:
+        return 'W/"empty"'
+    latest = max((room.updated_at or room.created_at) for room in rooms)
+    return f'W/"{latest.timestamp()}-{len(rooms)}"'
 
 
 # ChatRoom Endpoints
 
+@router.get("/{repo_id}/chat-bootstrap")
+async def get_chat_bootstrap(
+    repo_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    채팅 페이지 초기 로딩용 일괄 조회
+
+    repository, chat_rooms, 첫 번째 방의 메시지를 한 번의 요청으로
+    반환하여 페이지 진입 시 직렬 왕복 4회를 1회로 줄인다.
+    """
+    if not await RepositoryService.check_user_permission_async(db, repo_id, str(current_user.id)):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to access this repository"
+        )
+
+    repository = await RepositoryService.get_repository_async(db, repo_id)
+    if not repository:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Repository not found"
+        )
+
+    chat_rooms = await ChatRoomService.get_repository_chat_rooms(db, repo_id)
+
+    initial_messages = []
+    if chat_rooms:
+        initial_messages = await ChatMessageService.get_chat_room_messages(
+            db, str(chat_rooms[0].id)
+        )
+
+    rooms_validated = _room_list_adapter.validate_python(chat_rooms, from_attributes=True)
+    messages_validated = _message_list_adapter.validate_python(
+        initial_messages, from_attributes=True
+    )
+
+    return {
+        "repository": _serialize_repo(
+            repository,
+            repository.owner.username if repository.owner else "Unknown"
+        ),
+        "chat_rooms": _room_list_adapter.dump_python(rooms_validated, mode="json"),
+        "initial_messages": _message_list_adapter.dump_python(
+            messages_validated, mode="json"
+        )
+    }
+
+
 @router.post("/{repo_id}/chat-rooms", response_model=ChatRoomResponse, status_code=status.HTTP_201_CREATED)
-def create_chat_room(
+async def create_chat_room(
     repo_id: str,
     room_data: ChatRoomCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """새로운 ChatRoom 생성"""
     # Repository 접근 권한 확인
-    if not RepositoryService.check_user_permission(db, repo_id, str(current_user.id)):
+    if not await RepositoryService.check_user_permission_async(db, repo_id, str(current_user.id)):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to access this repository"
         )
 
     # Repository 존재 확인
-    repository = RepositoryService.get_repository(db, repo_id)
+    repository = await RepositoryService.get_repository_async(db, repo_id)
     if not repository:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Repository not found"
         )
 
-    # ChatRoom 생성
-    chat_room = ChatRoomService.create_chat_room(db, room_data, str(current_user.id))
-
-    # 응답 생성
-    room_dict = {
-        "id": str(chat_room.id),
-        "name": chat_room.name,
-        "repository_id": str(chat_room.repository_id),
-        "created_by": str(chat_room.created_by),
-        "message_count": chat_room.message_count or 0,
-        "last_message": chat_room.last_message,
-        "created_at": chat_room.created_at,
-        "updated_at": chat_room.updated_at
-    }
-
-    return room_dict
+    # ChatRoom 생성 (응답 변환은 response_model의 from_attributes가 처리)
+    return await ChatRoomService.create_chat_room(db, room_data, str(current_user.id))
 
 
 @router.get("/{repo_id}/chat-rooms", response_model=List[ChatRoomResponse])
-def get_chat_rooms(
+async def get_chat_rooms(
     repo_id: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Repository의 모든 ChatRoom 조회"""
     # Repository 접근 권한 확인
-    if not RepositoryService.check_user_permission(db, repo_id, str(current_user.id)):
+    if not await RepositoryService.check_user_permission_async(db, repo_id, str(current_user.id)):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to access this repository"
         )
 
-    # ChatRoom 목록 조회
-    chat_rooms = ChatRoomService.get_repository_chat_rooms(db, repo_id)
+    # ChatRoom 목록 조회 (응답 변환은 response_model의 from_attributes가 처리)
+    chat_rooms = await ChatRoomService.get_repository_chat_rooms(db, repo_id)
 
-    # 응답 생성
-    result = []
-    for room in chat_rooms:
-        room_dict = {
-            "id": str(room.id),
-            "name": room.name,
-            "repository_id": str(room.repository_id),
-            "created_by": str(room.created_by),
-            "message_count": room.message_count or 0,
-            "last_message": room.last_message,
-            "created_at": room.created_at,
-            "updated_at": room.updated_at
-        }
-        result.append(room_dict)
+    # 변경이 없으면 304로 응답 (재직렬화/전송 생략)
+    etag = _room_list_etag(chat_rooms)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
 
-    return result
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    return chat_rooms
 
 
 @router.get("/chat-rooms/{room_id}", response_model=ChatRoomResponse)
-def get_chat_room(
+async def get_chat_room(
     room_id: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """특정 ChatRoom 조회"""
-    chat_room = ChatRoomService.get_chat_room(db, room_id)
+    # 존재 확인 + 접근 권한 확인을 한 번의 쿼리로 수행
+    chat_room, has_access = await ChatRoomService.get_chat_room_with_access(
+        db, room_id, str(current_user.id)
+    )
     if not chat_room:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Chat room not found"
         )
 
-    # Repository 접근 권한 확인
-    if not RepositoryService.check_user_permission(
-        db, str(chat_room.repository_id), str(current_user.id)
-    ):
+    if not has_access:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to access this chat room"
         )
 
-    # 응답 생성
-    room_dict = {
-        "id": str(chat_room.id),
-        "name": chat_room.name,
-        "repository_id": str(chat_room.repository_id),
-        "created_by": str(chat_room.created_by),
-        "message_count": chat_room.message_count or 0,
-        "last_message": chat_room.last_message,
-        "created_at": chat_room.created_at,
-        "updated_at": chat_room.updated_at
-    }
+    # 변경이 없으면 304로 응답 (재직렬화/전송 생략)
+    etag = _room_etag(chat_room)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
 
-    return room_dict
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    return chat_room
 
 
 @router.put("/chat-rooms/{room_id}", response_model=ChatRoomResponse)
-def update_chat_room(
+async def update_chat_room(
     room_id: str,
     room_data: ChatRoomUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """ChatRoom 업데이트"""
-    chat_room = ChatRoomService.get_chat_room(db, room_id)
+    chat_room = await ChatRoomService.get_chat_room(db, room_id)
     if not chat_room:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -161,31 +224,17 @@ def update_chat_room(
             detail="Only the creator can update this chat room"
         )
 
-    updated_room = ChatRoomService.update_chat_room(db, room_id, room_data)
-
-    # 응답 생성
-    room_dict = {
-        "id": str(updated_room.id),
-        "name": updated_room.name,
-        "repository_id": str(updated_room.repository_id),
-        "created_by": str(updated_room.created_by),
-        "message_count": updated_room.message_count or 0,
-        "last_message": updated_room.last_message,
-        "created_at": updated_room.created_at,
-        "updated_at": updated_room.updated_at
-    }
-
-    return room_dict
+    return await ChatRoomService.update_chat_room(db, room_id, room_data)
 
 
 @router.delete("/chat-rooms/{room_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_chat_room(
+async def delete_chat_room(
     room_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """ChatRoom 삭제"""
-    chat_room = ChatRoomService.get_chat_room(db, room_id)
+    chat_room = await ChatRoomService.get_chat_room(db, room_id)
     if not chat_room:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -199,7 +248,7 @@ def delete_chat_room(
             detail="Only the creator can delete this chat room"
         )
 
-    success = ChatRoomService.delete_chat_room(db, room_id)
+    success = await ChatRoomService.delete_chat_room(db, room_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -210,25 +259,24 @@ def delete_chat_room(
 # ChatMessage Endpoints
 
 @router.post("/chat-rooms/{room_id}/messages", response_model=ChatMessageResponse, status_code=status.HTTP_201_CREATED)
-def create_message(
+async def create_message(
     room_id: str,
     message_data: ChatMessageCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """새로운 ChatMessage 생성"""
-    # ChatRoom 존재 확인
-    chat_room = ChatRoomService.get_chat_room(db, room_id)
+    # ChatRoom 존재 확인 + 접근 권한 확인을 한 번의 쿼리로 수행
+    chat_room, has_access = await ChatRoomService.get_chat_room_with_access(
+        db, room_id, str(current_user.id)
+    )
     if not chat_room:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Chat room not found"
         )
 
-    # Repository 접근 권한 확인
-    if not RepositoryService.check_user_permission(
-        db, str(chat_room.repository_id), str(current_user.id)
-    ):
+    if not has_access:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to send messages in this chat room"
@@ -236,22 +284,22 @@ def create_message(
 
     # 메시지 생성
     user_id = str(current_user.id) if message_data.sender_type == "user" else None
-    message = ChatMessageService.create_message(db, message_data, user_id)
+    message = await ChatMessageService.create_message(db, message_data, user_id)
 
-    # 사용자 메시지인 경우 RAG Worker에 쿼리 전송
+    # 메시지 목록 캐시 무효화 (버전 증가)
+    await bump_room_version(room_id)
+
+    # 사용자 메시지인 경우 RAG Worker에 쿼리 전송 (배치 디스패처로 위임)
     if message_data.sender_type == "user":
         import logging
         logger = logging.getLogger(__name__)
 
         try:
-            from ..core.celery import celery_app
-
             logger.info(f"🤖 Triggering RAG chat query for message: {message.id}")
 
-            # Celery task 트리거
-            task = celery_app.send_task(
+            await enqueue_task(
                 'rag_worker.tasks.chat_query',
-                kwargs={
+                {
                     'chat_room_id': str(chat_room.id),
                     'repo_id': str(chat_room.repository_id),
                     'user_message': message.content,
@@ -259,78 +307,146 @@ def create_message(
                 }
             )
 
-            logger.info(f"✅ RAG task sent. Task ID: {task.id}")
-
         except Exception as task_error:
             logger.error(f"❌ Failed to trigger RAG task: {str(task_error)}", exc_info=True)
             # Task 실패해도 메시지는 저장되었으므로 계속 진행
 
-    # 응답 생성
-    message_dict = {
-        "id": str(message.id),
-        "chat_room_id": str(message.chat_room_id),
-        "sender_id": str(message.sender_id) if message.sender_id else None,
-        "sender_type": message.sender_type,
-        "content": message.content,
-        "sources": message.sources,
-        "created_at": message.created_at
-    }
-
-    return message_dict
+    return message
 
 
 @router.get("/chat-rooms/{room_id}/messages", response_model=List[ChatMessageResponse])
-def get_messages(
+async def get_messages(
     room_id: str,
-    db: Session = Depends(get_db),
+    limit: int = Query(50, ge=1, le=200),
+    before_id: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """ChatRoom의 모든 메시지 조회"""
-    # ChatRoom 존재 확인
-    chat_room = ChatRoomService.get_chat_room(db, room_id)
+    """ChatRoom의 메시지 조회 (최신순 limit개, before_id 이전 페이지 지원)"""
+    # ChatRoom 존재 확인 + 접근 권한 확인을 한 번의 쿼리로 수행
+    chat_room, has_access = await ChatRoomService.get_chat_room_with_access(
+        db, room_id, str(current_user.id)
+    )
     if not chat_room:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Chat room not found"
         )
 
-    # Repository 접근 권한 확인
-    if not RepositoryService.check_user_permission(
-        db, str(chat_room.repository_id), str(current_user.id)
-    ):
+    if not has_access:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to view messages in this chat room"
         )
 
+    # 캐시 조회 (첫 페이지만 캐시, 버전 키가 생성/삭제 시 증가하므로 stale 응답 없음)
+    version = await get_room_version(room_id) if before_id is None else None
+    if version is not None:
+        cached = await get_cached_messages(room_id, str(current_user.id), version, limit)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
     # 메시지 목록 조회
-    messages = ChatMessageService.get_chat_room_messages(db, room_id)
+    messages = await ChatMessageService.get_chat_room_messages(
+        db, room_id, limit=limit, before_id=before_id
+    )
+    validated = _message_list_adapter.validate_python(messages, from_attributes=True)
+
+    # 행 단위로 직렬화하여 스트리밍 (첫 행 지연으로 TTFB 단축, 전체 버퍼 생성 없음)
+    async def message_stream():
+        chunks = ["["]
+        yield b"["
+        for i, msg in enumerate(validated):
+            chunk = ("," if i else "") + msg.model_dump_json()
+            chunks.append(chunk)
+            yield chunk.encode()
+        chunks.append("]")
+        yield b"]"
+
+        # 전송 완료 후 전체 페이로드를 캐시에 적재
+        if version is not None:
+            await set_cached_messages(
+                room_id, str(current_user.id), version, limit, "".join(chunks)
+            )
+
+    return StreamingResponse(message_stream(), media_type="application/json")
+
+
+@router.get("/chat-rooms/{room_id}/messages/wait")
+async def wait_for_new_messages(
+    room_id: str,
+    after: Optional[str] = None,
+    timeout: float = Query(25.0, ge=1.0, le=60.0),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    새 bot 메시지가 도착할 때까지 대기 (롱폴링)
+
+    클라이언트가 2초 간격으로 전체 목록을 끌어가는 대신, 서버가 방 버전
+    키를 관찰하다가 bot 메시지가 생기는 즉시 응답한다. timeout 내에
+    변화가 없으면 빈 목록으로 응답한다.
+    """
+    # ChatRoom 존재 확인 + 접근 권한 확인을 한 번의 쿼리로 수행
+    chat_room, has_access = await ChatRoomService.get_chat_room_with_access(
+        db, room_id, str(current_user.id)
+    )
+    if not chat_room:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Chat room not found"
+        )
+
+    if not has_access:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to view messages in this chat room"
+        )
 
-    # 응답 생성
-    result = []
-    for msg in messages:
-        message_dict = {
-            "id": str(msg.id),
-            "chat_room_id": str(msg.chat_room_id),
-            "sender_id": str(msg.sender_id) if msg.sender_id else None,
-            "sender_type": msg.sender_type,
-            "content": msg.content,
-            "sources": msg.sources,
-            "created_at": msg.created_at
-        }
-        result.append(message_dict)
+    # 대기 중에 DB 커넥션을 점유하지 않도록 트랜잭션 종료
+    await db.rollback()
+
+    loop = asyncio.get_event_loop()
+    deadline = loop.time() + timeout
+    version = await get_room_version(room_id)
+
+    # bot 응답이 롱폴링 도착 전에 이미 저장됐을 수 있으므로
+    # 첫 회차는 버전과 무관하게 무조건 DB를 확인한다
+    check_db = True
+
+    while True:
+        if check_db:
+            messages = await ChatMessageService.get_messages_after(db, room_id, after)
+            await db.rollback()
+
+            if any(m.sender_type == "bot" for m in messages):
+                validated = _message_list_adapter.validate_python(
+                    messages, from_attributes=True
+                )
+                return {
+                    "status": "new",
+                    "messages": _message_list_adapter.dump_python(validated, mode="json")
+                }
+
+        if loop.time() >= deadline:
+            return {"status": "timeout", "messages": []}
 
-    return result
+        await asyncio.sleep(0.5)
+
+        # 이후에는 버전이 바뀌었거나 (Redis 장애로) 버전을 알 수 없을 때만 DB 확인
+        current = await get_room_version(room_id)
+        check_db = version is None or current is None or current != version
+        version = current
 
 
 @router.delete("/chat-rooms/messages/{message_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_message(
+async def delete_message(
     message_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """ChatMessage 삭제"""
-    message = ChatMessageService.get_message(db, message_id)
+    message = await ChatMessageService.get_message(db, message_id)
     if not message:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -344,46 +460,44 @@ def delete_message(
             detail="Only the sender can delete this message"
         )
 
-    success = ChatMessageService.delete_message(db, message_id)
+    room_id = str(message.chat_room_id)
+    success = await ChatMessageService.delete_message(db, message_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Failed to delete message"
         )
 
+    # 메시지 목록 캐시 무효화 (버전 증가)
+    await bump_room_version(room_id)
+
 
-@router.post("/code-history", status_code=status.HTTP_200_OK)
-def get_code_history(
-    request: dict,
-    db: Session = Depends(get_db),
+@router.post("/code-history", status_code=status.HTTP_202_ACCEPTED)
+async def get_code_history(
+    payload: CodeHistoryRequest,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """파일 또는 코드의 Git 히스토리 조회"""
-    from ..core.celery import celery_app
+    from ..core.celery import send_task_pooled
     import logging
-    import json
-    from pathlib import Path
 
     logger = logging.getLogger(__name__)
 
-    # 필수 파라미터 검증
-    repo_id = request.get("repo_id")
-    file_path = request.get("file_path")
-    line_info = request.get("line_info", "")  # "150-200" 형식
-    node_name = request.get("node_name")
-    node_type = request.get("node_type")
-
-    # track_full_file: True면 파일 전체 추적, False/None이면 특정 노드 추적
-    track_full_file = request.get("track_full_file", True)
+    repo_id = payload.repo_id
+    file_path = payload.file_path
+    node_name = payload.node_name
+    node_type = payload.node_type
 
-    if not all([repo_id, file_path]):
+    # Repository 접근 권한 확인 (파일 I/O 전에 먼저 수행)
+    if not await RepositoryService.check_user_permission_async(db, repo_id, str(current_user.id)):
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Missing required parameters: repo_id, file_path"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to access this repository"
         )
 
     # 전체 파일 추적 모드면 node_name, node_type을 None으로 설정
-    if track_full_file:
+    if payload.track_full_file:
         logger.info(f"📖 Tracking full file history for {file_path}")
         node_name = None
         node_type = None
@@ -391,57 +505,38 @@ def get_code_history(
         end_line = None
     # 특정 노드 추적 모드
     else:
-        # line_info를 파싱하여 start_line, end_line 추출
-        start_line = None
-        end_line = None
-        if line_info:
-            try:
-                if '-' in line_info:
-                    parts = line_info.split('-')
-                    start_line = int(parts[0])
-                    end_line = int(parts[1]) if len(parts) > 1 else start_line
-                else:
-                    start_line = int(line_info)
-                    end_line = start_line
-            except ValueError:
-                logger.warning(f"⚠️ Invalid line_info format: {line_info}")
+        # start_line/end_line은 스키마 검증 단계에서 line_info로부터 계산됨
+        start_line = payload.start_line
+        end_line = payload.end_line
+        if payload.line_info and start_line is None:
+            logger.warning(f"⚠️ Invalid line_info format: {payload.line_info}")
 
         # node_name이 없으면 parsed_repository에서 찾기
         if not node_name and start_line:
             try:
-                # parsed_repository에서 해당 파일의 JSON 읽기
-                parsed_dir = Path("parsed_repository") / f"repo_{repo_id.replace('-', '_')}"
-                json_file_path = parsed_dir / file_path.replace('.py', '.json')
+                # parsed_repository에서 해당 파일의 JSON 읽기 (경로 해석은 캐시됨)
+                json_file_path = resolve_parsed_path(repo_id, file_path)
 
                 logger.info(f"🔍 Looking for parsed JSON at: {json_file_path}")
 
-                if json_file_path.exists():
-                    with open(json_file_path, 'r', encoding='utf-8') as f:
-                        parsed_data = json.load(f)
-
-                    # start_line과 매칭되는 노드 찾기
-                    for item in parsed_data:
-                        if item.get('start_line') <= start_line <= item.get('end_line', start_line):
-                            item_name = item.get('name', '')
-                            item_type = item.get('type', 'function')
-
-                            # 이름이 있는 노드만 사용 (function, async_function, class)
-                            if item_name and item_type in ['function', 'async_function', 'class']:
-                                node_name = item_name
-                                node_type = item_type
-                                # 실제 노드의 라인 범위로 업데이트
-                                start_line = item.get('start_line')
-                                end_line = item.get('end_line')
-                                logger.info(f"✅ Found node: {node_name} ({node_type}) at lines {start_line}-{end_line}")
-                                break
-                            # 이름이 없는 노드 (module, script)의 경우 라인 범위만 사용
-                            elif item_type in ['module', 'script']:
-                                node_name = ''  # module/script는 이름이 없음
-                                node_type = item_type
-                                start_line = item.get('start_line')
-                                end_line = item.get('end_line')
-                                logger.info(f"✅ Found {node_type} at lines {start_line}-{end_line}")
-                                break
+                # 디스크 읽기/파싱은 블로킹이므로 스레드로 offload (캐시 히트 시엔 즉시 반환)
+                # start_line과 매칭되는 노드는 정렬 인덱스에 대한 이진 탐색으로 조회
+                item = await asyncio.to_thread(find_node_at_line, json_file_path, start_line)
+                if item is not None:
+                    item_type = item.get('type', 'function')
+
+                    # 이름이 없는 노드 (module, script)의 경우 라인 범위만 사용
+                    if item_type in ['module', 'script']:
+                        node_name = ''  # module/script는 이름이 없음
+                    # 이름이 있는 노드 (function, async_function, class)
+                    else:
+                        node_name = item.get('name', '')
+
+                    node_type = item_type
+                    # 실제 노드의 라인 범위로 업데이트
+                    start_line = item.get('start_line')
+                    end_line = item.get('end_line')
+                    logger.info(f"✅ Found node: {node_name} ({node_type}) at lines {start_line}-{end_line}")
 
                 if not node_name and not node_type:
                     # 기본값 설정
@@ -459,16 +554,10 @@ def get_code_history(
             node_name = ''
             node_type = 'script'
 
-    # Repository 접근 권한 확인
-    if not RepositoryService.check_user_permission(db, repo_id, str(current_user.id)):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to access this repository"
-        )
-
     try:
-        # Celery task 호출 (동기적으로 결과 대기)
-        task = celery_app.send_task(
+        # Celery task 호출 (캐시된 producer 연결 사용, 블로킹 publish는 스레드로 offload)
+        task = await asyncio.to_thread(
+            send_task_pooled,
             'rag_worker.tasks.get_code_history',
             kwargs={
                 'repo_id': repo_id,
@@ -485,16 +574,8 @@ def get_code_history(
         else:
             logger.info(f"📖 Getting history for {node_type} '{node_name}' in {file_path} (lines {start_line}-{end_line})")
 
-        # 결과 대기 (최대 30초)
-        result = task.get(timeout=30)
-
-        if not result.get("success"):
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=result.get("error", "Failed to get code history")
-            )
-
-        return result
+        # 결과를 기다리지 않고 task_id를 반환 (클라이언트가 폴링)
+        return {"task_id": task.id, "status": "pending"}
 
     except Exception as e:
         logger.error(f"❌ Failed to get code history: {str(e)}", exc_info=True)
@@ -502,3 +583,108 @@ def get_code_history(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get code history: {str(e)}"
         )
+
+
+@router.post("/code-history/batch", status_code=status.HTTP_202_ACCEPTED)
+async def get_code_history_batch(
+    payload: CodeHistoryBatchRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    여러 노드의 코드 히스토리 task를 한 번의 요청으로 디스패치
+
+    인증/권한 확인과 HTTP 왕복을 배치 전체가 공유하며, 반환된 task_id들을
+    기존 폴링 엔드포인트로 조회한다.
+    """
+    from ..core.celery import send_task_pooled
+
+    # Repository 접근 권한 확인 (배치 전체에 1회)
+    if not await RepositoryService.check_user_permission_async(db, payload.repo_id, str(current_user.id)):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to access this repository"
+        )
+
+    def _dispatch_batch():
+        """배치 전체를 전송 (블로킹 publish 루프이므로 스레드에서 수행)"""
+        tasks = []
+        for query in payload.queries:
+            task = send_task_pooled(
+                'rag_worker.tasks.get_code_history',
+                kwargs={
+                    'repo_id': payload.repo_id,
+                    'file_path': query.file_path,
+                    'node_name': query.node_name,
+                    'node_type': query.node_type,
+                    'start_line': None,
+                    'end_line': None
+                }
+            )
+            tasks.append({
+                "task_id": task.id,
+                "file_path": query.file_path,
+                "node_name": query.node_name,
+                "node_type": query.node_type
+            })
+        return tasks
+
+    return {"tasks": await asyncio.to_thread(_dispatch_batch)}
+
+
+@router.get("/code-history/{task_id}")
+async def get_code_history_result(
+    task_id: str,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=200),
+    current_user: User = Depends(get_current_active_user)
+):
+    """코드 히스토리 task 결과 폴링 (offset/limit으로 페이지 단위 전송)"""
+    from ..core.celery import celery_app
+    from celery.result import AsyncResult
+    import logging
+
+    logger = logging.getLogger(__name__)
+
+    def _fetch_result():
+        """result backend 조회 (동기 Redis I/O이므로 스레드에서 수행)"""
+        res = AsyncResult(task_id, app=celery_app)
+        if not res.ready():
+            return "pending", None
+        if res.failed():
+            return "failed", None
+        return "completed", res.result
+
+    state, result = await asyncio.to_thread(_fetch_result)
+
+    if state == "pending":
+        return {"task_id": task_id, "status": "pending"}
+
+    if state == "failed":
+        logger.error(f"❌ Code history task failed: {task_id}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Code history task failed"
+        )
+
+    if not result.get("success"):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=result.get("error", "Failed to get code history")
+        )
+
+    # 전체 히스토리를 한 번에 보내지 않고 요청된 구간만 전송
+    history = result.get("history") or []
+    total = len(history)
+    if limit is not None:
+        history = history[offset:offset + limit]
+    elif offset:
+        history = history[offset:]
+
+    return {
+        "task_id": task_id,
+        "status": "completed",
+        **result,
+        "history": history,
+        "total": total
+    }
@@ -3,11 +3,20 @@ Repository API 라우터
 단일 책임: Repository 관련 HTTP 요청 처리
 """
 
+import logging
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from uuid import UUID
+
+import orjson
+from celery import uuid as celery_uuid
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from ..core.celery import send_task_pooled
 from ..core.database import get_db
+from ..core.routing import ORJSONRoute
 from ..services.repository_service import RepositoryService, RepositoryMemberService
 from ..services.auth_service import get_current_active_user
 from ..schemas.repository import (
@@ -21,67 +30,97 @@ from ..schemas.repository import (
 )
 from ..models.user import User
 
-router = APIRouter(prefix="/api/repositories", tags=["repositories"])
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/repositories", tags=["repositories"], route_class=ORJSONRoute)
+
+# 본문 없는 응답은 직렬화 파이프라인을 생략하고 그대로 반환
+_NO_CONTENT = Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+def _serialize_member(member) -> dict:
+    """user 정보를 포함한 RepositoryMember 응답 dict 생성"""
+    return {
+        "id": member.id,
+        "repository_id": member.repository_id,
+        "user_id": member.user_id,
+        "role": member.role,
+        "joined_at": member.joined_at,
+        "username": member.user.username if member.user else None,
+        "email": member.user.email if member.user else None
+    }
+
+
+def _serialize_repo(repo, owner: str) -> dict:
+    """owner 정보를 포함한 Repository 응답 dict 생성 (핫 루프 공용)"""
+    return {
+        "id": repo.id,
+        "name": repo.name,
+        "description": repo.description,
+        "url": repo.url,
+        "is_public": repo.is_public,
+        "owner_id": repo.owner_id,
+        "owner": owner,
+        "stars": repo.stars or 0,
+        "language": repo.language,
+        "status": repo.status,
+        "vectordb_status": repo.vectordb_status,
+        "error_message": repo.error_message,
+        "collections_count": repo.collections_count or 0,
+        "file_count": repo.file_count or 0,
+        "created_at": repo.created_at,
+        "updated_at": repo.updated_at,
+        "last_sync": repo.last_sync
+    }
 
 
-@router.post("/", response_model=RepositoryResponse, status_code=status.HTTP_201_CREATED)
-def create_repository(
+@router.post("/", response_class=ORJSONResponse, responses={201: {"model": RepositoryResponse}}, status_code=status.HTTP_201_CREATED)
+async def create_repository(
     repo_data: RepositoryCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """새로운 Repository 생성"""
-    import logging
-    logger = logging.getLogger(__name__)
-
     try:
-        logger.info(f"Creating repository: name={repo_data.name}, url={repo_data.url}, owner={current_user.username}")
-        repository = RepositoryService.create_repository(db, repo_data, str(current_user.id))
+        repository = await run_in_threadpool(RepositoryService.create_repository, db, repo_data, current_user.id)
 
         # Celery Task 비동기 트리거 - Repository 처리 파이프라인
+        task_id = None
         try:
-            from ..core.celery import celery_app
-
-            # Redis 연결 확인
-            logger.info(f"Celery broker: {celery_app.conf.broker_url}")
-            logger.info(f"Triggering Celery task for repository: {repository.id}")
-
-            # Celery를 통해 task 전송 (기본 celery queue 사용)
-            task = celery_app.send_task(
+            # task_id를 먼저 합성하고 캐시된 producer 연결로 전송 (per-call 연결 획득 제거)
+            task_id = celery_uuid()
+            await run_in_threadpool(
+                send_task_pooled,
                 'rag_worker.tasks.process_repository_pipeline',
                 kwargs={
                     'repo_id': str(repository.id),
                     'git_url': repository.url,
                     'repo_name': repository.name
-                }
+                },
+                task_id=task_id
             )
-            logger.info(f"✅ Celery task sent to default queue. Task ID: {task.id}")
         except Exception as task_error:
             logger.error(f"❌ Failed to trigger Celery task: {str(task_error)}", exc_info=True)
             # Task 실패해도 repository는 생성되었으므로 계속 진행
 
-        # owner 정보를 포함한 응답 생성
-        repo_dict = {
-            "id": str(repository.id),
-            "name": repository.name,
-            "description": repository.description,
-            "url": repository.url,
-            "is_public": repository.is_public,
-            "owner_id": str(repository.owner_id),
-            "owner": current_user.username,
-            "stars": repository.stars or 0,
-            "language": repository.language,
-            "status": repository.status,
-            "vectordb_status": repository.vectordb_status,
-            "error_message": repository.error_message,
-            "collections_count": repository.collections_count or 0,
-            "file_count": repository.file_count or 0,
-            "created_at": repository.created_at,
-            "updated_at": repository.updated_at,
-            "last_sync": repository.last_sync
-        }
+        # 요청당 한 건의 구조화 로그로 축약 (INFO 필터 시 extra 구성도 생략)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "repository_created",
+                extra={
+                    "repo_id": str(repository.id),
+                    "repo_name": repository.name,
+                    "repo_url": repository.url,
+                    "repo_owner": current_user.username,
+                    "celery_task_id": task_id
+                }
+            )
 
-        return repo_dict
+        # 검증/jsonable_encoder를 거치지 않고 orjson으로 바로 직렬화
+        return ORJSONResponse(
+            content=_serialize_repo(repository, current_user.username),
+            status_code=status.HTTP_201_CREATED
+        )
     except Exception as e:
         logger.error(f"Failed to create repository: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -90,139 +129,157 @@ def create_repository(
         )
 
 
-@router.get("/", response_model=List[RepositoryResponse])
-def get_repositories(
+@router.get("/", response_class=ORJSONResponse, responses={200: {"model": List[RepositoryResponse]}})
+async def get_repositories(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """현재 사용자가 접근 가능한 모든 Repository 조회"""
-    repositories = RepositoryService.get_user_repositories(db, str(current_user.id))
-
-    # owner 정보를 포함한 응답 생성
-    result = []
-    for repo in repositories:
-        repo_dict = {
-            "id": str(repo.id),
-            "name": repo.name,
-            "description": repo.description,
-            "url": repo.url,
-            "is_public": repo.is_public,
-            "owner_id": str(repo.owner_id),
-            "owner": repo.owner.username if repo.owner else "Unknown",
-            "stars": repo.stars or 0,
-            "language": repo.language,
-            "status": repo.status,
-            "vectordb_status": repo.vectordb_status,
-            "error_message": repo.error_message,
-            "collections_count": repo.collections_count or 0,
-            "file_count": repo.file_count or 0,
-            "created_at": repo.created_at,
-            "updated_at": repo.updated_at,
-            "last_sync": repo.last_sync
-        }
-        result.append(repo_dict)
+    repositories = await run_in_threadpool(RepositoryService.get_user_repositories, db, current_user.id)
+
+    # 행 단위로 직렬화하여 스트리밍 (큰 목록에서 전체 버퍼 생성 없이 TTFB 단축)
+    def repo_stream():
+        yield b"["
+        for i, repo in enumerate(repositories):
+            repo_dict = _serialize_repo(
+                repo, repo.owner.username if repo.owner else "Unknown"
+            )
+            yield (b"," if i else b"") + orjson.dumps(repo_dict)
+        yield b"]"
 
-    return result
+    return StreamingResponse(repo_stream(), media_type="application/json")
 
 
-@router.get("/{repo_id}", response_model=RepositoryResponse)
-def get_repository(
-    repo_id: str,
+@router.get("/status")
+async def get_repository_statuses(
+    ids: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    여러 Repository의 처리 상태를 한 번의 요청으로 조회 (폴링 배치용)
+
+    쉼표로 구분된 id 목록을 받아 접근 가능한 것만 반환한다.
+    ("/{repo_id}" 경로보다 먼저 등록되어야 "status"가 id로 매칭되지 않는다)
+    """
+    statuses = []
+    for repo_id in ids.split(",")[:50]:
+        repo_id = repo_id.strip()
+        if not repo_id:
+            continue
+
+        try:
+            permitted = await run_in_threadpool(
+                RepositoryService.check_user_permission, db, repo_id, current_user.id
+            )
+        except ValueError:
+            # 잘못된 UUID는 조용히 제외
+            continue
+
+        if not permitted:
+            continue
+
+        row = await run_in_threadpool(RepositoryService.get_repository_status, db, repo_id)
+        if row is None:
+            continue
+
+        statuses.append({
+            "repo_id": row.id,
+            "status": row.status,
+            "vectordb_status": row.vectordb_status,
+            "error_message": row.error_message,
+            "file_count": row.file_count,
+            "last_sync": row.last_sync
+        })
+
+    return {"statuses": statuses}
+
+
+@router.get("/{repo_id}", response_class=ORJSONResponse, responses={200: {"model": RepositoryResponse}})
+async def get_repository(
+    repo_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """특정 Repository 조회"""
-    if not RepositoryService.check_user_permission(db, repo_id, str(current_user.id)):
+    # 조회 + 권한 확인을 한 번의 쿼리로 수행
+    repository, denial = await run_in_threadpool(
+        RepositoryService.get_repository_if_permitted, db, repo_id, current_user.id
+    )
+    if denial == "not_found":
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Repository not found"
+        )
+    if denial == "forbidden":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to access this repository"
         )
 
-    repository = RepositoryService.get_repository(db, repo_id)
-    if not repository:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Repository not found"
+    # owner 정보를 포함한 응답 생성 후 orjson으로 바로 직렬화
+    return ORJSONResponse(
+        content=_serialize_repo(
+            repository,
+            repository.owner.username if repository.owner else "Unknown"
         )
-
-    # owner 정보를 포함한 응답 생성
-    repo_dict = {
-        "id": str(repository.id),
-        "name": repository.name,
-        "description": repository.description,
-        "url": repository.url,
-        "is_public": repository.is_public,
-        "owner_id": str(repository.owner_id),
-        "owner": repository.owner.username if repository.owner else "Unknown",
-        "stars": repository.stars or 0,
-        "language": repository.language,
-        "status": repository.status,
-        "vectordb_status": repository.vectordb_status,
-        "error_message": repository.error_message,
-        "collections_count": repository.collections_count or 0,
-        "file_count": repository.file_count or 0,
-        "created_at": repository.created_at,
-        "updated_at": repository.updated_at,
-        "last_sync": repository.last_sync
-    }
-
-    return repo_dict
+    )
 
 
 @router.get("/{repo_id}/status")
-def get_repository_status(
-    repo_id: str,
+async def get_repository_status(
+    repo_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Repository 처리 상태 조회"""
-    if not RepositoryService.check_user_permission(db, repo_id, str(current_user.id)):
+    # 권한 확인은 캐시 경유, 상태는 컬럼만 선택하는 경량 쿼리로 조회 (폴링 경로)
+    if not await run_in_threadpool(
+        RepositoryService.check_user_permission, db, repo_id, current_user.id
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to access this repository"
         )
 
-    repository = RepositoryService.get_repository(db, repo_id)
-    if not repository:
+    row = await run_in_threadpool(RepositoryService.get_repository_status, db, repo_id)
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Repository not found"
         )
 
     return {
-        "repo_id": str(repository.id),
-        "status": repository.status,
-        "vectordb_status": repository.vectordb_status,
-        "error_message": repository.error_message,
-        "file_count": repository.file_count,
-        "last_sync": repository.last_sync
+        "repo_id": row.id,
+        "status": row.status,
+        "vectordb_status": row.vectordb_status,
+        "error_message": row.error_message,
+        "file_count": row.file_count,
+        "last_sync": row.last_sync
     }
 
 
 @router.post("/{repo_id}/sync")
-def sync_repository(
-    repo_id: str,
+async def sync_repository(
+    repo_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Repository를 원격 저장소와 동기화하여 최신 변경사항 반영"""
-    import logging
-    logger = logging.getLogger(__name__)
-
-    # 권한 확인
-    if not RepositoryService.check_user_permission(db, repo_id, str(current_user.id), "admin"):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to sync this repository"
-        )
-
-    # Repository 조회
-    repository = RepositoryService.get_repository(db, repo_id)
-    if not repository:
+    # 조회 + 권한 확인을 한 번의 쿼리로 수행
+    repository, denial = await run_in_threadpool(
+        RepositoryService.get_repository_if_permitted, db, repo_id, current_user.id, "admin"
+    )
+    if denial == "not_found":
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Repository not found"
         )
+    if denial == "forbidden":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to sync this repository"
+        )
 
     # 이미 동기화 중인지 확인
     if repository.status in ["syncing", "updating", "pending"]:
@@ -232,20 +289,15 @@ def sync_repository(
         )
 
     try:
-        logger.info(f"Starting sync for repository: {repository.name} (ID: {repo_id})")
-
         # Celery Task 비동기 트리거 - Repository 업데이트 파이프라인
         try:
-            from ..core.celery import celery_app
-
-            logger.info(f"Celery broker: {celery_app.conf.broker_url}")
-            logger.info(f"Triggering update_repository_pipeline task for repository: {repository.id}")
+            # 생성 시점에 저장된 collection_name 사용 (구버전 행은 재계산 폴백)
+            collection_name = repository.collection_name or f"repo_{str(repository.id).replace('-', '_')}"
 
-            # Collection name 생성 (repo_id에서 하이픈 제거)
-            collection_name = f"repo_{str(repository.id).replace('-', '_')}"
-
-            # Celery를 통해 update task 전송
-            task = celery_app.send_task(
+            # task_id를 먼저 합성하고 캐시된 producer 연결로 전송 (per-call 연결 획득 제거)
+            task_id = celery_uuid()
+            await run_in_threadpool(
+                send_task_pooled,
                 'rag_worker.tasks.update_repository_pipeline',
                 kwargs={
                     'repo_id': str(repository.id),
@@ -253,9 +305,21 @@ def sync_repository(
                     'collection_name': collection_name,
                     'save_json': True,
                     'model_key': 'sfr-code-400m'  # 코드 검색 최적화 모델
-                }
+                },
+                task_id=task_id
             )
-            logger.info(f"✅ Celery update task sent. Task ID: {task.id}")
+
+            # 요청당 한 건의 구조화 로그로 축약 (INFO 필터 시 extra 구성도 생략)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "repository_sync_started",
+                    extra={
+                        "repo_id": str(repository.id),
+                        "repo_name": repository.name,
+                        "collection_name": collection_name,
+                        "celery_task_id": task_id
+                    }
+                )
 
         except Exception as task_error:
             logger.error(f"❌ Failed to trigger Celery update task: {str(task_error)}", exc_info=True)
@@ -267,7 +331,7 @@ def sync_repository(
         return {
             "success": True,
             "message": f"Repository sync started for '{repository.name}'",
-            "task_id": task.id,
+            "task_id": task_id,
             "repo_id": str(repository.id)
         }
 
@@ -281,177 +345,170 @@ def sync_repository(
         )
 
 
-@router.put("/{repo_id}", response_model=RepositoryResponse)
-def update_repository(
-    repo_id: str,
+@router.put("/{repo_id}", response_class=ORJSONResponse, responses={200: {"model": RepositoryResponse}})
+async def update_repository(
+    repo_id: UUID,
     repo_data: RepositoryUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Repository 정보 업데이트"""
-    if not RepositoryService.check_user_permission(db, repo_id, str(current_user.id), "admin"):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to update this repository"
-        )
-
-    repository = RepositoryService.update_repository(db, repo_id, repo_data)
-    if not repository:
+    # 조회 + 권한 확인을 한 번의 쿼리로 수행
+    repository, denial = await run_in_threadpool(
+        RepositoryService.get_repository_if_permitted, db, repo_id, current_user.id, "admin"
+    )
+    if denial == "not_found":
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Repository not found"
         )
+    if denial == "forbidden":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to update this repository"
+        )
 
-    # owner 정보를 포함한 응답 생성
-    repo_dict = {
-        "id": str(repository.id),
-        "name": repository.name,
-        "description": repository.description,
-        "url": repository.url,
-        "is_public": repository.is_public,
-        "owner_id": str(repository.owner_id),
-        "owner": repository.owner.username if repository.owner else "Unknown",
-        "stars": repository.stars or 0,
-        "language": repository.language,
-        "status": repository.status,
-        "vectordb_status": repository.vectordb_status,
-        "error_message": repository.error_message,
-        "collections_count": repository.collections_count or 0,
-        "file_count": repository.file_count or 0,
-        "created_at": repository.created_at,
-        "updated_at": repository.updated_at,
-        "last_sync": repository.last_sync
-    }
+    repository = await run_in_threadpool(RepositoryService.update_repository, db, repo_id, repo_data)
 
-    return repo_dict
+    # owner 정보를 포함한 응답 생성 후 orjson으로 바로 직렬화
+    return ORJSONResponse(
+        content=_serialize_repo(
+            repository,
+            repository.owner.username if repository.owner else "Unknown"
+        )
+    )
 
 
 @router.delete("/{repo_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_repository(
-    repo_id: str,
+async def delete_repository(
+    repo_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Repository 삭제 (소유자만 가능)"""
-    repository = RepositoryService.get_repository(db, repo_id)
+    repository = await run_in_threadpool(RepositoryService.get_repository, db, repo_id)
     if not repository:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Repository not found"
         )
     
-    if str(repository.owner_id) != str(current_user.id):
+    if repository.owner_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only the owner can delete this repository"
         )
     
-    success = RepositoryService.delete_repository(db, repo_id)
+    success = await run_in_threadpool(RepositoryService.delete_repository, db, repo_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Failed to delete repository"
         )
 
+    return _NO_CONTENT
 
-@router.get("/{repo_id}/members", response_model=List[RepositoryMemberResponse])
-def get_repository_members(
-    repo_id: str,
+
+@router.get("/{repo_id}/members", response_class=ORJSONResponse, responses={200: {"model": List[RepositoryMemberResponse]}})
+async def get_repository_members(
+    repo_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Repository의 모든 멤버 조회"""
-    if not RepositoryService.check_user_permission(db, repo_id, str(current_user.id)):
+    # 조회 + 권한 확인을 한 번의 쿼리로 수행
+    repository, denial = await run_in_threadpool(
+        RepositoryService.get_repository_if_permitted, db, repo_id, current_user.id
+    )
+    if denial == "not_found":
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Repository not found"
+        )
+    if denial == "forbidden":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to view members"
         )
     
-    members = RepositoryMemberService.get_repository_members(db, repo_id)
-    
-    result = []
-    for member in members:
-        member_dict = {
-            "id": str(member.id),
-            "repository_id": str(member.repository_id),
-            "user_id": str(member.user_id),
-            "role": member.role,
-            "joined_at": member.joined_at,
-            "username": member.user.username if member.user else None,
-            "email": member.user.email if member.user else None
-        }
-        result.append(member_dict)
-    
-    return result
+    members = await run_in_threadpool(RepositoryMemberService.get_repository_members, db, repo_id)
 
+    # DB에서 방금 구성한 dict이므로 재검증 없이 orjson으로 바로 직렬화
+    return ORJSONResponse(content=[_serialize_member(member) for member in members])
 
-@router.post("/{repo_id}/members", response_model=RepositoryMemberResponse, status_code=status.HTTP_201_CREATED)
-def add_repository_member(
-    repo_id: str,
+
+@router.post("/{repo_id}/members", response_class=ORJSONResponse, responses={201: {"model": RepositoryMemberResponse}}, status_code=status.HTTP_201_CREATED)
+async def add_repository_member(
+    repo_id: UUID,
     member_data: RepositoryMemberCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Repository에 멤버 추가"""
-    if not RepositoryService.check_user_permission(db, repo_id, str(current_user.id), "admin"):
+    if not await run_in_threadpool(RepositoryService.check_user_permission, db, repo_id, current_user.id, "admin"):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to add members"
         )
     
-    existing_member = RepositoryMemberService.get_member_by_user(db, repo_id, member_data.user_id)
+    existing_member = await run_in_threadpool(RepositoryMemberService.get_member_by_user, db, repo_id, member_data.user_id)
     if existing_member:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User is already a member of this repository"
         )
     
-    member = RepositoryMemberService.add_member(db, repo_id, member_data)
-    return member
+    member = await run_in_threadpool(RepositoryMemberService.add_member, db, repo_id, member_data)
+    return ORJSONResponse(
+        content=await run_in_threadpool(_serialize_member, member),
+        status_code=status.HTTP_201_CREATED
+    )
 
 
-@router.put("/{repo_id}/members/{member_id}", response_model=RepositoryMemberResponse)
-def update_repository_member_role(
-    repo_id: str,
-    member_id: str,
+@router.put("/{repo_id}/members/{member_id}", response_class=ORJSONResponse, responses={200: {"model": RepositoryMemberResponse}})
+async def update_repository_member_role(
+    repo_id: UUID,
+    member_id: UUID,
     role_data: RepositoryMemberUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Repository 멤버 역할 업데이트"""
-    if not RepositoryService.check_user_permission(db, repo_id, str(current_user.id), "admin"):
+    if not await run_in_threadpool(RepositoryService.check_user_permission, db, repo_id, current_user.id, "admin"):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to update member roles"
         )
 
-    member = RepositoryMemberService.update_member_role(db, member_id, role_data)
+    member = await run_in_threadpool(RepositoryMemberService.update_member_role, db, member_id, role_data)
     if not member:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Member not found"
         )
 
-    return member
+    return ORJSONResponse(content=await run_in_threadpool(_serialize_member, member))
 
 
 @router.delete("/{repo_id}/members/{member_id}", status_code=status.HTTP_204_NO_CONTENT)
-def remove_repository_member(
-    repo_id: str,
-    member_id: str,
+async def remove_repository_member(
+    repo_id: UUID,
+    member_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Repository에서 멤버 제거"""
-    if not RepositoryService.check_user_permission(db, repo_id, str(current_user.id), "admin"):
+    if not await run_in_threadpool(RepositoryService.check_user_permission, db, repo_id, current_user.id, "admin"):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to remove members"
         )
 
-    success = RepositoryMemberService.remove_member(db, member_id)
+    success = await run_in_threadpool(RepositoryMemberService.remove_member, db, member_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Member not found"
         )
+
+    return _NO_CONTENT
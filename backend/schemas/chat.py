@@ -5,7 +5,14 @@ Chat 스키마 정의
 
 from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel, Field
+from uuid import UUID
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_validator,
+    model_validator
+)
 
 
 # ChatRoom Schemas
@@ -26,17 +33,22 @@ class ChatRoomUpdate(BaseModel):
 
 
 class ChatRoomResponse(ChatRoomBase):
-    """ChatRoom 응답 스키마"""
-    id: str
-    repository_id: str
-    created_by: str
+    """ChatRoom 응답 스키마 (ORM 객체에서 직접 검증)"""
+    model_config = ConfigDict(from_attributes=True)
+
+    # UUID 그대로 두면 pydantic-core/orjson이 문자열 변환을 처리한다
+    id: UUID
+    repository_id: UUID
+    created_by: UUID
     message_count: int = 0
     last_message: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    @field_validator("message_count", mode="before")
+    @classmethod
+    def _default_message_count(cls, value: Optional[int]) -> int:
+        return value or 0
 
 
 # ChatMessage Schemas
@@ -53,14 +65,58 @@ class ChatMessageCreate(ChatMessageBase):
     sources: Optional[str] = None
 
 
+# CodeHistory Schemas
+
+class CodeHistoryRequest(BaseModel):
+    """코드 히스토리 조회 요청 스키마"""
+    repo_id: str
+    file_path: str
+    line_info: str = ""  # "150-200" 형식
+    node_name: Optional[str] = None
+    node_type: Optional[str] = None
+    track_full_file: bool = True  # True면 파일 전체 추적, False면 특정 노드 추적
+    start_line: Optional[int] = None
+    end_line: Optional[int] = None
+
+    @model_validator(mode="after")
+    def _parse_line_info(self) -> "CodeHistoryRequest":
+        """line_info("150-200" 또는 "150")에서 start_line/end_line 계산"""
+        if self.start_line is None and self.line_info:
+            try:
+                if '-' in self.line_info:
+                    parts = self.line_info.split('-')
+                    self.start_line = int(parts[0])
+                    self.end_line = int(parts[1]) if len(parts) > 1 else self.start_line
+                else:
+                    self.start_line = int(self.line_info)
+                    self.end_line = self.start_line
+            except ValueError:
+                # 잘못된 형식은 라인 정보 없음으로 처리 (기존 동작 유지)
+                pass
+        return self
+
+
+class CodeHistoryBatchQuery(BaseModel):
+    """배치 코드 히스토리 조회의 개별 질의"""
+    file_path: str
+    node_name: Optional[str] = None
+    node_type: Optional[str] = None
+
+
+class CodeHistoryBatchRequest(BaseModel):
+    """배치 코드 히스토리 조회 요청 스키마"""
+    repo_id: str
+    queries: List[CodeHistoryBatchQuery] = Field(..., min_length=1, max_length=10)
+
+
 class ChatMessageResponse(ChatMessageBase):
-    """ChatMessage 응답 스키마"""
-    id: str
-    chat_room_id: str
-    sender_id: Optional[str] = None
+    """ChatMessage 응답 스키마 (ORM 객체에서 직접 검증)"""
+    model_config = ConfigDict(from_attributes=True)
+
+    # UUID 그대로 두면 pydantic-core/orjson이 문자열 변환을 처리한다
+    id: UUID
+    chat_room_id: UUID
+    sender_id: Optional[UUID] = None
     sender_type: str
     sources: Optional[str] = None
     created_at: datetime
-
-    class Config:
-        from_attributes = True
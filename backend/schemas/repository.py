@@ -5,7 +5,7 @@ Repository 스키마 정의
 
 from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 # Repository Schemas
 
@@ -45,8 +45,7 @@ class RepositoryResponse(RepositoryBase):
     updated_at: Optional[datetime] = None
     last_sync: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Repository Member Schemas
@@ -75,13 +74,11 @@ class RepositoryMemberResponse(RepositoryMemberBase):
     username: Optional[str] = None
     email: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RepositoryWithMembers(RepositoryResponse):
     """멤버 정보를 포함한 Repository 응답"""
     members: List[RepositoryMemberResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
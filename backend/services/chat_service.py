@@ -3,12 +3,15 @@ Chat 서비스
 단일 책임: Chat 비즈니스 로직 처리
 """
 
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple
+from sqlalchemy import and_, exists, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from datetime import datetime
 import uuid
 
 from ..models.chat import ChatRoom, ChatMessage
+from ..models.repository import Repository, RepositoryMember
 from ..schemas.chat import (
     ChatRoomCreate,
     ChatRoomUpdate,
@@ -20,8 +23,8 @@ class ChatRoomService:
     """ChatRoom 관련 비즈니스 로직 처리"""
 
     @staticmethod
-    def create_chat_room(
-        db: Session,
+    async def create_chat_room(
+        db: AsyncSession,
         room_data: ChatRoomCreate,
         user_id: str
     ) -> ChatRoom:
@@ -45,31 +48,74 @@ class ChatRoomService:
         )
 
         db.add(db_chat_room)
-        db.commit()
-        db.refresh(db_chat_room)
+        await db.commit()
+        await db.refresh(db_chat_room)
 
         return db_chat_room
 
     @staticmethod
-    def get_chat_room(db: Session, room_id: str) -> Optional[ChatRoom]:
+    async def get_chat_room(db: AsyncSession, room_id: str) -> Optional[ChatRoom]:
         """ChatRoom 조회"""
-        return db.query(ChatRoom).filter(ChatRoom.id == uuid.UUID(room_id)).first()
+        result = await db.execute(
+            select(ChatRoom).where(ChatRoom.id == uuid.UUID(room_id))
+        )
+        return result.scalars().first()
 
     @staticmethod
-    def get_repository_chat_rooms(db: Session, repo_id: str) -> List[ChatRoom]:
+    async def get_chat_room_with_access(
+        db: AsyncSession,
+        room_id: str,
+        user_id: str
+    ) -> Tuple[Optional[ChatRoom], bool]:
+        """
+        ChatRoom 존재 확인과 접근 권한 확인을 한 번의 쿼리로 수행
+
+        Returns:
+            (ChatRoom 또는 None, 접근 권한 여부)
+        """
+        user_uuid = uuid.UUID(user_id)
+        has_access = or_(
+            exists().where(
+                and_(
+                    Repository.id == ChatRoom.repository_id,
+                    Repository.owner_id == user_uuid
+                )
+            ),
+            exists().where(
+                and_(
+                    RepositoryMember.repository_id == ChatRoom.repository_id,
+                    RepositoryMember.user_id == user_uuid
+                )
+            )
+        ).label("has_access")
+
+        result = await db.execute(
+            select(ChatRoom, has_access).where(ChatRoom.id == uuid.UUID(room_id))
+        )
+        row = result.first()
+        if row is None:
+            return None, False
+        return row[0], bool(row[1])
+
+    @staticmethod
+    async def get_repository_chat_rooms(db: AsyncSession, repo_id: str) -> List[ChatRoom]:
         """Repository의 모든 ChatRoom 조회"""
-        return db.query(ChatRoom).filter(
-            ChatRoom.repository_id == uuid.UUID(repo_id)
-        ).order_by(ChatRoom.updated_at.desc()).all()
+        # 응답 스키마는 컬럼만 읽으므로 행당 lazy load가 새지 않도록 차단
+        result = await db.execute(
+            select(ChatRoom).where(
+                ChatRoom.repository_id == uuid.UUID(repo_id)
+            ).options(raiseload("*")).order_by(ChatRoom.updated_at.desc())
+        )
+        return list(result.scalars().all())
 
     @staticmethod
-    def update_chat_room(
-        db: Session,
+    async def update_chat_room(
+        db: AsyncSession,
         room_id: str,
         room_data: ChatRoomUpdate
     ) -> Optional[ChatRoom]:
         """ChatRoom 업데이트"""
-        db_chat_room = ChatRoomService.get_chat_room(db, room_id)
+        db_chat_room = await ChatRoomService.get_chat_room(db, room_id)
         if not db_chat_room:
             return None
 
@@ -78,48 +124,38 @@ class ChatRoomService:
             setattr(db_chat_room, field, value)
 
         db_chat_room.updated_at = datetime.now()
-        db.commit()
-        db.refresh(db_chat_room)
+        await db.commit()
+        await db.refresh(db_chat_room)
 
         return db_chat_room
 
     @staticmethod
-    def delete_chat_room(db: Session, room_id: str) -> bool:
+    async def delete_chat_room(db: AsyncSession, room_id: str) -> bool:
         """ChatRoom 삭제"""
-        db_chat_room = ChatRoomService.get_chat_room(db, room_id)
+        db_chat_room = await ChatRoomService.get_chat_room(db, room_id)
         if not db_chat_room:
             return False
 
-        db.delete(db_chat_room)
-        db.commit()
+        await db.delete(db_chat_room)
+        await db.commit()
         return True
 
-    @staticmethod
-    def update_last_message(
-        db: Session,
-        room_id: str,
-        message_content: str
-    ) -> Optional[ChatRoom]:
-        """ChatRoom의 마지막 메시지 업데이트"""
-        db_chat_room = ChatRoomService.get_chat_room(db, room_id)
-        if not db_chat_room:
-            return None
-
-        db_chat_room.last_message = message_content
-        db_chat_room.message_count = (db_chat_room.message_count or 0) + 1
-        db_chat_room.updated_at = datetime.now()
-        db.commit()
-        db.refresh(db_chat_room)
-
-        return db_chat_room
-
-
 class ChatMessageService:
     """ChatMessage 관련 비즈니스 로직 처리"""
 
     @staticmethod
-    def create_message(
-        db: Session,
+    def _parse_anchor_id(value: Optional[str]) -> Optional[uuid.UUID]:
+        """사용자 입력 앵커 id 파싱 (잘못된 형식은 앵커 없음으로 처리)"""
+        if not value:
+            return None
+        try:
+            return uuid.UUID(value)
+        except ValueError:
+            return None
+
+    @staticmethod
+    async def create_message(
+        db: AsyncSession,
         message_data: ChatMessageCreate,
         user_id: Optional[str] = None
     ) -> ChatMessage:
@@ -134,49 +170,105 @@ class ChatMessageService:
         Returns:
             생성된 ChatMessage 객체
         """
-        db_message = ChatMessage(
-            id=uuid.uuid4(),
-            chat_room_id=uuid.UUID(message_data.chat_room_id),
-            sender_id=uuid.UUID(user_id) if user_id else None,
-            sender_type=message_data.sender_type,
-            content=message_data.content,
-            sources=message_data.sources
+        room_uuid = uuid.UUID(message_data.chat_room_id)
+
+        # RETURNING으로 서버 기본값(created_at)까지 한 번의 왕복으로 조회
+        result = await db.execute(
+            insert(ChatMessage).values(
+                id=uuid.uuid4(),
+                chat_room_id=room_uuid,
+                sender_id=uuid.UUID(user_id) if user_id else None,
+                sender_type=message_data.sender_type,
+                content=message_data.content,
+                sources=message_data.sources
+            ).returning(ChatMessage)
         )
-
-        db.add(db_message)
-        db.commit()
-        db.refresh(db_message)
-
-        # ChatRoom의 마지막 메시지 업데이트
-        ChatRoomService.update_last_message(
-            db,
-            message_data.chat_room_id,
-            message_data.content
+        db_message = result.scalars().one()
+
+        # ChatRoom의 마지막 메시지 업데이트 (SELECT 없이 단일 UPDATE)
+        await db.execute(
+            update(ChatRoom).where(ChatRoom.id == room_uuid).values(
+                last_message=message_data.content,
+                message_count=func.coalesce(ChatRoom.message_count, 0) + 1,
+                updated_at=datetime.now()
+            )
         )
+        await db.commit()
 
         return db_message
 
     @staticmethod
-    def get_message(db: Session, message_id: str) -> Optional[ChatMessage]:
+    async def get_message(db: AsyncSession, message_id: str) -> Optional[ChatMessage]:
         """ChatMessage 조회"""
-        return db.query(ChatMessage).filter(
-            ChatMessage.id == uuid.UUID(message_id)
-        ).first()
+        result = await db.execute(
+            select(ChatMessage).where(ChatMessage.id == uuid.UUID(message_id))
+        )
+        return result.scalars().first()
+
+    @staticmethod
+    async def get_chat_room_messages(
+        db: AsyncSession,
+        room_id: str,
+        limit: int = 50,
+        before_id: Optional[str] = None
+    ) -> List[ChatMessage]:
+        """
+        ChatRoom의 메시지 조회 (키셋 페이지네이션)
+
+        최신 메시지부터 limit개를 DB에서 잘라 가져온 뒤 시간 오름차순으로
+        반환한다. before_id가 주어지면 해당 메시지보다 오래된 페이지를
+        반환한다 (OFFSET 없이 인덱스 탐색만 사용).
+        """
+        # 응답 스키마는 컬럼만 읽으므로 행당 lazy load가 새지 않도록 차단
+        stmt = select(ChatMessage).where(
+            ChatMessage.chat_room_id == uuid.UUID(room_id)
+        ).options(raiseload("*"))
+
+        anchor_id = ChatMessageService._parse_anchor_id(before_id)
+        if anchor_id is not None:
+            # id는 랜덤 UUID라 정렬 기준이 될 수 없으므로 created_at을 앵커로 사용
+            anchor = (await db.execute(
+                select(ChatMessage.created_at).where(ChatMessage.id == anchor_id)
+            )).scalar_one_or_none()
+            if anchor is not None:
+                stmt = stmt.where(ChatMessage.created_at < anchor)
+
+        result = await db.execute(
+            stmt.order_by(ChatMessage.created_at.desc()).limit(limit)
+        )
+        messages = list(result.scalars().all())
+        messages.reverse()  # 응답은 시간 오름차순 유지
+        return messages
 
     @staticmethod
-    def get_chat_room_messages(db: Session, room_id: str) -> List[ChatMessage]:
-        """ChatRoom의 모든 메시지 조회"""
-        return db.query(ChatMessage).filter(
+    async def get_messages_after(
+        db: AsyncSession,
+        room_id: str,
+        after_id: Optional[str] = None
+    ) -> List[ChatMessage]:
+        """특정 메시지 이후에 도착한 메시지 조회 (롱폴링용)"""
+        stmt = select(ChatMessage).where(
             ChatMessage.chat_room_id == uuid.UUID(room_id)
-        ).order_by(ChatMessage.created_at.asc()).all()
+        ).options(raiseload("*"))
+
+        anchor_id = ChatMessageService._parse_anchor_id(after_id)
+        if anchor_id is not None:
+            anchor = (await db.execute(
+                select(ChatMessage.created_at).where(ChatMessage.id == anchor_id)
+            )).scalar_one_or_none()
+            if anchor is not None:
+                stmt = stmt.where(ChatMessage.created_at > anchor)
+
+        result = await db.execute(stmt.order_by(ChatMessage.created_at.asc()))
+        return list(result.scalars().all())
 
     @staticmethod
-    def delete_message(db: Session, message_id: str) -> bool:
+    async def delete_message(db: AsyncSession, message_id: str) -> bool:
         """ChatMessage 삭제"""
-        db_message = ChatMessageService.get_message(db, message_id)
+        db_message = await ChatMessageService.get_message(db, message_id)
         if not db_message:
             return False
 
-        db.delete(db_message)
-        db.commit()
+        await db.delete(db_message)
+        await db.commit()
         return True
@@ -3,12 +3,20 @@ Repository 서비스
 단일 책임: Repository 비즈니스 로직 처리
 """
 
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from typing import List, Optional, Tuple
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, select
 from datetime import datetime
 import uuid
 
+from ..core.permission_cache import (
+    get_cached_permission,
+    get_cached_permission_sync,
+    invalidate_repository_permissions,
+    set_cached_permission,
+    set_cached_permission_sync
+)
 from ..models.repository import Repository, RepositoryMember
 from ..models.user import User
 from ..schemas.repository import (
@@ -20,6 +28,11 @@ from ..schemas.repository import (
 )
 
 
+def _as_uuid(value) -> uuid.UUID:
+    """str 또는 UUID 입력을 UUID로 정규화 (중복 변환 제거)"""
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(value)
+
+
 class RepositoryService:
     """Repository 관련 비즈니스 로직 처리"""
 
@@ -36,15 +49,18 @@ class RepositoryService:
         Returns:
             생성된 Repository 객체
         """
+        repo_uuid = uuid.uuid4()
         db_repo = Repository(
-            id=uuid.uuid4(),
+            id=repo_uuid,
             name=repo_data.name,
             description=repo_data.description,
             url=repo_data.url,
-            owner_id=uuid.UUID(owner_id),
+            owner_id=_as_uuid(owner_id),
             is_public=repo_data.is_public,
             status="pending",  # 초기 상태는 pending
-            vectordb_status="pending"
+            vectordb_status="pending",
+            # 파생 식별자를 생성 시점에 한 번만 계산 (라우터/워커 재계산 제거)
+            collection_name=f"repo_{str(repo_uuid).replace('-', '_')}"
         )
         
         db.add(db_repo)
@@ -55,8 +71,10 @@ class RepositoryService:
 
     @staticmethod
     def get_repository(db: Session, repo_id: str) -> Optional[Repository]:
-        """Repository 조회"""
-        return db.query(Repository).filter(Repository.id == uuid.UUID(repo_id)).first()
+        """Repository 조회 (응답 생성에 쓰이는 owner는 조인으로 선로딩)"""
+        return db.query(Repository).filter(
+            Repository.id == _as_uuid(repo_id)
+        ).options(joinedload(Repository.owner)).first()
 
     @staticmethod
     def get_user_repositories(db: Session, user_id: str) -> List[Repository]:
@@ -64,20 +82,31 @@ class RepositoryService:
         사용자가 접근 가능한 모든 Repository 조회
         (소유한 Repository + 멤버로 참여한 Repository)
         """
-        user_uuid = uuid.UUID(user_id)
+        user_uuid = _as_uuid(user_id)
         
-        # 소유한 Repository 또는 멤버로 참여한 Repository
-        repositories = db.query(Repository).outerjoin(
-            RepositoryMember,
-            Repository.id == RepositoryMember.repository_id
-        ).filter(
-            or_(
-                Repository.owner_id == user_uuid,
-                RepositoryMember.user_id == user_uuid
+        # 소유한 Repository 또는 멤버로 참여한 Repository (SQLAlchemy 2.0 스타일)
+        # owner는 단일 행이므로 조인, members 컬렉션은 IN 배치 쿼리로 선로딩
+        stmt = (
+            select(Repository)
+            .outerjoin(
+                RepositoryMember,
+                Repository.id == RepositoryMember.repository_id
             )
-        ).distinct().all()
-        
-        return repositories
+            .where(
+                or_(
+                    Repository.owner_id == user_uuid,
+                    RepositoryMember.user_id == user_uuid
+                )
+            )
+            .options(
+                joinedload(Repository.owner),
+                selectinload(Repository.members).joinedload(RepositoryMember.user),
+                raiseload("*")
+            )
+            .distinct()
+        )
+
+        return list(db.execute(stmt).unique().scalars().all())
 
     @staticmethod
     def update_repository(
@@ -109,8 +138,28 @@ class RepositoryService:
         
         db.delete(db_repo)
         db.commit()
+        invalidate_repository_permissions(repo_id)
         return True
 
+    @staticmethod
+    def get_repository_status(db: Session, repo_id: str):
+        """
+        상태 폴링용 경량 조회
+
+        ORM 인스턴스 생성 없이 상태 관련 컬럼만 Row로 반환한다
+        (없으면 None).
+        """
+        return db.execute(
+            select(
+                Repository.id,
+                Repository.status,
+                Repository.vectordb_status,
+                Repository.error_message,
+                Repository.file_count,
+                Repository.last_sync
+            ).where(Repository.id == _as_uuid(repo_id))
+        ).one_or_none()
+
     @staticmethod
     def update_repository_status(
         db: Session,
@@ -167,19 +216,37 @@ class RepositoryService:
         required_role: Optional[str] = None
     ) -> bool:
         """
-        사용자의 Repository 접근 권한 확인
-        
+        사용자의 Repository 접근 권한 확인 (L1+Redis 캐시 적용)
+
         Args:
             db: 데이터베이스 세션
             repo_id: Repository ID
             user_id: 사용자 ID
             required_role: 필요한 역할 (None이면 접근만 확인)
-        
+
         Returns:
             권한 여부
         """
-        user_uuid = uuid.UUID(user_id)
-        repo_uuid = uuid.UUID(repo_id)
+        cached = get_cached_permission_sync(repo_id, user_id, required_role)
+        if cached is not None:
+            return cached
+
+        allowed = RepositoryService._check_user_permission_db_sync(
+            db, repo_id, user_id, required_role
+        )
+        set_cached_permission_sync(repo_id, user_id, allowed, required_role)
+        return allowed
+
+    @staticmethod
+    def _check_user_permission_db_sync(
+        db: Session,
+        repo_id: str,
+        user_id: str,
+        required_role: Optional[str] = None
+    ) -> bool:
+        """권한 확인의 DB 조회 경로 (캐시 미스 시 호출)"""
+        user_uuid = _as_uuid(user_id)
+        repo_uuid = _as_uuid(repo_id)
         
         # 소유자 확인
         repo = db.query(Repository).filter(Repository.id == repo_uuid).first()
@@ -203,7 +270,125 @@ class RepositoryService:
             user_role_level = role_hierarchy.get(member.role, 0)
             required_role_level = role_hierarchy.get(required_role, 0)
             return user_role_level >= required_role_level
-        
+
+        return True
+
+    @staticmethod
+    def get_repository_if_permitted(
+        db: Session,
+        repo_id: str,
+        user_id: str,
+        required_role: Optional[str] = None
+    ) -> Tuple[Optional[Repository], Optional[str]]:
+        """
+        Repository 조회와 접근 권한 확인을 한 번의 쿼리로 수행
+
+        Args:
+            db: 데이터베이스 세션
+            repo_id: Repository ID
+            user_id: 사용자 ID
+            required_role: 필요한 역할 (None이면 접근만 확인)
+
+        Returns:
+            (Repository 또는 None, 거부 사유 "not_found"/"forbidden" 또는 None)
+        """
+        user_uuid = _as_uuid(user_id)
+
+        repo = db.query(Repository).filter(
+            Repository.id == _as_uuid(repo_id)
+        ).options(
+            joinedload(Repository.owner),
+            joinedload(Repository.members)
+        ).first()
+
+        if not repo:
+            return None, "not_found"
+
+        # 소유자 확인
+        if repo.owner_id == user_uuid:
+            return repo, None
+
+        # 멤버 확인 (members는 이미 조인으로 로딩됨)
+        member = next((m for m in repo.members if m.user_id == user_uuid), None)
+        if not member:
+            return repo, "forbidden"
+
+        # 역할 확인
+        if required_role:
+            role_hierarchy = {"viewer": 0, "member": 1, "admin": 2}
+            if role_hierarchy.get(member.role, 0) < role_hierarchy.get(required_role, 0):
+                return repo, "forbidden"
+
+        return repo, None
+
+    @staticmethod
+    async def get_repository_async(db: AsyncSession, repo_id: str) -> Optional[Repository]:
+        """Repository 조회 (비동기 라우터용, owner 선로딩으로 lazy load 차단)"""
+        result = await db.execute(
+            select(Repository).where(
+                Repository.id == _as_uuid(repo_id)
+            ).options(joinedload(Repository.owner))
+        )
+        return result.scalars().first()
+
+    @staticmethod
+    async def check_user_permission_async(
+        db: AsyncSession,
+        repo_id: str,
+        user_id: str,
+        required_role: Optional[str] = None
+    ) -> bool:
+        """사용자의 Repository 접근 권한 확인 (비동기 라우터용, L1+Redis 캐시 적용)"""
+        cached = await get_cached_permission(repo_id, user_id, required_role)
+        if cached is not None:
+            return cached
+
+        allowed = await RepositoryService._check_user_permission_db(
+            db, repo_id, user_id, required_role
+        )
+        await set_cached_permission(repo_id, user_id, allowed, required_role)
+        return allowed
+
+    @staticmethod
+    async def _check_user_permission_db(
+        db: AsyncSession,
+        repo_id: str,
+        user_id: str,
+        required_role: Optional[str] = None
+    ) -> bool:
+        """권한 확인의 DB 조회 경로 (캐시 미스 시 호출)"""
+        user_uuid = _as_uuid(user_id)
+        repo_uuid = _as_uuid(repo_id)
+
+        # 소유자 확인
+        result = await db.execute(
+            select(Repository).where(Repository.id == repo_uuid)
+        )
+        repo = result.scalars().first()
+        if repo and repo.owner_id == user_uuid:
+            return True
+
+        # 멤버 확인
+        result = await db.execute(
+            select(RepositoryMember).where(
+                and_(
+                    RepositoryMember.repository_id == repo_uuid,
+                    RepositoryMember.user_id == user_uuid
+                )
+            )
+        )
+        member = result.scalars().first()
+
+        if not member:
+            return False
+
+        # 역할 확인
+        if required_role:
+            role_hierarchy = {"viewer": 0, "member": 1, "admin": 2}
+            user_role_level = role_hierarchy.get(member.role, 0)
+            required_role_level = role_hierarchy.get(required_role, 0)
+            return user_role_level >= required_role_level
+
         return True
 
 
@@ -219,23 +404,25 @@ class RepositoryMemberService:
         """Repository에 멤버 추가"""
         db_member = RepositoryMember(
             id=uuid.uuid4(),
-            repository_id=uuid.UUID(repo_id),
-            user_id=uuid.UUID(member_data.user_id),
+            repository_id=_as_uuid(repo_id),
+            user_id=_as_uuid(member_data.user_id),
             role=member_data.role
         )
         
         db.add(db_member)
         db.commit()
         db.refresh(db_member)
-        
+
+        invalidate_repository_permissions(repo_id)
+
         return db_member
 
     @staticmethod
     def get_repository_members(db: Session, repo_id: str) -> List[RepositoryMember]:
-        """Repository의 모든 멤버 조회"""
+        """Repository의 모든 멤버 조회 (username/email 접근용 user 선로딩)"""
         return db.query(RepositoryMember).filter(
-            RepositoryMember.repository_id == uuid.UUID(repo_id)
-        ).all()
+            RepositoryMember.repository_id == _as_uuid(repo_id)
+        ).options(joinedload(RepositoryMember.user)).all()
 
     @staticmethod
     def update_member_role(
@@ -245,7 +432,7 @@ class RepositoryMemberService:
     ) -> Optional[RepositoryMember]:
         """멤버 역할 업데이트"""
         db_member = db.query(RepositoryMember).filter(
-            RepositoryMember.id == uuid.UUID(member_id)
+            RepositoryMember.id == _as_uuid(member_id)
         ).first()
         
         if not db_member:
@@ -254,21 +441,25 @@ class RepositoryMemberService:
         db_member.role = role_data.role
         db.commit()
         db.refresh(db_member)
-        
+
+        invalidate_repository_permissions(str(db_member.repository_id))
+
         return db_member
 
     @staticmethod
     def remove_member(db: Session, member_id: str) -> bool:
         """Repository에서 멤버 제거"""
         db_member = db.query(RepositoryMember).filter(
-            RepositoryMember.id == uuid.UUID(member_id)
+            RepositoryMember.id == _as_uuid(member_id)
         ).first()
         
         if not db_member:
             return False
-        
+
+        repo_id = str(db_member.repository_id)
         db.delete(db_member)
         db.commit()
+        invalidate_repository_permissions(repo_id)
         return True
 
     @staticmethod
@@ -280,7 +471,7 @@ class RepositoryMemberService:
         """특정 사용자의 멤버 정보 조회"""
         return db.query(RepositoryMember).filter(
             and_(
-                RepositoryMember.repository_id == uuid.UUID(repo_id),
-                RepositoryMember.user_id == uuid.UUID(user_id)
+                RepositoryMember.repository_id == _as_uuid(repo_id),
+                RepositoryMember.user_id == _as_uuid(user_id)
             )
         ).first()
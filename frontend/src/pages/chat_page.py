@@ -1,33 +1,314 @@
+import asyncio
+import io
+import json
+import logging
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from html import escape
+
 from nicegui import ui
 from datetime import datetime
 from frontend.src.components.header import Header
 from frontend.src.services.api_service import APIService
 
+logger = logging.getLogger(__name__)
+
+
+# 한 번에 DOM에 올리는 메시지 수 (이전 페이지는 요청 시에만 로드)
+_MESSAGE_PAGE_SIZE = 30
+
+# 세션당 코드 히스토리 응답 LRU 캐시 크기
+_HISTORY_CACHE_MAX_SIZE = 32
+
+# 히스토리 모달에서 한 번에 렌더링하는 커밋 카드 수
+_HISTORY_PAGE_SIZE = 10
+
+# 큰 diff는 pygments(C 가속 토크나이저)로 렌더링, 미설치 환경은 순수 파이썬 폴백
+try:
+    from pygments import highlight
+    from pygments.formatters.html import HtmlFormatter
+    from pygments.lexers.diff import DiffLexer
+
+    _DIFF_LEXER = DiffLexer()
+    _DIFF_FORMATTER = HtmlFormatter(nowrap=True, noclasses=True, style='monokai')
+except ImportError:
+    _DIFF_LEXER = None
+    _DIFF_FORMATTER = None
+
+# 히스토리 카드의 정적 스타일 (페이지당 1회 head 주입, 카드마다 재전송하지 않음)
+_HISTORY_CARD_CSS = '''
+    <style>
+        .hist-card { margin-bottom: 16px; border: 1px solid #e5e7eb; border-radius: 8px; overflow: hidden; background: white; }
+        .hist-card-header { padding: 12px; background: #f9fafb; border-bottom: 1px solid #e5e7eb; display: flex; align-items: center; gap: 16px; }
+        .hist-hash { background: #3b82f6; color: white; padding: 4px 8px; border-radius: 4px; font-family: monospace; font-size: 12px; }
+        .hist-msg { font-weight: 600; color: #111827; }
+        .hist-meta { font-size: 12px; color: #6b7280; }
+        .hist-diff-wrap { padding: 12px; background: #f9fafb; }
+        .hist-diff-title { font-size: 12px; font-weight: 600; color: #374151; margin-bottom: 8px; }
+        .hist-diff { background: #1f2937; color: #f3f4f6; padding: 12px; border-radius: 4px; font-family: monospace; font-size: 12px; overflow-x: auto; margin: 0; }
+    </style>
+    <script>
+        /* diff 색상 입히기는 순수 문자열 변환이므로 브라우저에서 수행 (서버 이벤트 루프 보호) */
+        function renderDiff(pre) {
+            if (pre.dataset.rendered) return;
+            pre.dataset.rendered = '1';
+            const colors = {'+': '#10b981', '-': '#ef4444'};
+            pre.innerHTML = pre.textContent.split('\\n').map(line => {
+                const color = colors[line[0]] || '#9ca3af';
+                const safe = line.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+                return '<span style="color: ' + color + ';">' + safe + '</span>';
+            }).join('<br>');
+        }
+    </script>
+'''
+
+# 카드 HTML 템플릿 (%-포맷은 CPython에서 가장 빠른 치환 경로)
+_HISTORY_CARD_TEMPLATE = (
+    '<div class="hist-card">'
+    '<div class="hist-card-header">'
+    '<div class="hist-hash">%(hash)s</div>'
+    '<div style="flex: 1;">'
+    '<div class="hist-msg">%(message)s</div>'
+    '<div class="hist-meta">by %(author)s • %(date)s</div>'
+    '</div>'
+    '</div>'
+    '%(diff)s'
+    '</div>'
+)
+_HISTORY_DIFF_TEMPLATE = (
+    '<div class="hist-diff-wrap">'
+    '<div class="hist-diff-title">Changes:</div>'
+    '<pre class="hist-diff" data-diff>%(diff)s</pre>'
+    '</div>'
+)
+
+# diff 라인 첫 글자별 span 접두사 (호출마다 문자열을 재구성하지 않음)
+_DIFF_PREFIX = {
+    '+': '<span style="color: #10b981;">+ ',
+    '-': '<span style="color: #ef4444;">- ',
+}
+_DIFF_DEFAULT_PREFIX = '<span style="color: #9ca3af;">'
+
+# 반복 사용되는 인라인 스타일 상수 (호출 시마다 문자열을 재구성하지 않음)
+_MESSAGE_ROW_STYLE = 'width: 100%; margin-bottom: 20px; display: flex; align-items: flex-start;'
+_AI_BUBBLE_STYLE = (
+    'width: 700px; max-width: 700px; background: white; border: 1px solid #e5e7eb; '
+    'border-radius: 18px 18px 18px 4px; box-shadow: 0 2px 12px rgba(0,0,0,0.08); overflow: hidden;'
+)
+_SOURCE_ROW_STYLE = (
+    'display: flex; align-items: center; gap: 8px; padding: 6px 8px; background: rgba(255,255,255,0.7); '
+    'border-radius: 6px; border: 1px solid rgba(14,165,233,0.2);'
+)
+_SOURCE_ROW_CLICKABLE_STYLE = _SOURCE_ROW_STYLE + ' cursor: pointer; transition: all 0.2s;'
+_SOURCE_BADGE_STYLE = (
+    'width: 16px; height: 16px; background: linear-gradient(135deg, #3b82f6 0%, #1d4ed8 100%); '
+    'border-radius: 3px; display: flex; align-items: center; justify-content: center; '
+    'color: white; font-size: 8px; font-weight: 600;'
+)
+
+
+# "path:line" 형식 소스 경로 분해용 (module 로드 시 1회 컴파일)
+_SRC_RE = re.compile(r'^([^:]+):(.*)$')
+
+
+def _parse_source(source):
+    """
+    source 항목(dict 또는 "path:line" 문자열)을 공통 형태로 정규화
+
+    Returns:
+        (path, file_path, line_info, node_name, node_type)
+        file_path가 None이면 라인 정보가 없어 클릭할 수 없는 항목이다.
+    """
+    if isinstance(source, dict):
+        path = source.get('path', '')
+        node_name = source.get('name', 'unknown')
+        node_type = source.get('type', 'function')
+    else:
+        path = source
+        node_name = None
+        node_type = None
+
+    match = _SRC_RE.match(path)
+    if match:
+        return path, match.group(1), match.group(2), node_name, node_type
+    return path, None, "", node_name, node_type
+
+
+def _normalize_message(message):
+    """메시지 전처리 (1회): sources JSON 파싱 결과를 메시지에 캐시"""
+    if "_sources_parsed" not in message:
+        sources = message.get("sources")
+        if sources and isinstance(sources, str):
+            try:
+                sources = json.loads(sources)
+            except Exception:
+                sources = None
+        elif not sources:
+            sources = None
+        message["_sources_parsed"] = sources
+
+    # 렌더링마다 strftime을 반복하지 않도록 표시용 시각도 1회만 포맷
+    if "_hm" not in message:
+        message["_hm"] = message["created_at"].strftime("%H:%M")
+
+    return message
+
+
+def _chat_room_item_html(room, is_selected, list_id):
+    """사이드바 방 행 HTML 생성 (클릭은 리스트 컨테이너의 위임 리스너가 처리)"""
+    room_id = room["id"]
+    if is_selected:
+        bg_color = "#dbeafe"
+        border_color = "#3b82f6"
+    else:
+        bg_color = "white"
+        border_color = "transparent"
+
+    def emit(opts: str) -> str:
+        return (
+            f"getElement({list_id}).$emit('room_click', "
+            f"{{roomId: '{room_id}', opts: {opts}}})"
+        )
+
+    return (
+        f'<div id="chat-room-{room_id}" data-room-id="{room_id}" '
+        f'style="display: flex; align-items: center; justify-content: space-between; gap: 12px; padding: 12px; '
+        f'border-radius: 10px; background-color: {bg_color}; border: 2px solid {border_color}; margin-bottom: 6px; '
+        f'transition: all 0.2s; height: 52px; width: 100%; cursor: pointer;" '
+        f'onclick="{emit("false")}">'
+        f'<span style="font-weight: 500; font-size: 14px; color: #1f2937; overflow: hidden; text-overflow: ellipsis; '
+        f'white-space: nowrap; display: block; flex: 1; min-width: 0;">{escape(room["name"])}</span>'
+        f'<button style="color: #6b7280; padding: 4px 8px; background: transparent; border: none; font-size: 18px; '
+        f'cursor: pointer; border-radius: 6px; min-width: 32px; flex-shrink: 0;" '
+        f'onclick="event.stopPropagation(); {emit("true")}">✕</button>'
+        '</div>'
+    )
+
+
+def _user_message_html(message):
+    """사용자 메시지 버블 전체를 단일 HTML 문자열로 생성"""
+    # 사용자 입력을 그대로 보간하지 않도록 이스케이프 (메모이즈 안전성 확보)
+    content = escape(message["content"])
+    timestamp = message["_hm"]
+    return (
+        '<div style="width: 100%; margin-bottom: 20px; display: flex; align-items: flex-start;">'
+        '<div style="flex: 1; min-width: 0;"></div>'
+        '<div style="width: 600px; max-width: 600px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); '
+        'color: white; padding: 16px 18px; border-radius: 18px 18px 4px 18px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">'
+        f'<div style="white-space: pre-wrap; line-height: 1.5; word-break: break-word;">{content}</div>'
+        f'<div style="font-size: 11px; opacity: 0.8; margin-top: 8px; text-align: right;">{timestamp}</div>'
+        '</div>'
+        '</div>'
+    )
+
+
+def _bot_message_html(message):
+    """AI 메시지의 헤더 + 본문 골격을 단일 HTML 문자열로 생성"""
+    content = escape(message["content"])
+    timestamp = message["_hm"]
+    return (
+        '<div style="background: linear-gradient(90deg, #f8fafc 0%, #e2e8f0 100%); padding: 12px 16px; '
+        'border-bottom: 1px solid #e5e7eb; display: flex; align-items: center; gap: 8px;">'
+        '<div style="width: 28px; height: 28px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); '
+        'border-radius: 50%; display: flex; align-items: center; justify-content: center; color: white; font-size: 14px; font-weight: 600;">🤖</div>'
+        '<div style="font-weight: 600; color: #374151;">RAGIT</div>'
+        '<div style="background: linear-gradient(90deg, #10b981 0%, #059669 100%); color: white; padding: 2px 8px; '
+        'border-radius: 12px; font-size: 10px; font-weight: 500;">AI + RAG</div>'
+        '<div style="flex: 1;"></div>'
+        f'<div style="font-size: 11px; color: #6b7280;">{timestamp}</div>'
+        '</div>'
+        '<div style="padding: 16px;">'
+        f'<div style="white-space: pre-wrap; line-height: 1.6; color: #374151;">{content}</div>'
+        '</div>'
+    )
+
+
+@lru_cache(maxsize=256)
+def _format_diff_cached(diff_text: str) -> str:
+    """diff 텍스트 → HTML 변환 (입력 문자열 기준 메모이즈)"""
+    if _DIFF_LEXER is not None:
+        return highlight(diff_text, _DIFF_LEXER, _DIFF_FORMATTER).replace('\n', '<br>')
+
+    # 리스트 적재 + join 대신 StringIO에 바로 기록 (대형 diff의 복사 1회 제거)
+    buf = io.StringIO()
+    write = buf.write
+    for line in diff_text.splitlines():
+        head = line[:1]
+        if head in _DIFF_PREFIX:
+            write(_DIFF_PREFIX[head])
+            write(escape(line[1:]))
+        else:
+            write(_DIFF_DEFAULT_PREFIX)
+            write(escape(line))
+        write('</span><br>')
+    return buf.getvalue()[:-4]  # 마지막 <br> 제거
+
+
 class ChatPage:
     def __init__(self, repo_id: str, auth_service):
         self.repo_id = repo_id
         self.auth_service = auth_service
         self.api_service = APIService(auth_service=auth_service)
         try:
-            self.repository = self.api_service.get_repository(repo_id)
+            # 초기 데이터 일괄 조회 (직렬 왕복 4회 → 1회)
+            bootstrap = self.api_service.get_chat_bootstrap(repo_id)
+            self.repository = bootstrap["repository"]
+            self._chat_rooms = bootstrap["chat_rooms"]
             # Auto-select first chat room
-            chat_rooms = self.api_service.get_chat_rooms(repo_id)
-            self.selected_chat_room = chat_rooms[0] if chat_rooms else None
+            self.selected_chat_room = self._chat_rooms[0] if self._chat_rooms else None
+            self._initial_messages = bootstrap["initial_messages"]
         except Exception as e:
             self.repository = None
             self.selected_chat_room = None
+            self._chat_rooms = []
+            self._initial_messages = None
             ui.notify(f"Failed to load repository data: {str(e)}", type='negative')
         self.message_input = None
         self.messages_container = None
+        self.messages_inner_container = None
         self.chat_area_container = None
         self.sidebar_container = None
-        self.polling_timer = None
+        self._bot_reply_task = None
         self.polling_attempts = 0
+        # 증분 렌더링용: 이미 DOM에 올라간 메시지 추적
+        self._rendered_message_ids = set()
+        self._last_message_id = None
+        # 과거 메시지는 불변이므로 버블 HTML을 id 기준으로 메모이즈
+        self._message_html_cache = {}
+        # 한 핸들러 안의 JS 호출을 모아 한 번에 전송
+        self._pending_js = []
+        # 코드 히스토리 응답 LRU 캐시 (같은 노드 재조회 시 git 연산 생략)
+        self._history_cache = OrderedDict()
+        # 동일 키로 진행 중인 히스토리 요청 (중복 RPC 방지)
+        self._history_inflight = {}
+        # 재사용되는 히스토리 다이얼로그 (최초 열 때 1회 생성)
+        self._history_dialog = None
+        self._history_title = None
+        self._history_body = None
 
     def render(self):
         if not self.repository:
             return self.render_not_found()
 
+        # 로딩 애니메이션 CSS는 페이지당 1회만 주입 (메시지마다 <style> 재전송 방지)
+        ui.add_head_html('''
+            <style>
+                @keyframes pulse {
+                    0%, 100% { opacity: 0.3; transform: scale(0.8); }
+                    50% { opacity: 1; transform: scale(1.2); }
+                }
+                .bot-pulse-dot {
+                    width: 8px;
+                    height: 8px;
+                    background: #667eea;
+                    border-radius: 50%;
+                    animation: pulse 1.5s ease-in-out infinite;
+                }
+            </style>
+        ''')
+        ui.add_head_html(_HISTORY_CARD_CSS)
+
         # Main container - full viewport height
         with ui.element('div').style('height: 100vh; display: flex; flex-direction: column; overflow: hidden;'):
             # Header
@@ -45,17 +326,25 @@ class ChatPage:
                 with self.chat_area_container:
                     self.render_chat_area()
 
+            # 히스토리 다이얼로그는 페이지 루트 슬롯에 미리 생성
+            # (메시지 목록 내부에서 만들면 방 전환 시 함께 삭제됨)
+            self._build_history_dialog()
+
     def render_not_found(self):
         with ui.column().classes('w-full min-h-screen items-center justify-center'):
             ui.html('<h2 class="text-2xl font-bold text-gray-600">Repository Not Found</h2>')
             ui.button('Back to Repositories', on_click=lambda: ui.navigate.to('/repositories')).classes('rag-button-primary mt-4')
 
     def render_sidebar(self):
-        try:
-            chat_rooms = self.api_service.get_chat_rooms(self.repo_id)
-        except Exception as e:
-            ui.notify(f"Failed to load chat rooms: {str(e)}", type='negative')
-            chat_rooms = []
+        # bootstrap에서 받은 목록 사용 (렌더링마다 재요청하지 않음)
+        # 목록이 비어 있을 때(초기 일괄 조회 실패 포함)만 한 번 재조회
+        if not self._chat_rooms:
+            try:
+                self._chat_rooms = self.api_service.get_chat_rooms(self.repo_id)
+            except Exception as e:
+                ui.notify(f"Failed to load chat rooms: {str(e)}", type='negative')
+                self._chat_rooms = []
+        chat_rooms = self._chat_rooms
 
         with ui.element('div').style('width: 280px; background-color: #f8fafc; border-right: 1px solid #e2e8f0; display: flex; flex-direction: column; overflow: hidden;'):
             # Header
@@ -67,31 +356,25 @@ class ChatPage:
                 with ui.element('div').style('width: 100%;'):
                     ui.button('➕ Add Chat', on_click=self.show_create_chat_dialog).classes('rag-button-primary').style('width: 100%;')
 
-            # Chat rooms list
-            with ui.element('div').style('flex: 1; overflow-y: auto; padding: 12px;'):
-                for room in chat_rooms:
-                    self.render_chat_room_item(room)
-
-    def render_chat_room_item(self, room):
-        is_selected = self.selected_chat_room and self.selected_chat_room["id"] == room["id"]
-        room_id = room["id"]
-
-        if is_selected:
-            bg_color = "#dbeafe"
-            border_color = "#3b82f6"
+            # Chat rooms list (행별 핸들러 대신 컨테이너에 위임 리스너 1개)
+            with ui.element('div').style('flex: 1; overflow-y: auto; padding: 12px;') as rooms_list:
+                rooms_list.on('room_click', self._handle_room_event)
+                selected_id = self.selected_chat_room["id"] if self.selected_chat_room else None
+                ui.html(''.join(
+                    _chat_room_item_html(room, room["id"] == selected_id, rooms_list.id)
+                    for room in chat_rooms
+                ))
+
+    def _handle_room_event(self, e):
+        """사이드바 위임 클릭 처리 (로컬 목록에서 방 조회, HTTP 없음)"""
+        args = e.args or {}
+        room = next((r for r in self._chat_rooms if r["id"] == args.get("roomId")), None)
+        if not room:
+            return
+        if args.get("opts"):
+            self.show_room_options(room, None)
         else:
-            bg_color = "white"
-            border_color = "transparent"
-
-        # Create a container for this specific room
-        with ui.element('div').style(f'display: flex; align-items: center; justify-content: space-between; gap: 12px; padding: 12px; border-radius: 10px; background-color: {bg_color}; border: 2px solid {border_color}; margin-bottom: 6px; transition: all 0.2s; height: 52px; width: 100%;') as container:
-            # Room name container - clickable
-            with ui.element('div').style('flex: 1; min-width: 0; cursor: pointer;').on('click', lambda rid=room_id: self.handle_room_click_only(rid)):
-                ui.html(f'<span style="font-weight: 500; font-size: 14px; color: #1f2937; overflow: hidden; text-overflow: ellipsis; white-space: nowrap; display: block;">{room["name"]}</span>')
-
-            # Options button (fixed position on right) - separate click handler
-            with ui.element('div').style('flex-shrink: 0;'):
-                ui.button('✕', on_click=lambda rid=room_id: self.handle_options_click_only(rid)).style('color: #6b7280; padding: 4px 8px; background: transparent; border: none; font-size: 18px; cursor: pointer; border-radius: 6px; min-width: 32px;').props('flat dense')
+            self.select_chat_room(room)
 
     def render_chat_area(self):
         with ui.element('div').style('flex: 1; display: flex; flex-direction: column; overflow: hidden;'):
@@ -101,11 +384,13 @@ class ChatPage:
                 self.render_active_chat()
 
     def render_empty_chat_state(self):
+        repo_name = escape(self.repository["name"])
+
         with ui.column().classes('flex-1 items-center justify-center p-8'):
             with ui.card().classes('rag-card text-center max-w-md'):
                 ui.html('<div style="font-size: 96px; color: #60a5fa; margin-bottom: 16px;">💬</div>')
                 ui.html('<h3 class="text-xl font-semibold text-gray-800 mb-2">Welcome to RAG Chat</h3>')
-                ui.html(f'<p class="text-gray-600 mb-4">사이드바에서 채팅방을 생성하여 <strong>{self.repository["name"]}</strong> 레포지토리에 대한 대화를 시작하세요.</p>')
+                ui.html(f'<p class="text-gray-600 mb-4">사이드바에서 채팅방을 생성하여 <strong>{repo_name}</strong> 레포지토리에 대한 대화를 시작하세요.</p>')
                 ui.html('<p class="text-gray-500 text-sm mt-2">왼쪽 사이드바의 "➕ Add Chat" 버튼을 클릭하여 새로운 채팅방을 만들 수 있습니다.</p>')
 
     def render_active_chat(self):
@@ -126,116 +411,158 @@ class ChatPage:
         self.restore_loading_state_if_needed()
 
     def render_chat_header(self):
+        # 반복 dict 조회를 지역 변수로 (f-string 보간에서 재해싱 방지)
         room = self.selected_chat_room
+        room_name = escape(room["name"])
+        repo_name = escape(self.repository["name"])
+        message_count = room["message_count"]
 
         with ui.element('div').style('padding: 20px 24px; border-bottom: 1px solid #e5e7eb; background-color: white; display: flex; align-items: center; height: 80px;'):
             ui.html('<span style="color: #2563eb; font-size: 24px; margin-right: 12px;">💬</span>')
             with ui.column().classes('gap-1').style('flex: 1; min-width: 0;'):
-                ui.html(f'<h3 style="font-weight: 600; font-size: 18px; color: #111827; margin: 0; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;">{room["name"]}</h3>')
-                ui.html(f'<p style="font-size: 13px; color: #6b7280; margin: 0; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;">{self.repository["name"]} • {room["message_count"]} messages</p>')
+                ui.html(f'<h3 style="font-weight: 600; font-size: 18px; color: #111827; margin: 0; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;">{room_name}</h3>')
+                ui.html(f'<p style="font-size: 13px; color: #6b7280; margin: 0; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;">{repo_name} • {message_count} messages</p>')
 
     def render_messages_area(self):
         # Messages container - fixed size regardless of content
         with ui.element('div').style('flex: 1; overflow-y: auto; padding: 24px; background-color: #f9fafb; min-height: 0; width: 100%;').props('id=messages-container') as container:
             self.messages_container = container
 
-            # Inner container for messages - centered with max width
-            with ui.element('div').style('max-width: 1200px; margin: 0 auto; width: 100%; min-height: 100%; display: flex; flex-direction: column;'):
+            # 첫 렌더링은 bootstrap에 담겨 온 메시지를 소비 (추가 왕복 없음)
+            if self._initial_messages is not None:
+                messages = self._initial_messages[-_MESSAGE_PAGE_SIZE:]
+                self._initial_messages = None
+            else:
                 try:
-                    messages = self.api_service.get_messages(self.selected_chat_room["id"])
+                    messages = self.api_service.get_messages(
+                        self.selected_chat_room["id"], limit=_MESSAGE_PAGE_SIZE
+                    )
                 except Exception as e:
                     ui.notify(f"Failed to load messages: {str(e)}", type='negative')
                     messages = []
 
-                # Render messages with consistent spacing
-                for i, message in enumerate(messages):
-                    self.render_message(message)
+            self._render_message_list(messages, len(messages) >= _MESSAGE_PAGE_SIZE)
 
-    def render_message(self, message):
-        import json
+    def _render_message_list(self, messages, has_older):
+        """메시지 목록(필요 시 '이전 메시지' 버튼 포함)을 렌더링"""
+        self._loaded_messages = list(messages)
 
-        is_user = message["sender_type"] == "user"
+        # Inner container for messages - centered with max width
+        with ui.element('div').style('max-width: 1200px; margin: 0 auto; width: 100%; min-height: 100%; display: flex; flex-direction: column;') as inner:
+            self.messages_inner_container = inner
+            self._rendered_message_ids = set()
+            self._last_message_id = None
 
-        # Parse sources if it's a JSON string
-        sources = message.get("sources")
-        if sources and isinstance(sources, str):
-            try:
-                sources = json.loads(sources)
-            except:
-                sources = None
-        elif not sources:
-            sources = None
+            # DOM 크기를 페이지 단위로 제한 (이전 기록은 요청 시에만 로드)
+            if has_older:
+                with ui.row().style('justify-content: center; width: 100%; margin-bottom: 12px;'):
+                    ui.button('⬆ 이전 메시지 보기', on_click=self.load_older_messages).props('flat dense')
 
-        with ui.element('div').style('width: 100%; margin-bottom: 20px; display: flex; align-items: flex-start;'):
-            if is_user:
-                # User message - right aligned with fixed width
-                ui.element('div').style('flex: 1; min-width: 0;')  # spacer
-                with ui.element('div').style('width: 600px; max-width: 600px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 16px 18px; border-radius: 18px 18px 4px 18px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);'):
-                    ui.html(f'<div style="white-space: pre-wrap; line-height: 1.5; word-break: break-word;">{message["content"]}</div>')
-                    ui.html(f'<div style="font-size: 11px; opacity: 0.8; margin-top: 8px; text-align: right;">{message["created_at"].strftime("%H:%M")}</div>')
-            else:
-                # AI message - left aligned with fixed width
-                with ui.element('div').style('width: 700px; max-width: 700px; background: white; border: 1px solid #e5e7eb; border-radius: 18px 18px 18px 4px; box-shadow: 0 2px 12px rgba(0,0,0,0.08); overflow: hidden;'):
+            # Render messages with consistent spacing
+            for message in messages:
+                self.render_message(message)
 
-                    # AI Header with gradient
-                    with ui.row().style('background: linear-gradient(90deg, #f8fafc 0%, #e2e8f0 100%); padding: 12px 16px; border-bottom: 1px solid #e5e7eb; align-items: center; gap: 8px;'):
-                        ui.html('<div style="width: 28px; height: 28px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 50%; display: flex; align-items: center; justify-content: center; color: white; font-size: 14px; font-weight: 600;">🤖</div>')
-                        ui.html('<div style="font-weight: 600; color: #374151;">RAGIT</div>')
-                        ui.html('<div style="background: linear-gradient(90deg, #10b981 0%, #059669 100%); color: white; padding: 2px 8px; border-radius: 12px; font-size: 10px; font-weight: 500;">AI + RAG</div>')
-                        ui.element().style('flex: 1;')
-                        ui.html(f'<div style="font-size: 11px; color: #6b7280;">{message["created_at"].strftime("%H:%M")}</div>')
+    def load_older_messages(self):
+        """이전 페이지(오래된 메시지)를 가져와 목록 위쪽에 붙인다"""
+        if not self._loaded_messages:
+            return
 
-                    # Message content
-                    with ui.column().style('padding: 16px;'):
-                        ui.html(f'<div style="white-space: pre-wrap; line-height: 1.6; color: #374151;">{message["content"]}</div>')
-
-                        # Sources section with enhanced RAG styling
-                        if sources:
-                            with ui.column().style('margin-top: 16px; padding: 12px; background: linear-gradient(135deg, #f0f9ff 0%, #e0f2fe 100%); border-radius: 8px; border-left: 4px solid #0ea5e9;'):
-                                with ui.row().style('align-items: center; gap: 8px; margin-bottom: 8px;'):
-                                    ui.html('<div style="width: 20px; height: 20px; background: linear-gradient(135deg, #0ea5e9 0%, #0284c7 100%); border-radius: 50%; display: flex; align-items: center; justify-content: center; color: white; font-size: 10px;">📚</div>')
-                                    ui.html('<div style="font-weight: 600; color: #0f172a; font-size: 13px;">Retrieved from Repository</div>')
-
-                                with ui.column().style('gap: 6px;'):
-                                    for i, source in enumerate(sources):
-                                        # 새로운 형식 또는 기존 형식 모두 지원
-                                        if isinstance(source, dict):
-                                            # 새로운 형식 (딕셔너리)
-                                            path = source.get('path', '')
-                                            node_name = source.get('name', 'unknown')
-                                            node_type = source.get('type', 'function')
-
-                                            # 파일 경로와 라인 정보 추출
-                                            parts = path.split(':')
-                                            if len(parts) >= 2:
-                                                file_path = parts[0]
-                                                line_info = parts[1] if len(parts) > 1 else ""
-
-                                                with ui.row().style('align-items: center; gap: 8px; padding: 6px 8px; background: rgba(255,255,255,0.7); border-radius: 6px; border: 1px solid rgba(14,165,233,0.2); cursor: pointer; transition: all 0.2s;').on('click', lambda fp=file_path, li=line_info, nn=node_name, nt=node_type: self.show_code_history_modal_with_node(fp, li, nn, nt)):
-                                                    ui.html(f'<div style="width: 16px; height: 16px; background: linear-gradient(135deg, #3b82f6 0%, #1d4ed8 100%); border-radius: 3px; display: flex; align-items: center; justify-content: center; color: white; font-size: 8px; font-weight: 600;">{i+1}</div>')
-                                                    ui.html(f'<div style="font-size: 12px; color: #1e40af; font-family: monospace; text-decoration: underline;">{path} <span style="color: #6b7280;">({node_name})</span></div>')
-                                                    ui.html('<div style="font-size: 10px; color: #6b7280; margin-left: auto;">📖 View History</div>')
-                                            else:
-                                                with ui.row().style('align-items: center; gap: 8px; padding: 6px 8px; background: rgba(255,255,255,0.7); border-radius: 6px; border: 1px solid rgba(14,165,233,0.2);'):
-                                                    ui.html(f'<div style="width: 16px; height: 16px; background: linear-gradient(135deg, #3b82f6 0%, #1d4ed8 100%); border-radius: 3px; display: flex; align-items: center; justify-content: center; color: white; font-size: 8px; font-weight: 600;">{i+1}</div>')
-                                                    ui.html(f'<div style="font-size: 12px; color: #1e40af; font-family: monospace;">{path}</div>')
-                                        else:
-                                            # 기존 형식 (문자열)
-                                            parts = source.split(':')
-                                            if len(parts) >= 2:
-                                                file_path = parts[0]
-                                                line_info = parts[1] if len(parts) > 1 else ""
-
-                                                with ui.row().style('align-items: center; gap: 8px; padding: 6px 8px; background: rgba(255,255,255,0.7); border-radius: 6px; border: 1px solid rgba(14,165,233,0.2); cursor: pointer; transition: all 0.2s;').on('click', lambda fp=file_path, li=line_info: self.show_code_history_modal(fp, li)):
-                                                    ui.html(f'<div style="width: 16px; height: 16px; background: linear-gradient(135deg, #3b82f6 0%, #1d4ed8 100%); border-radius: 3px; display: flex; align-items: center; justify-content: center; color: white; font-size: 8px; font-weight: 600;">{i+1}</div>')
-                                                    ui.html(f'<div style="font-size: 12px; color: #1e40af; font-family: monospace; text-decoration: underline;">{source}</div>')
-                                                    ui.html('<div style="font-size: 10px; color: #6b7280; margin-left: auto;">📖 View History</div>')
-                                            else:
-                                                with ui.row().style('align-items: center; gap: 8px; padding: 6px 8px; background: rgba(255,255,255,0.7); border-radius: 6px; border: 1px solid rgba(14,165,233,0.2);'):
-                                                    ui.html(f'<div style="width: 16px; height: 16px; background: linear-gradient(135deg, #3b82f6 0%, #1d4ed8 100%); border-radius: 3px; display: flex; align-items: center; justify-content: center; color: white; font-size: 8px; font-weight: 600;">{i+1}</div>')
-                                                    ui.html(f'<div style="font-size: 12px; color: #1e40af; font-family: monospace;">{source}</div>')
-
-                ui.element('div').style('flex: 1;')  # spacer
+        try:
+            older = self.api_service.get_messages(
+                self.selected_chat_room["id"],
+                limit=_MESSAGE_PAGE_SIZE,
+                before_id=self._loaded_messages[0]["id"]
+            )
+        except Exception as e:
+            ui.notify(f"Failed to load messages: {str(e)}", type='negative')
+            return
+
+        # 버블 HTML은 메모이즈되어 있어 재렌더링 비용은 낮다
+        messages = older + self._loaded_messages
+        self.messages_container.clear()
+        with self.messages_container:
+            self._render_message_list(messages, len(older) >= _MESSAGE_PAGE_SIZE)
+
+    def render_message(self, message):
+        self._rendered_message_ids.add(message["id"])
+        self._last_message_id = message["id"]
+
+        # sources 파싱 결과는 메시지에 캐시되어 재렌더링 시 재파싱하지 않음
+        sources = _normalize_message(message)["_sources_parsed"]
+
+        # 과거 메시지는 불변이므로 버블 HTML을 재사용 (방 전환에도 id 기준 유지)
+        message_id = message["id"]
+        bubble_html = self._message_html_cache.get(message_id)
+
+        if message["sender_type"] == "user":
+            # User message - 버블 전체를 단일 HTML로 전송
+            if bubble_html is None:
+                bubble_html = _user_message_html(message)
+                self._message_html_cache[message_id] = bubble_html
+            ui.html(bubble_html)
+            return
+
+        if bubble_html is None:
+            bubble_html = _bot_message_html(message)
+            self._message_html_cache[message_id] = bubble_html
+
+        # AI message - 정적 골격은 단일 HTML, 클릭이 필요한 sources 행만 개별 요소 유지
+        with ui.element('div').style(_MESSAGE_ROW_STYLE):
+            with ui.element('div').style(_AI_BUBBLE_STYLE):
+                ui.html(bubble_html)
+
+                # Sources section with enhanced RAG styling
+                if sources:
+                    self._render_sources(sources)
+
+            ui.element('div').style('flex: 1;')  # spacer
+
+    def _render_sources(self, sources):
+        """클릭 핸들러가 필요한 sources 행을 개별 요소로 렌더링"""
+        with ui.column().style('margin: 0 16px 16px 16px; padding: 12px; background: linear-gradient(135deg, #f0f9ff 0%, #e0f2fe 100%); border-radius: 8px; border-left: 4px solid #0ea5e9;'):
+            ui.html(
+                '<div style="display: flex; align-items: center; gap: 8px; margin-bottom: 8px;">'
+                '<div style="width: 20px; height: 20px; background: linear-gradient(135deg, #0ea5e9 0%, #0284c7 100%); border-radius: 50%; display: flex; align-items: center; justify-content: center; color: white; font-size: 10px;">📚</div>'
+                '<div style="font-weight: 600; color: #0f172a; font-size: 13px;">Retrieved from Repository</div>'
+                '</div>'
+            )
+
+            with ui.column().style('gap: 6px;'):
+                for i, source in enumerate(sources):
+                    # 새로운 형식(dict)과 기존 형식(문자열) 모두 공통 경로로 처리
+                    path, file_path, line_info, node_name, node_type = _parse_source(source)
+                    badge = f'<div style="{_SOURCE_BADGE_STYLE}">{i+1}</div>'
+
+                    if file_path is None:
+                        # 라인 정보가 없는 항목은 클릭 불가
+                        ui.html(
+                            f'<div style="{_SOURCE_ROW_STYLE}">'
+                            + badge +
+                            f'<div style="font-size: 12px; color: #1e40af; font-family: monospace;">{path}</div>'
+                            '</div>'
+                        )
+                        continue
+
+                    if node_name is not None:
+                        label = f'{path} <span style="color: #6b7280;">({node_name})</span>'
+                        handler = lambda fp=file_path, li=line_info, nn=node_name, nt=node_type: \
+                            self.show_code_history_modal_with_node(fp, li, nn, nt)
+                        prefetch = lambda fp=file_path, nn=node_name, nt=node_type: \
+                            self._prefetch_history(fp, node_name=nn, node_type=nt)
+                    else:
+                        label = path
+                        handler = lambda fp=file_path, li=line_info: \
+                            self.show_code_history_modal(fp, li)
+                        prefetch = lambda fp=file_path, li=line_info: \
+                            self._prefetch_history(fp, line_info=li)
+
+                    # 호버 시 미리 가져와 모달이 캐시에서 바로 열리게 한다
+                    with ui.element('div').style(_SOURCE_ROW_CLICKABLE_STYLE).on('click', handler).on('mouseenter', prefetch):
+                        ui.html(
+                            badge +
+                            f'<div style="font-size: 12px; color: #1e40af; font-family: monospace; text-decoration: underline;">{label}</div>'
+                            '<div style="font-size: 10px; color: #6b7280; margin-left: auto;">📖 View History</div>'
+                        )
 
     def render_input_area(self):
         with ui.element('div').style('padding: 24px; border-top: 1px solid #e5e7eb; background-color: white;'):
@@ -277,6 +604,10 @@ class ChatPage:
 
 
     def send_message(self):
+        # 응답 대기 중 중복 전송 방지 (빠른 Enter 연타로 인한 대기 태스크 중복 차단)
+        if self._bot_reply_task is not None and not self._bot_reply_task.done():
+            return
+
         if not self.message_input.value.strip():
             return
 
@@ -291,13 +622,15 @@ class ChatPage:
                 message_content
             )
 
-            # 2. 사용자 메시지 렌더링
-            self.refresh_messages()
+            # 2. 사용자 메시지만 증분 렌더링 (전체 재렌더링 없음)
+            self._append_messages([user_message])
 
-            # 3. 로딩 메시지 표시
+            # 3. 로딩 메시지 표시 (대기열의 JS를 한 번에 전송)
             self.show_bot_loading()
+            self._flush_js()
 
-            # 4. 폴링 시작 (bot 응답 대기)
+            # 4. 응답 대기 동안 입력 비활성화 후 폴링 시작
+            self.message_input.disable()
             self.start_polling_for_bot_response()
 
         except Exception as e:
@@ -307,35 +640,29 @@ class ChatPage:
         """Bot 응답 로딩 상태 표시"""
         with self.messages_container:
             # 로딩 메시지를 표시할 컨테이너
-            with ui.element('div').style('width: 100%; margin-bottom: 20px; display: flex; align-items: flex-start;') as loading_container:
+            with ui.element('div').style(_MESSAGE_ROW_STYLE) as loading_container:
                 loading_container.classes('bot-loading-message')
 
-                with ui.element('div').style('width: 700px; max-width: 700px; background: white; border: 1px solid #e5e7eb; border-radius: 18px 18px 18px 4px; box-shadow: 0 2px 12px rgba(0,0,0,0.08); overflow: hidden;'):
+                with ui.element('div').style(_AI_BUBBLE_STYLE):
                     # AI Header
                     with ui.row().style('background: linear-gradient(90deg, #f8fafc 0%, #e2e8f0 100%); padding: 12px 16px; border-bottom: 1px solid #e5e7eb; align-items: center; gap: 8px;'):
                         ui.html('<div style="width: 28px; height: 28px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 50%; display: flex; align-items: center; justify-content: center; color: white; font-size: 14px; font-weight: 600;">🤖</div>')
                         ui.html('<div style="font-weight: 600; color: #374151;">RAGIT</div>')
                         ui.html('<div style="background: linear-gradient(90deg, #10b981 0%, #059669 100%); color: white; padding: 2px 8px; border-radius: 12px; font-size: 10px; font-weight: 500;">AI + RAG</div>')
 
-                    # 로딩 애니메이션
+                    # 로딩 애니메이션 (keyframes는 head에 1회 주입됨)
                     with ui.column().style('padding: 16px;'):
                         ui.html('''
                             <div style="display: flex; align-items: center; gap: 8px;">
-                                <div style="width: 8px; height: 8px; background: #667eea; border-radius: 50%; animation: pulse 1.5s ease-in-out infinite;"></div>
-                                <div style="width: 8px; height: 8px; background: #667eea; border-radius: 50%; animation: pulse 1.5s ease-in-out 0.2s infinite;"></div>
-                                <div style="width: 8px; height: 8px; background: #667eea; border-radius: 50%; animation: pulse 1.5s ease-in-out 0.4s infinite;"></div>
+                                <div class="bot-pulse-dot"></div>
+                                <div class="bot-pulse-dot" style="animation-delay: 0.2s;"></div>
+                                <div class="bot-pulse-dot" style="animation-delay: 0.4s;"></div>
                                 <span style="color: #6b7280; font-size: 14px; margin-left: 8px;">AI가 코드를 분석하고 응답을 생성하는 중...</span>
                             </div>
-                            <style>
-                                @keyframes pulse {
-                                    0%, 100% { opacity: 0.3; transform: scale(0.8); }
-                                    50% { opacity: 1; transform: scale(1.2); }
-                                }
-                            </style>
                         ''')
 
-        # 스크롤을 최하단으로
-        ui.run_javascript('''
+        # 스크롤을 최하단으로 (일괄 전송 대기열에 추가)
+        self._queue_js('''
             const container = document.getElementById('messages-container');
             if (container) {
                 container.scrollTop = container.scrollHeight;
@@ -343,75 +670,113 @@ class ChatPage:
         ''')
 
     def start_polling_for_bot_response(self):
-        """Bot 응답을 주기적으로 폴링 (ui.timer 사용)"""
+        """Bot 응답 대기 시작 (타이머 재예약 없이 단일 대기 코루틴 사용)"""
+        # 기존 대기 태스크가 살아 있으면 중복 생성하지 않고 취소
+        if self._bot_reply_task is not None and not self._bot_reply_task.done():
+            self._bot_reply_task.cancel()
+
         self.polling_attempts = 0
+        # 오류 재시도 간격 (지수 백오프: 0.5s에서 시작, 최대 5s)
+        self._poll_retry_delay = 0.5
 
-        def check_bot_response():
-            """타이머 콜백: Bot 응답 확인"""
-            self.polling_attempts += 1
+        self._bot_reply_task = asyncio.create_task(self._await_bot_reply())
 
-            try:
-                # 새 메시지 확인
-                messages = self.api_service.get_messages(self.selected_chat_room["id"])
-
-                # 마지막 메시지가 bot 메시지인지 확인
-                if messages and messages[-1]["sender_type"] == "bot":
-                    # 폴링 중지
-                    if self.polling_timer:
-                        self.polling_timer.active = False
-                        self.polling_timer = None
-
-                    # 로딩 메시지 제거
-                    ui.run_javascript('''
-                        const loadingMessages = document.querySelectorAll('.bot-loading-message');
-                        loadingMessages.forEach(msg => msg.remove());
-                    ''')
+    async def _await_bot_reply(self):
+        """
+        bot 응답을 기다리는 단일 코루틴
 
-                    # 채팅 영역 전체 다시 렌더링
-                    self.chat_area_container.clear()
-                    with self.chat_area_container:
-                        self.render_chat_area()
+        주기적으로 깨어나는 타이머 대신 서버 롱폴링이 응답 도착 시점에
+        코루틴을 깨운다. 타임아웃 응답이면 즉시 다음 대기로 이어진다.
+        """
+        try:
+            # 최대 180초 (약 7회 * 25초) 타임아웃 - 긴 응답 대응
+            while self.polling_attempts < 7:
+                self.polling_attempts += 1
 
-                    return  # 폴링 종료
+                try:
+                    result = await self.api_service.wait_for_bot_response(
+                        self.selected_chat_room["id"],
+                        after=self._last_message_id
+                    )
+                except Exception as e:
+                    logger.warning(f"Polling error: {e}")
+                    # 에러 발생 시 지수 백오프로 재시도 (서버 복구 전 요청 폭주 방지)
+                    await asyncio.sleep(self._poll_retry_delay)
+                    self._poll_retry_delay = min(self._poll_retry_delay * 1.3, 5.0)
+                    continue
 
-                # 최대 180초 (90회 * 2초) 후 타임아웃 - 긴 응답 대응
-                if self.polling_attempts >= 90:
-                    if self.polling_timer:
-                        self.polling_timer.active = False
-                        self.polling_timer = None
+                if result.get("status") == "new":
+                    self._enable_input()
 
-                    ui.run_javascript('''
+                    # 로딩 메시지 제거 (스크롤과 함께 한 번에 전송)
+                    self._queue_js('''
                         const loadingMessages = document.querySelectorAll('.bot-loading-message');
                         loadingMessages.forEach(msg => msg.remove());
                     ''')
-                    ui.notify("응답 생성 대기시간이 초과되었습니다 (3분). 잠시 후 새로고침해주세요.", type='warning')
-
-            except Exception as e:
-                print(f"Polling error: {e}")
-                # 에러 발생 시 계속 폴링
 
-        # 2초마다 실행되는 타이머 시작
-        self.polling_timer = ui.timer(2.0, check_bot_response)
+                    # 새 메시지만 증분 렌더링 (전체 재렌더링 없음)
+                    new_messages = [
+                        m for m in result.get("messages", [])
+                        if m["id"] not in self._rendered_message_ids
+                    ]
+                    self._append_messages(new_messages)
+                    self._flush_js()
+
+                    # 인용된 노드들의 히스토리를 배치 호출로 예열
+                    self._prefetch_message_sources(new_messages)
+                    return
+
+            # 타임아웃
+            self._enable_input()
+            ui.run_javascript('''
+                const loadingMessages = document.querySelectorAll('.bot-loading-message');
+                loadingMessages.forEach(msg => msg.remove());
+            ''')
+            ui.notify("응답 생성 대기시간이 초과되었습니다 (3분). 잠시 후 새로고침해주세요.", type='warning')
 
-    def refresh_messages(self):
-        """메시지 목록 새로고침"""
-        self.messages_container.clear()
+        except asyncio.CancelledError:
+            # 새 대기 태스크로 교체될 때 취소됨
+            pass
 
-        with self.messages_container:
-            # Inner container for messages
-            with ui.element('div').style('max-width: 1200px; margin: 0 auto; width: 100%; min-height: 100%; display: flex; flex-direction: column;'):
-                try:
-                    messages = self.api_service.get_messages(self.selected_chat_room["id"])
-                except Exception as e:
-                    ui.notify(f"Failed to load messages: {str(e)}", type='negative')
-                    messages = []
+    def _enable_input(self):
+        """응답 수신/타임아웃 후 입력 재활성화"""
+        if self.message_input is not None:
+            self.message_input.enable()
 
-                # Render messages
+    def refresh_messages(self):
+        """새로 도착한 메시지만 추가 렌더링 (전체 재렌더링 없음)"""
+        try:
+            messages = self.api_service.get_messages(self.selected_chat_room["id"])
+        except Exception as e:
+            ui.notify(f"Failed to load messages: {str(e)}", type='negative')
+            messages = []
+
+        self._append_messages(
+            [m for m in messages if m["id"] not in self._rendered_message_ids]
+        )
+        self._flush_js()
+
+    def _queue_js(self, script: str) -> None:
+        """JS 실행을 대기열에 추가 (핸들러 끝에서 _flush_js로 일괄 전송)"""
+        self._pending_js.append(script)
+
+    def _flush_js(self) -> None:
+        """대기 중인 JS를 하나의 run_javascript 호출로 전송"""
+        if self._pending_js:
+            # 각 스니펫을 블록으로 감싸 const 선언이 서로 충돌하지 않게 한다
+            ui.run_javascript('\n'.join(f'{{\n{script}\n}}' for script in self._pending_js))
+        self._pending_js = []
+
+    def _append_messages(self, messages):
+        """메시지를 기존 컨테이너에 증분 렌더링하고 최하단으로 스크롤"""
+        if messages and self.messages_inner_container:
+            self._loaded_messages.extend(messages)
+            with self.messages_inner_container:
                 for message in messages:
                     self.render_message(message)
 
-        # 스크롤을 최하단으로
-        ui.run_javascript('''
+        # 스크롤을 최하단으로 (일괄 전송 대기열에 추가)
+        self._queue_js('''
             const container = document.getElementById('messages-container');
             if (container) {
                 container.scrollTop = container.scrollHeight;
@@ -419,58 +784,28 @@ class ChatPage:
         ''')
 
 
-    def handle_room_click(self, e, room_id):
-        """Handle room selection click"""
-        # Find the room by id
-        try:
-            chat_rooms = self.api_service.get_chat_rooms(self.repo_id)
-            room = next((r for r in chat_rooms if r["id"] == room_id), None)
-            if room:
-                self.select_chat_room(room)
-        except Exception as ex:
-            print(f"Error selecting room: {ex}")
-
-    def handle_options_click(self, e, room_id):
-        """Handle options button click"""
-        # Stop event propagation to prevent room selection
-        e.handled = True
-
-        # Find the room by id
-        try:
-            chat_rooms = self.api_service.get_chat_rooms(self.repo_id)
-            room = next((r for r in chat_rooms if r["id"] == room_id), None)
-            if room:
-                self.show_room_options(room, e)
-        except Exception as ex:
-            print(f"Error showing room options: {ex}")
-
-    def handle_room_click_only(self, room_id):
-        """Handle room name click to select room (no event object)"""
-        try:
-            chat_rooms = self.api_service.get_chat_rooms(self.repo_id)
-            room = next((r for r in chat_rooms if r["id"] == room_id), None)
-            if room:
-                self.select_chat_room(room)
-        except Exception as ex:
-            print(f"Error selecting room: {ex}")
-
-    def handle_options_click_only(self, room_id):
-        """Handle options button click to show modal (no event object)"""
-        try:
-            chat_rooms = self.api_service.get_chat_rooms(self.repo_id)
-            room = next((r for r in chat_rooms if r["id"] == room_id), None)
-            if room:
-                self.show_room_options(room, None)
-        except Exception as ex:
-            print(f"Error showing options: {ex}")
-
     def select_chat_room(self, room):
+        previous = self.selected_chat_room
         self.selected_chat_room = room
 
-        # Update the sidebar to show correct selection
-        self.sidebar_container.clear()
-        with self.sidebar_container:
-            self.render_sidebar()
+        # 사이드바 전체 재구축 대신 선택이 바뀐 두 행만 스타일 갱신
+        restyle = []
+        if previous and previous["id"] != room["id"]:
+            restyle.append(f'''
+                const prev = document.getElementById('chat-room-{previous["id"]}');
+                if (prev) {{
+                    prev.style.backgroundColor = 'white';
+                    prev.style.borderColor = 'transparent';
+                }}
+            ''')
+        restyle.append(f'''
+            const cur = document.getElementById('chat-room-{room["id"]}');
+            if (cur) {{
+                cur.style.backgroundColor = '#dbeafe';
+                cur.style.borderColor = '#3b82f6';
+            }}
+        ''')
+        ui.run_javascript('\n'.join(restyle))
 
         # Update the chat area
         self.chat_area_container.clear()
@@ -507,6 +842,7 @@ class ChatPage:
         dialog.close()
 
         # 새로 생성된 채팅방 자동 선택 및 UI 업데이트
+        self._chat_rooms.insert(0, new_room)
         self.selected_chat_room = new_room
 
         # Update the sidebar to show new room
@@ -527,7 +863,7 @@ class ChatPage:
             event.stop_propagation = True
 
         with ui.dialog() as dialog, ui.card().style('width: 320px; padding: 24px;'):
-            ui.html(f'<h3 style="font-size: 18px; font-weight: 600; margin-bottom: 20px; color: #111827;">{room["name"]}</h3>')
+            ui.html(f'<h3 style="font-size: 18px; font-weight: 600; margin-bottom: 20px; color: #111827;">{escape(room["name"])}</h3>')
 
             ui.button('🗑️ Delete Room', on_click=lambda: self.delete_room(room, dialog)).style('''
                 background: #fef2f2;
@@ -563,7 +899,10 @@ class ChatPage:
     def restore_loading_state_if_needed(self):
         """새로고침 후 로딩 상태 복원 (마지막 메시지가 user이고 bot 응답 대기 중인 경우)"""
         try:
-            messages = self.api_service.get_messages(self.selected_chat_room["id"])
+            # sender_type 하나만 보면 되므로 마지막 메시지만 조회 (O(N) 페이로드 방지)
+            messages = self.api_service.get_messages(
+                self.selected_chat_room["id"], limit=1
+            )
 
             # 메시지가 있고, 마지막 메시지가 user인 경우
             if messages and messages[-1]["sender_type"] == "user":
@@ -571,215 +910,328 @@ class ChatPage:
                 # 약간의 지연을 두고 실행 (UI 렌더링 완료 후)
                 ui.timer(0.1, lambda: self._restore_loading_delayed(), once=True)
 
-        except Exception as e:
-            print(f"Failed to restore loading state: {e}")
+        except Exception:
+            logger.exception("Failed to restore loading state")
 
     def _restore_loading_delayed(self):
         """로딩 상태 복원 (지연 실행)"""
         self.show_bot_loading()
+        self._flush_js()
         self.start_polling_for_bot_response()
 
-    def show_code_history_modal_with_node(self, file_path: str, line_info: str, node_name: str, node_type: str):
-        """코드 히스토리 모달 창 표시 (노드 이름 포함)"""
-        from nicegui import ui
-        import asyncio
+    def _history_cache_get(self, key):
+        """히스토리 응답 LRU 캐시 조회"""
+        response = self._history_cache.get(key)
+        if response is not None:
+            self._history_cache.move_to_end(key)
+        return response
+
+    def _history_cache_put(self, key, response):
+        """히스토리 응답을 LRU 캐시에 저장 (용량 초과 시 가장 오래된 항목 제거)"""
+        self._history_cache[key] = response
+        self._history_cache.move_to_end(key)
+        if len(self._history_cache) > _HISTORY_CACHE_MAX_SIZE:
+            self._history_cache.popitem(last=False)
+
+    def _prefetch_message_sources(self, messages):
+        """bot 응답에 인용된 노드들의 히스토리를 한 번의 배치 호출로 예열"""
+        queries = []
+        keys = []
+        for message in messages:
+            if len(queries) >= 10:  # 백엔드 배치 상한 (메시지 루프 전체에 적용)
+                break
+            if message.get("sender_type") != "bot":
+                continue
+            sources = _normalize_message(message)["_sources_parsed"] or []
+            for source in sources:
+                path, file_path, line_info, node_name, node_type = _parse_source(source)
+                if file_path is None or node_name is None:
+                    continue
+                cache_key = (self.repo_id, file_path, node_name, node_type)
+                if self._history_cache_get(cache_key) is not None or cache_key in keys:
+                    continue
+                keys.append(cache_key)
+                queries.append({
+                    "file_path": file_path,
+                    "node_name": node_name,
+                    "node_type": node_type
+                })
+                if len(queries) >= 10:  # 백엔드 배치 상한
+                    break
+
+        if not queries:
+            return
+
+        async def prefetch():
+            try:
+                results = await self.api_service.get_code_history_batch(self.repo_id, queries)
+                for key, response in zip(keys, results):
+                    if response.get("success"):
+                        self._history_cache_put(key, response)
+            except Exception:
+                # 예열 실패는 조용히 무시 (모달 열 때 다시 시도)
+                pass
+
+        asyncio.create_task(prefetch())
+
+    def _prefetch_history(self, file_path, line_info=None, node_name=None, node_type=None):
+        """
+        코드 링크 호버 시 히스토리를 미리 가져와 LRU 캐시를 채운다
+
+        150ms 지연 후 실행해 포인터가 스쳐 지나가는 호버로 인한
+        prefetch 폭주를 막는다. 실패는 조용히 무시한다 (클릭 시 재시도).
+        """
+        if node_name is not None:
+            cache_key = (self.repo_id, file_path, node_name, node_type)
+            kwargs = {'node_name': node_name, 'node_type': node_type}
+        else:
+            cache_key = (self.repo_id, file_path, line_info)
+            kwargs = {'line_info': line_info}
+
+        if self._history_cache_get(cache_key) is not None or cache_key in self._history_inflight:
+            return
+
+        async def fetch():
+            try:
+                await self._fetch_history(cache_key, file_path, **kwargs)
+            except Exception:
+                pass
 
-        # 모달 다이얼로그 생성
+        ui.timer(0.15, lambda: asyncio.create_task(fetch()), once=True)
+
+    async def _fetch_history(self, cache_key, file_path, **kwargs):
+        """
+        get_code_history 호출 (in-flight 중복 제거)
+
+        같은 키의 요청이 이미 진행 중이면 새 RPC를 보내지 않고 첫 호출의
+        결과를 함께 기다린다. 성공 응답은 LRU 캐시에 적재된다.
+        """
+        inflight = self._history_inflight.get(cache_key)
+        if inflight is not None:
+            return await inflight
+
+        future = asyncio.get_event_loop().create_future()
+        self._history_inflight[cache_key] = future
+        try:
+            response = await self.api_service.get_code_history(
+                self.repo_id, file_path, **kwargs
+            )
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            if response.get('success'):
+                self._history_cache_put(cache_key, response)
+            future.set_result(response)
+            return response
+        finally:
+            self._history_inflight.pop(cache_key, None)
+
+    def _build_history_dialog(self):
+        """
+        재사용 히스토리 다이얼로그 생성 (페이지 루트 슬롯에서 1회)
+
+        이벤트 핸들러 슬롯(메시지 목록 내부)에서 만들면 방 전환/이전
+        메시지 로드 시 함께 삭제되므로, render()가 안정적인 슬롯에서
+        만들어 둔다.
+        """
         with ui.dialog() as dialog, ui.card().style('width: 90%; max-width: 1200px; height: 80vh; display: flex; flex-direction: column;'):
             # 모달 헤더
             with ui.row().style('justify-content: space-between; align-items: center; padding: 16px; border-bottom: 1px solid #e5e7eb; background: linear-gradient(90deg, #f8fafc 0%, #e2e8f0 100%);'):
                 with ui.row().style('align-items: center; gap: 12px;'):
                     ui.html('<div style="font-size: 24px;">📖</div>')
-                    ui.html(f'<h3 style="margin: 0; font-size: 18px; font-weight: 600;">Code History: {file_path}</h3>')
+                    self._history_title = ui.html('')
                 ui.button(icon='close', on_click=dialog.close).props('flat')
 
-            # 로딩 상태
-            loading_container = ui.column().style('flex: 1; align-items: center; justify-content: center; padding: 24px;')
-            with loading_container:
-                ui.spinner(size='lg')
-                ui.html('<p style="margin-top: 16px; color: #6b7280;">Loading history...</p>')
+            # 동적 콘텐츠 영역
+            self._history_body = ui.column().style('flex: 1; align-items: center; justify-content: center; padding: 24px;')
 
-            # 비동기로 히스토리 데이터 로드
-            async def load_history():
-                try:
-                    # node_name이 이미 있으므로 직접 전달
-                    response = await self.api_service.get_code_history(
-                        self.repo_id,
-                        file_path,
-                        node_name=node_name,
-                        node_type=node_type
-                    )
+        self._history_dialog = dialog
 
-                    # 로딩 컨테이너 제거
-                    loading_container.clear()
-
-                    if response.get('success'):
-                        history = response.get('history', [])
-                        # response에서 실제 node_name과 node_type 가져오기
-                        actual_node_name = response.get('node_name', node_name)
-                        actual_node_type = response.get('node_type', node_type)
-
-                        if history:
-                            # 히스토리 컨텐츠 표시
-                            with loading_container:
-                                # 스크롤 가능한 컨테이너
-                                with ui.element('div').style('width: 100%; height: 100%; overflow-y: auto; padding: 16px;'):
-                                    ui.html(f'<p style="color: #374151; margin-bottom: 16px;">Found <strong>{len(history)}</strong> changes for {actual_node_type} <code>{actual_node_name}</code></p>')
-
-                                    # 각 변경사항 표시
-                                    for change in history:
-                                        with ui.card().style('margin-bottom: 16px; border: 1px solid #e5e7eb;'):
-                                            # 커밋 정보 헤더
-                                            with ui.row().style('padding: 12px; background: #f9fafb; border-bottom: 1px solid #e5e7eb; align-items: center; gap: 16px;'):
-                                                ui.html(f'<div style="background: #3b82f6; color: white; padding: 4px 8px; border-radius: 4px; font-family: monospace; font-size: 12px;">{change["commit_hash"]}</div>')
-                                                with ui.column().style('flex: 1;'):
-                                                    ui.html(f'<div style="font-weight: 600; color: #111827;">{change["commit_message"]}</div>')
-                                                    ui.html(f'<div style="font-size: 12px; color: #6b7280;">by {change["author"]} • {change["date"]}</div>')
-
-                                            # Diff 표시
-                                            if change.get('highlighted_diff'):
-                                                with ui.element('div').style('padding: 12px; background: #f9fafb;'):
-                                                    ui.html('<div style="font-size: 12px; font-weight: 600; color: #374151; margin-bottom: 8px;">Changes:</div>')
-                                                    with ui.element('pre').style('background: #1f2937; color: #f3f4f6; padding: 12px; border-radius: 4px; font-family: monospace; font-size: 12px; overflow-x: auto; margin: 0;'):
-                                                        # Diff를 HTML로 변환
-                                                        diff_html = self._format_diff_as_html(change['highlighted_diff'])
-                                                        ui.html(diff_html)
-                        else:
-                            # 히스토리가 없는 경우
-                            with loading_container:
-                                ui.html('<div style="text-align: center; padding: 48px;">')
-                                ui.html('<div style="font-size: 48px; color: #9ca3af; margin-bottom: 16px;">📭</div>')
-                                ui.html('<p style="color: #6b7280;">No history found for this code segment.</p>')
-                                ui.html('</div>')
-                    else:
-                        # 에러 처리
-                        with loading_container:
-                            ui.html('<div style="text-align: center; padding: 48px;">')
-                            ui.html('<div style="font-size: 48px; color: #ef4444; margin-bottom: 16px;">❌</div>')
-                            ui.html(f'<p style="color: #dc2626;">Failed to load history: {response.get("error", "Unknown error")}</p>')
-                            ui.html('</div>')
+    def _open_history_dialog(self, file_path: str):
+        """
+        재사용 가능한 히스토리 다이얼로그 열기
 
-                except Exception as e:
-                    # 예외 처리
-                    loading_container.clear()
-                    with loading_container:
-                        ui.html('<div style="text-align: center; padding: 48px;">')
-                        ui.html('<div style="font-size: 48px; color: #ef4444; margin-bottom: 16px;">⚠️</div>')
-                        ui.html(f'<p style="color: #dc2626;">An error occurred: {str(e)}</p>')
-                        ui.html('</div>')
+        다이얼로그와 정적 크롬(헤더, 닫기 버튼)은 render()가 만들어 둔
+        것을 재사용하고, 여기서는 제목과 본문만 교체한다.
 
-            # 비동기 작업 실행
-            asyncio.create_task(load_history())
+        Returns:
+            동적 콘텐츠가 들어갈 body 컨테이너
+        """
+        if self._history_dialog is None:
+            self._build_history_dialog()
 
-        # 모달 열기
-        dialog.open()
+        self._history_title.content = (
+            f'<h3 style="margin: 0; font-size: 18px; font-weight: 600;">Code History: {escape(file_path)}</h3>'
+        )
 
-    def show_code_history_modal(self, file_path: str, line_info: str):
-        """코드 히스토리 모달 창 표시"""
-        from nicegui import ui
-        import asyncio
+        # 로딩 상태
+        self._history_body.clear()
+        with self._history_body:
+            ui.spinner(size='lg')
+            ui.html('<p style="margin-top: 16px; color: #6b7280;">Loading history...</p>')
 
-        # 모달 다이얼로그 생성
-        with ui.dialog() as dialog, ui.card().style('width: 90%; max-width: 1200px; height: 80vh; display: flex; flex-direction: column;'):
-            # 모달 헤더
-            with ui.row().style('justify-content: space-between; align-items: center; padding: 16px; border-bottom: 1px solid #e5e7eb; background: linear-gradient(90deg, #f8fafc 0%, #e2e8f0 100%);'):
-                with ui.row().style('align-items: center; gap: 12px;'):
-                    ui.html('<div style="font-size: 24px;">📖</div>')
-                    ui.html(f'<h3 style="margin: 0; font-size: 18px; font-weight: 600;">Code History: {file_path}</h3>')
-                ui.button(icon='close', on_click=dialog.close).props('flat')
+        self._history_dialog.open()
+        return self._history_body
 
-            # 로딩 상태
-            loading_container = ui.column().style('flex: 1; align-items: center; justify-content: center; padding: 24px;')
-            with loading_container:
-                ui.spinner(size='lg')
-                ui.html('<p style="margin-top: 16px; color: #6b7280;">Loading history...</p>')
+    def show_code_history_modal_with_node(self, file_path: str, line_info: str, node_name: str, node_type: str):
+        """코드 히스토리 모달 창 표시 (노드 이름 포함)"""
+        self._render_history_modal(file_path, node_name=node_name, node_type=node_type)
 
-            # 비동기로 히스토리 데이터 로드
-            async def load_history():
-                try:
-                    # Backend API가 line_info를 받아서 자동으로 node_name을 찾도록 함
-                    # API 호출 (line_info 전달)
-                    response = await self.api_service.get_code_history(
-                        self.repo_id,
-                        file_path,
-                        line_info=line_info  # line_info 전달
-                    )
+    def show_code_history_modal(self, file_path: str, line_info: str):
+        """코드 히스토리 모달 창 표시 (line_info로 노드 자동 탐색)"""
+        self._render_history_modal(file_path, line_info=line_info)
+
+    def _render_history_modal(self, file_path: str, *, node_name=None, node_type=None, line_info=None):
+        """
+        코드 히스토리 모달의 공통 구현
+
+        node_name/node_type이 주어지면 해당 노드를 직접 조회하고, 없으면
+        line_info를 넘겨 백엔드가 노드를 찾게 한다. 두 공개 메서드는 이
+        코루틴 구동부의 얇은 래퍼다.
+        """
+        # 재사용 다이얼로그 열기 (로딩 상태 포함)
+        loading_container = self._open_history_dialog(file_path)
+
+        if node_name is not None:
+            cache_key = (self.repo_id, file_path, node_name, node_type)
+            fetch_kwargs = {'node_name': node_name, 'node_type': node_type}
+        else:
+            cache_key = (self.repo_id, file_path, line_info)
+            fetch_kwargs = {'line_info': line_info}
 
-                    # 로딩 컨테이너 제거
-                    loading_container.clear()
-
-                    if response.get('success'):
-                        history = response.get('history', [])
-                        # response에서 실제 node_name과 node_type 가져오기
-                        actual_node_name = response.get('node_name', 'unknown')
-                        actual_node_type = response.get('node_type', 'function')
-
-                        if history:
-                            # 히스토리 컨텐츠 표시
-                            with loading_container:
-                                # 스크롤 가능한 컨테이너
-                                with ui.element('div').style('width: 100%; height: 100%; overflow-y: auto; padding: 16px;'):
-                                    ui.html(f'<p style="color: #374151; margin-bottom: 16px;">Found <strong>{len(history)}</strong> changes for {actual_node_type} <code>{actual_node_name}</code></p>')
-
-                                    # 각 변경사항 표시
-                                    for change in history:
-                                        with ui.card().style('margin-bottom: 16px; border: 1px solid #e5e7eb;'):
-                                            # 커밋 정보 헤더
-                                            with ui.row().style('padding: 12px; background: #f9fafb; border-bottom: 1px solid #e5e7eb; align-items: center; gap: 16px;'):
-                                                ui.html(f'<div style="background: #3b82f6; color: white; padding: 4px 8px; border-radius: 4px; font-family: monospace; font-size: 12px;">{change["commit_hash"]}</div>')
-                                                with ui.column().style('flex: 1;'):
-                                                    ui.html(f'<div style="font-weight: 600; color: #111827;">{change["commit_message"]}</div>')
-                                                    ui.html(f'<div style="font-size: 12px; color: #6b7280;">by {change["author"]} • {change["date"]}</div>')
-
-                                            # Diff 표시
-                                            if change.get('highlighted_diff'):
-                                                with ui.element('div').style('padding: 12px; background: #f9fafb;'):
-                                                    ui.html('<div style="font-size: 12px; font-weight: 600; color: #374151; margin-bottom: 8px;">Changes:</div>')
-                                                    with ui.element('pre').style('background: #1f2937; color: #f3f4f6; padding: 12px; border-radius: 4px; font-family: monospace; font-size: 12px; overflow-x: auto; margin: 0;'):
-                                                        # Diff를 HTML로 변환
-                                                        diff_html = self._format_diff_as_html(change['highlighted_diff'])
-                                                        ui.html(diff_html)
-                        else:
-                            # 히스토리가 없는 경우
-                            with loading_container:
-                                ui.html('<div style="text-align: center; padding: 48px;">')
-                                ui.html('<div style="font-size: 48px; color: #9ca3af; margin-bottom: 16px;">📭</div>')
-                                ui.html('<p style="color: #6b7280;">No history found for this code segment.</p>')
-                                ui.html('</div>')
+        # 비동기로 히스토리 데이터 로드
+        async def load_history():
+            try:
+                # 재조회는 캐시에서, 진행 중인 요청은 공유해서 응답
+                response = self._history_cache_get(cache_key)
+                if response is None:
+                    response = await self._fetch_history(cache_key, file_path, **fetch_kwargs)
+
+                # 로딩 컨테이너 제거
+                loading_container.clear()
+
+                if response.get('success'):
+                    history = response.get('history', [])
+                    # response에서 실제 node_name과 node_type 가져오기
+                    actual_node_name = response.get('node_name', node_name or 'unknown')
+                    actual_node_type = response.get('node_type', node_type or 'function')
+
+                    if history:
+                        # 히스토리 컨텐츠 표시
+                        with loading_container:
+                            # 스크롤 가능한 컨테이너
+                            with ui.element('div').style('width: 100%; height: 100%; overflow-y: auto; padding: 16px;') as scroll_container:
+                                ui.html(f'<p style="color: #374151; margin-bottom: 16px;">Found <strong>{len(history)}</strong> changes for {actual_node_type} <code>{actual_node_name}</code></p>')
+
+                                # 각 변경사항을 페이지 단위로 표시 (첫 페인트 단축)
+                                total = response.get('total', len(history))
+                                result_task_id = response.get('task_id')
+
+                                def render_fetch_rest(fetched=len(history), total=total, task_id=result_task_id):
+                                    """로컬 페이지 소진 시 서버에 남은 구간을 가져오는 버튼"""
+                                    if not task_id or total <= fetched:
+                                        return
+
+                                    with ui.row().style('justify-content: center; width: 100%;') as fetch_row:
+                                        async def fetch_rest():
+                                            fetch_row.delete()
+                                            more = await self.api_service.get_code_history_page(
+                                                task_id, offset=fetched
+                                            )
+                                            self._render_history_cards(
+                                                scroll_container, more.get('history', [])
+                                            )
+
+                                        ui.button(f'나머지 {total - fetched}개 불러오기', on_click=fetch_rest).props('flat dense')
+
+                                self._render_history_cards(
+                                    scroll_container, history, on_exhausted=render_fetch_rest
+                                )
                     else:
-                        # 에러 처리
+                        # 히스토리가 없는 경우
                         with loading_container:
                             ui.html('<div style="text-align: center; padding: 48px;">')
-                            ui.html('<div style="font-size: 48px; color: #ef4444; margin-bottom: 16px;">❌</div>')
-                            ui.html(f'<p style="color: #dc2626;">Failed to load history: {response.get("error", "Unknown error")}</p>')
+                            ui.html('<div style="font-size: 48px; color: #9ca3af; margin-bottom: 16px;">📭</div>')
+                            ui.html('<p style="color: #6b7280;">No history found for this code segment.</p>')
                             ui.html('</div>')
-
-                except Exception as e:
-                    # 예외 처리
-                    loading_container.clear()
+                else:
+                    # 에러 처리
                     with loading_container:
                         ui.html('<div style="text-align: center; padding: 48px;">')
-                        ui.html('<div style="font-size: 48px; color: #ef4444; margin-bottom: 16px;">⚠️</div>')
-                        ui.html(f'<p style="color: #dc2626;">An error occurred: {str(e)}</p>')
+                        ui.html('<div style="font-size: 48px; color: #ef4444; margin-bottom: 16px;">❌</div>')
+                        ui.html(f'<p style="color: #dc2626;">Failed to load history: {response.get("error", "Unknown error")}</p>')
                         ui.html('</div>')
 
-            # 비동기 작업 실행
-            asyncio.create_task(load_history())
-
-        # 모달 열기
-        dialog.open()
-
-    def _format_diff_as_html(self, diff_text: str) -> str:
-        """Diff 텍스트를 HTML로 포맷팅"""
-        lines = diff_text.split('\n')
-        formatted_lines = []
+            except Exception as e:
+                # 예외 처리
+                loading_container.clear()
+                with loading_container:
+                    ui.html('<div style="text-align: center; padding: 48px;">')
+                    ui.html('<div style="font-size: 48px; color: #ef4444; margin-bottom: 16px;">⚠️</div>')
+                    ui.html(f'<p style="color: #dc2626;">An error occurred: {str(e)}</p>')
+                    ui.html('</div>')
+
+        # 비동기 작업 실행
+        asyncio.create_task(load_history())
+
+    def _render_history_cards(self, container, history, start=0, on_exhausted=None):
+        """
+        히스토리 카드를 페이지 단위로 렌더링
+
+        다이얼로그는 한 화면에 몇 개만 보이므로 처음 _HISTORY_PAGE_SIZE개만
+        만들고, 나머지는 '더 보기' 버튼으로 요청 시 이어서 렌더링한다.
+        로컬 목록을 다 그렸을 때 on_exhausted가 있으면 (서버에 남은 구간을
+        가져오는 버튼 등) 이어서 호출한다.
+        """
+        end = min(start + _HISTORY_PAGE_SIZE, len(history))
+
+        with container:
+            # 페이지의 모든 카드를 한 번의 ui.html로 전송 (요소/왕복을 페이지당 1회로)
+            card_htmls = []
+            for change in history[start:end]:
+                # diff는 원문을 그대로 실어 보내고 색상 입히기는 브라우저 renderDiff가 수행
+                diff_html = ''
+                if change.get('highlighted_diff'):
+                    diff_html = _HISTORY_DIFF_TEMPLATE % {
+                        'diff': escape(change['highlighted_diff'])
+                    }
+
+                card_htmls.append(_HISTORY_CARD_TEMPLATE % {
+                    'hash': change["commit_hash"],
+                    'message': escape(change["commit_message"]),
+                    'author': escape(change["author"]),
+                    'date': change["date"],
+                    'diff': diff_html
+                })
+
+            if card_htmls:
+                ui.html('\n'.join(card_htmls))
+
+            if end < len(history):
+                with ui.row().style('justify-content: center; width: 100%;') as more_row:
+                    def load_more(row=more_row, next_start=end):
+                        row.delete()
+                        self._render_history_cards(
+                            container, history, next_start, on_exhausted=on_exhausted
+                        )
+
+                    ui.button(f'더 보기 ({len(history) - end}개 남음)', on_click=load_more).props('flat dense')
+            elif on_exhausted is not None:
+                on_exhausted()
+
+            # 마운트된 diff 블록에 브라우저 측 렌더러 적용 (페이지당 1회)
+            ui.run_javascript(
+                'document.querySelectorAll("pre[data-diff]").forEach(renderDiff)'
+            )
 
-        for line in lines:
-            if line.startswith('+'):
-                formatted_lines.append(f'<span style="color: #10b981;">+ {line[1:]}</span>')
-            elif line.startswith('-'):
-                formatted_lines.append(f'<span style="color: #ef4444;">- {line[1:]}</span>')
-            else:
-                formatted_lines.append(f'<span style="color: #9ca3af;">{line}</span>')
+    @staticmethod
+    def _format_diff_as_html(diff_text: str) -> str:
+        """
+        Diff 텍스트를 HTML로 포맷팅 (서버 측 폴백)
 
-        return '<br>'.join(formatted_lines)
\ No newline at end of file
+        기본 경로는 브라우저의 renderDiff가 담당하며, 이 함수는 클라이언트
+        렌더러를 쓸 수 없는 경로를 위해 유지된다. rebase/cherry-pick으로
+        반복되는 동일 diff는 입력 문자열 기준으로 메모이즈된다.
+        """
+        return _format_diff_cached(diff_text)
\ No newline at end of file
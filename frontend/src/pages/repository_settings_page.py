@@ -1,66 +1,207 @@
+import asyncio
+from html import escape
+
 from nicegui import ui
 from frontend.src.components.header import Header
 from frontend.src.services.api_service import APIService
 
+# 사이드바에서 한 번에 렌더링하는 repository 항목 수
+_SIDEBAR_PAGE_SIZE = 50
+
+# 상태별 색상 테이블 (호출마다 dict를 재생성하지 않도록 모듈 수준 상수)
+_SIDEBAR_STATUS_COLORS = {
+    'pending': 'background-color: #fef3c7; color: #92400e;',
+    'syncing': 'background-color: #fef3c7; color: #92400e;',
+    'active': 'background-color: #d1fae5; color: #065f46;',
+    'error': 'background-color: #fee2e2; color: #991b1b;'
+}
+_BADGE_STATUS_COLORS = {
+    'active': 'bg-green-100 text-green-800',
+    'syncing': 'bg-yellow-100 text-yellow-800',
+    'error': 'bg-red-100 text-red-800'
+}
+_VECTORDB_STATUS_COLORS = {
+    'healthy': 'bg-green-100 text-green-800',
+    'syncing': 'bg-yellow-100 text-yellow-800',
+    'error': 'bg-red-100 text-red-800'
+}
+
+
 class RepositorySettingsPage:
     def __init__(self, auth_service, selected_repo_id: str = None):
         self.auth_service = auth_service
         self.api_service = APIService(auth_service=auth_service)
         self.repo_containers = {}  # UI 컨테이너들을 저장할 딕셔너리
-        try:
-            repositories = self.api_service.get_repositories()
-
-            # URL 파라미터로 전달된 repo_id가 있으면 해당 repository 선택
-            if selected_repo_id:
-                self.selected_repo = next((repo for repo in repositories if str(repo["id"]) == selected_repo_id), None)
-                # 못 찾으면 첫 번째 선택
-                if not self.selected_repo:
-                    self.selected_repo = repositories[0] if repositories else None
-            else:
-                self.selected_repo = repositories[0] if repositories else None
-        except Exception as e:
-            ui.notify(f"Failed to load repositories: {str(e)}", type='negative')
-            self.selected_repo = None
+        self._detail_elements = {}  # 상세 영역의 값 요소 (선택 변경 시 내용만 교체)
+        self._prev_selected_id = None  # 사이드바에서 직전에 선택됐던 항목
+        self._select_task = None  # 빠른 연속 클릭 디바운스용 태스크
+        self._members_cache = {}  # repo_id -> 멤버 목록 (병렬 예열로 채움)
+        # 상태 폴링: repo 수와 무관하게 공유 타이머 1개 + 배치 요청 1개
+        self._status_watchers = {}  # repo_id -> 상태 콜백
+        self._status_timer = None
+        # 폴링 간격 (지수 백오프: 1s에서 시작, 상태 변화가 없으면 최대 10s까지)
+        self._status_poll_interval = 1.0
+        self._last_statuses = {}  # repo_id -> 마지막으로 관찰한 (status, vectordb_status)
+        # 첫 페인트를 막지 않도록 목록 조회는 render 이후 백그라운드에서 수행
+        self._selected_repo_id = selected_repo_id
+        self._repositories = []
+        self.selected_repo = None
 
     def render(self):
+        # 사이드바 항목 스타일은 클래스로 1회 정의 (항목/클릭마다 긴 인라인 CSS 전송 방지)
+        ui.add_head_html('''
+            <style>
+                .repo-item {
+                    width: 100%;
+                    padding: 12px;
+                    margin-bottom: 8px;
+                    border-radius: 8px;
+                    cursor: pointer;
+                    border: 1px solid #e5e7eb;
+                    background-color: white;
+                }
+                .repo-item-selected {
+                    width: 100%;
+                    padding: 12px;
+                    margin-bottom: 8px;
+                    border-radius: 8px;
+                    cursor: pointer;
+                    border: 2px solid #3b82f6;
+                    background-color: #dbeafe;
+                }
+            </style>
+        ''')
+
+        # 인증 상태는 렌더 패스당 1회만 조회 (사이드바/액션/멤버 루프가 재사용)
+        self._is_admin = self.auth_service.is_admin()
+        self._current_user = self.auth_service.get_current_user()
+
         with ui.column().style('width: 100%; min-height: 100vh; margin: 0; padding: 0;'):
             Header(self.auth_service).render()
 
-            with ui.row().style('width: 100%; height: calc(100vh - 60px); margin: 0; padding: 0;'):
-                self.render_sidebar()
-                self.render_main_content()
+            self._page_row = ui.row().style('width: 100%; height: calc(100vh - 60px); margin: 0; padding: 0;')
+            with self._page_row:
+                # 데이터 도착 전 스켈레톤 (첫 페인트 비차단)
+                with ui.column().style('width: 100%; height: 100%; display: flex; align-items: center; justify-content: center;'):
+                    ui.spinner(size='lg')
+                    ui.html('<p style="margin-top: 16px; color: #6b7280;">Loading repositories...</p>')
 
-    def render_sidebar(self):
-        with ui.column().style('width: 320px; height: 100%; background-color: #f8fafc; border-right: 1px solid #e2e8f0; padding: 24px; overflow-y: auto;'):
-            ui.html('<h2 style="font-size: 20px; font-weight: 600; margin-bottom: 16px;">Repositories</h2>')
+        # 목록 조회와 페이지 채우기는 백그라운드에서 수행
+        asyncio.create_task(self._load_and_hydrate())
 
-            if self.auth_service.is_admin():
-                ui.button('➕ Add New Repository', on_click=self.show_add_repository_dialog).style('width: 100%; background-color: #3b82f6; color: white; padding: 8px 16px; border-radius: 6px; border: none; margin-bottom: 16px;')
+    async def _load_and_hydrate(self):
+        """repository 목록을 받아와 스켈레톤을 실제 콘텐츠로 교체"""
+        try:
+            repositories = await self.api_service.get_repositories_async()
+        except Exception as e:
+            ui.notify(f"Failed to load repositories: {str(e)}", type='negative')
+            repositories = []
+
+        self._repositories = repositories
+
+        # URL 파라미터로 전달된 repo_id가 있으면 해당 repository 선택
+        if self._selected_repo_id:
+            self.selected_repo = next((repo for repo in repositories if str(repo["id"]) == self._selected_repo_id), None)
+            # 못 찾으면 첫 번째 선택
+            if not self.selected_repo:
+                self.selected_repo = repositories[0] if repositories else None
+        else:
+            self.selected_repo = repositories[0] if repositories else None
+
+        self._page_row.clear()
+        with self._page_row:
+            self.render_sidebar()
+            self.render_main_content()
+
+        # 부가 데이터(멤버 목록, 최신 상태)를 병렬로 예열
+        if self.selected_repo:
+            asyncio.create_task(self._warm_caches(self.selected_repo["id"]))
 
+    async def _warm_caches(self, repo_id):
+        """선택된 repository의 멤버와 최신 상태를 병렬로 조회 (직렬 왕복 제거)"""
+        try:
+            members, status_data = await asyncio.gather(
+                self.api_service.get_repository_members_async(repo_id),
+                self.api_service.get_repository_status_async(repo_id)
+            )
+        except Exception:
+            # 예열 실패는 조용히 무시 (필요 시점에 다시 조회)
+            return
+
+        self._members_cache[repo_id] = members
+
+        # 목록 조회 이후 상태가 바뀌었으면 배지를 최신으로 갱신
+        if self.selected_repo and self.selected_repo["id"] == repo_id and status_data.get("status"):
+            self.selected_repo["status"] = status_data["status"]
+            self.selected_repo["vectordb_status"] = status_data.get("vectordb_status", self.selected_repo.get("vectordb_status"))
+            if self._detail_elements:
+                self._detail_elements['status_badge'].set_content(self._status_badge_html(self.selected_repo["status"]))
+                self._detail_elements['vectordb_badge'].set_content(self._vectordb_status_html(self.selected_repo["vectordb_status"]))
+
+    def _get_repositories(self):
+        """캐시된 repository 목록 반환 (무효화된 경우에만 재조회)"""
+        if self._repositories is None:
             try:
-                repositories = self.api_service.get_repositories()
+                self._repositories = self.api_service.get_repositories()
             except Exception as e:
                 ui.notify(f"Failed to load repositories: {str(e)}", type='negative')
-                repositories = []
+                self._repositories = []
+        return self._repositories
 
-            for repo in repositories:
-                # 디버깅: 에러 상태 레포지토리 로깅
-                if repo.get("status") == "error":
-                    print(f"[DEBUG] Error repository: {repo.get('name')}")
-                    print(f"[DEBUG] Error message: {repo.get('error_message')}")
-                    print(f"[DEBUG] Full repo data: {repo}")
-                self.render_repository_item(repo)
+    def _invalidate_repositories(self):
+        """생성/삭제/동기화 완료 후 캐시 무효화 (다음 접근 시 재조회)"""
+        self._repositories = None
+
+    @ui.refreshable
+    def render_sidebar(self):
+        with ui.column().style('width: 320px; height: 100%; background-color: #f8fafc; border-right: 1px solid #e2e8f0; padding: 24px; overflow: hidden;'):
+            ui.html('<h2 style="font-size: 20px; font-weight: 600; margin-bottom: 16px;">Repositories</h2>')
+
+            if self._is_admin:
+                ui.button('➕ Add New Repository', on_click=self.show_add_repository_dialog).style('width: 100%; background-color: #3b82f6; color: white; padding: 8px 16px; border-radius: 6px; border: none; margin-bottom: 16px;')
+
+            repositories = self._get_repositories()
+
+            # 대량 목록 대응: 처음엔 한 페이지만 만들고 스크롤 시 이어서 렌더링
+            self._sidebar_rendered_count = 0
+            with ui.scroll_area(on_scroll=self._on_sidebar_scroll).style('flex: 1; width: 100%;'):
+                self._sidebar_items_container = ui.column().style('width: 100%;')
+                with self._sidebar_items_container:
+                    self._render_sidebar_page(repositories)
+
+    def _render_sidebar_page(self, repositories):
+        """사이드바 항목을 한 페이지 분량 렌더링"""
+        start = self._sidebar_rendered_count
+        end = min(start + _SIDEBAR_PAGE_SIZE, len(repositories))
+
+        for repo in repositories[start:end]:
+            # 디버깅: 에러 상태 레포지토리 로깅
+            if repo.get("status") == "error":
+                print(f"[DEBUG] Error repository: {repo.get('name')}")
+                print(f"[DEBUG] Error message: {repo.get('error_message')}")
+                print(f"[DEBUG] Full repo data: {repo}")
+            self.render_repository_item(repo)
+
+        self._sidebar_rendered_count = end
+
+    def _on_sidebar_scroll(self, e):
+        """스크롤이 하단에 가까워지면 다음 페이지 렌더링"""
+        repositories = self._get_repositories()
+        if self._sidebar_rendered_count >= len(repositories):
+            return
+        if getattr(e, 'vertical_percentage', 0) < 0.9:
+            return
+
+        with self._sidebar_items_container:
+            self._render_sidebar_page(repositories)
 
     def render_repository_item(self, repo):
         is_selected = self.selected_repo and self.selected_repo["id"] == repo["id"]
 
-        if is_selected:
-            item_style = 'width: 100%; padding: 12px; margin-bottom: 8px; border-radius: 8px; cursor: pointer; border: 2px solid #3b82f6; background-color: #dbeafe;'
-        else:
-            item_style = 'width: 100%; padding: 12px; margin-bottom: 8px; border-radius: 8px; cursor: pointer; border: 1px solid #e5e7eb; background-color: white;'
-
         # Create a container that will be refreshed when selection changes
-        container = ui.column().style(item_style).on('click', lambda r=repo: self.select_repository(r))
+        container = ui.column().classes(
+            'repo-item-selected' if is_selected else 'repo-item'
+        ).on('click', lambda r=repo: self.select_repository(r))
 
         with container:
             # Repository name과 status badge
@@ -69,13 +210,7 @@ class RepositorySettingsPage:
                 ui.html(f'<span style="font-weight: 600;">{repo["name"]}</span>')
                 # Status badge
                 status = repo.get("status", "active")
-                status_colors = {
-                    'pending': 'background-color: #fef3c7; color: #92400e;',
-                    'syncing': 'background-color: #fef3c7; color: #92400e;',
-                    'active': 'background-color: #d1fae5; color: #065f46;',
-                    'error': 'background-color: #fee2e2; color: #991b1b;'
-                }
-                status_style = status_colors.get(status, 'background-color: #e5e7eb; color: #374151;')
+                status_style = _SIDEBAR_STATUS_COLORS.get(status, 'background-color: #e5e7eb; color: #374151;')
                 ui.html(f'<span style="{status_style} padding: 2px 8px; border-radius: 9999px; font-size: 10px; font-weight: 600;">{status.upper()}</span>')
 
             # 에러 메시지 표시 (에러 상태일 때만) - description 위에 표시
@@ -97,7 +232,10 @@ class RepositorySettingsPage:
 
         # Store reference for later updates
         self.repo_containers[repo["id"]] = container
+        if is_selected:
+            self._prev_selected_id = repo["id"]
 
+    @ui.refreshable
     def render_main_content(self):
         self.main_content_container = ui.column().style('flex: 1; height: 100%; padding: 24px; overflow-y: auto; background-color: white;')
         with self.main_content_container:
@@ -114,14 +252,18 @@ class RepositorySettingsPage:
 
     def render_repository_details(self):
         repo = self.selected_repo
+        # 선택 변경 시 재구축 대신 내용만 갱신할 수 있도록 값 요소를 보관
+        self._detail_elements = {}
 
         with ui.column().style('width: 100%; gap: 24px;'):
             # Header section
             with ui.row().style('width: 100%; display: flex; align-items: center; justify-content: space-between; margin-bottom: 24px;'):
                 with ui.row().style('display: flex; align-items: center; gap: 12px;'):
                     ui.html('<span style="color: #2563eb; font-size: 32px;">📁</span>')
-                    ui.html(f'<h2 style="font-size: 24px; font-weight: 700; margin: 0;">{repo["name"]}</h2>')
-                    self.render_status_badge(repo["status"])
+                    self._detail_elements['name'] = ui.html(
+                        f'<h2 style="font-size: 24px; font-weight: 700; margin: 0;">{escape(repo["name"])}</h2>'
+                    )
+                    self._detail_elements['status_badge'] = self.render_status_badge(repo["status"])
 
 
             # Content section
@@ -130,37 +272,53 @@ class RepositorySettingsPage:
                 self.render_sync_status()
                 self.render_quick_actions()
 
+    def _info_items(self, repo):
+        """상세 정보 표의 (라벨, 값) 목록 구성"""
+        # owner 정보는 User 객체에서 가져와야 하므로 임시로 owner_id 표시
+        owner_display = repo.get("owner", "Unknown")
+
+        # created_at과 last_sync는 datetime 객체일 수도 있고 None일 수도 있음
+        # 표시용 포맷은 repo dict에 1회만 계산해 보관 (클릭마다 strftime 방지)
+        if "_created_display" not in repo:
+            created_at = repo.get("created_at")
+            repo["_created_display"] = created_at.strftime("%b %d, %Y") if created_at else "N/A"
+        if "_last_sync_display" not in repo:
+            last_sync = repo.get("last_sync")
+            repo["_last_sync_display"] = last_sync.strftime("%b %d, %Y at %H:%M") if last_sync else "Not synced yet"
+
+        return [
+            ("Owner", owner_display),
+            ("URL", repo.get("url", "")),
+            ("File Count", f'{repo.get("file_count", 0):,}'),
+            ("Collections", f'{repo.get("collections_count", 0):,}'),
+            ("Created", repo["_created_display"]),
+            ("Last Sync", repo["_last_sync_display"])
+        ]
+
+    def _info_table_html(self, repo):
+        """정보 표 전체를 단일 HTML 문자열로 생성 (사용자 값은 이스케이프)"""
+        rows = []
+        for label, value in self._info_items(repo):
+            if label == "URL":
+                safe = escape(str(value), quote=True)
+                cell = f'<a href="{safe}" target="_blank" style="color: #2563eb; text-decoration: none;">{safe}</a>'
+            else:
+                cell = f'<span style="color: #6b7280;">{escape(str(value))}</span>'
+            rows.append(
+                '<tr style="border-bottom: 1px solid #f3f4f6;">'
+                f'<td style="font-weight: 500; color: #374151; padding: 8px 0;">{label}</td>'
+                f'<td style="padding: 8px 0; text-align: right;">{cell}</td>'
+                '</tr>'
+            )
+        return '<table style="width: 100%; border-collapse: collapse;">' + ''.join(rows) + '</table>'
+
     def render_repository_info(self):
         repo = self.selected_repo
         with ui.column().style('background-color: white; border: 1px solid #e5e7eb; border-radius: 8px; padding: 20px;'):
             ui.html('<h3 style="font-size: 18px; font-weight: 600; margin-bottom: 16px;">Repository Information</h3>')
 
-            # owner 정보는 User 객체에서 가져와야 하므로 임시로 owner_id 표시
-            owner_display = repo.get("owner", "Unknown")
-
-            # created_at과 last_sync는 datetime 객체일 수도 있고 None일 수도 있음
-            created_at = repo.get("created_at")
-            last_sync = repo.get("last_sync")
-
-            created_display = created_at.strftime("%b %d, %Y") if created_at else "N/A"
-            last_sync_display = last_sync.strftime("%b %d, %Y at %H:%M") if last_sync else "Not synced yet"
-
-            info_items = [
-                ("Owner", owner_display),
-                ("URL", repo.get("url", "")),
-                ("File Count", f'{repo.get("file_count", 0):,}'),
-                ("Collections", f'{repo.get("collections_count", 0):,}'),
-                ("Created", created_display),
-                ("Last Sync", last_sync_display)
-            ]
-
-            for label, value in info_items:
-                with ui.row().style('display: flex; justify-content: space-between; align-items: center; padding: 8px 0; border-bottom: 1px solid #f3f4f6;'):
-                    ui.html(f'<span style="font-weight: 500; color: #374151;">{label}</span>')
-                    if label == "URL":
-                        ui.html(f'<a href="{value}" target="_blank" style="color: #2563eb; text-decoration: none;">{value}</a>')
-                    else:
-                        ui.html(f'<span style="color: #6b7280;">{value}</span>')
+            # 행당 3개 요소 대신 표 전체를 단일 요소로 전송
+            self._detail_elements['info_table'] = ui.html(self._info_table_html(repo))
 
     def render_sync_status(self):
         repo = self.selected_repo
@@ -169,11 +327,13 @@ class RepositorySettingsPage:
 
             with ui.row().style('display: flex; justify-content: space-between; align-items: center; padding: 8px 0; border-bottom: 1px solid #f3f4f6;'):
                 ui.html('<span style="font-weight: 500; color: #374151;">Vector Database</span>')
-                self.render_vectordb_status(repo["vectordb_status"])
+                self._detail_elements['vectordb_badge'] = self.render_vectordb_status(repo["vectordb_status"])
 
             with ui.row().style('display: flex; justify-content: space-between; align-items: center; padding: 8px 0; border-bottom: 1px solid #f3f4f6;'):
                 ui.html('<span style="font-weight: 500; color: #374151;">Collections</span>')
-                ui.html(f'<span style="color: #6b7280;">{repo["collections_count"]} active</span>')
+                self._detail_elements['collections'] = ui.html(
+                    f'<span style="color: #6b7280;">{repo["collections_count"]} active</span>'
+                )
 
     def render_quick_actions(self):
         with ui.column().style('background-color: white; border: 1px solid #e5e7eb; border-radius: 8px; padding: 20px;'):
@@ -182,7 +342,7 @@ class RepositorySettingsPage:
             # Admin actions
             actions = []
 
-            if self.auth_service.is_admin():
+            if self._is_admin:
                 actions.extend([
                     ("🔄 Sync Repository", lambda: self.sync_repository()),
                     ("👥 Manage Members", lambda: self.show_members_dialog()),
@@ -196,59 +356,79 @@ class RepositorySettingsPage:
         with ui.column().style('background-color: white; border: 1px solid #e5e7eb; border-radius: 8px; padding: 20px;'):
             ui.html('<h3 style="font-size: 18px; font-weight: 600; margin-bottom: 16px;">Members</h3>')
 
-            try:
-                members = self.api_service.get_repository_members(self.selected_repo["id"])[:3]
-            except Exception as e:
-                ui.notify(f"Failed to load members: {str(e)}", type='negative')
-                members = []
+            # 예열된 캐시를 우선 사용, 없으면 한 번만 조회
+            members = self._members_cache.get(self.selected_repo["id"])
+            if members is None:
+                try:
+                    members = self.api_service.get_repository_members(self.selected_repo["id"])
+                    self._members_cache[self.selected_repo["id"]] = members
+                except Exception as e:
+                    ui.notify(f"Failed to load members: {str(e)}", type='negative')
+                    members = []
 
-            for member in members:
+            for member in members[:3]:
                 with ui.row().style('display: flex; align-items: center; gap: 12px; margin-bottom: 12px;'):
                     ui.html('<div style="width: 32px; height: 32px; background-color: #dbeafe; color: #2563eb; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 14px;">👤</div>')
                     ui.html(f'<div><div style="font-weight: 500;">{member["username"]}</div><div style="font-size: 12px; color: #6b7280;">{member["role"]}</div></div>')
 
-            try:
-                total_members = len(self.api_service.get_repository_members(self.selected_repo["id"]))
-                if total_members > 3:
-                    ui.html(f'<div style="text-align: center; font-size: 12px; color: #6b7280;">... and {total_members - 3} more</div>')
-            except Exception as e:
-                pass
+            if len(members) > 3:
+                ui.html(f'<div style="text-align: center; font-size: 12px; color: #6b7280;">... and {len(members) - 3} more</div>')
+
+    def _status_badge_html(self, status):
+        return f'<span class="px-3 py-1 rounded-full text-sm {_BADGE_STATUS_COLORS.get(status, "bg-gray-100 text-gray-800")}">{status}</span>'
 
     def render_status_badge(self, status):
-        colors = {
-            'active': 'bg-green-100 text-green-800',
-            'syncing': 'bg-yellow-100 text-yellow-800',
-            'error': 'bg-red-100 text-red-800'
-        }
-        ui.html(f'<span class="px-3 py-1 rounded-full text-sm {colors.get(status, "bg-gray-100 text-gray-800")}">{status}</span>')
+        return ui.html(self._status_badge_html(status))
+
+    def _vectordb_status_html(self, status):
+        return f'<span class="px-2 py-1 rounded-full text-xs {_VECTORDB_STATUS_COLORS.get(status, "bg-gray-100 text-gray-800")}">{status}</span>'
 
     def render_vectordb_status(self, status):
-        colors = {
-            'healthy': 'bg-green-100 text-green-800',
-            'syncing': 'bg-yellow-100 text-yellow-800',
-            'error': 'bg-red-100 text-red-800'
-        }
-        ui.html(f'<span class="px-2 py-1 rounded-full text-xs {colors.get(status, "bg-gray-100 text-gray-800")}">{status}</span>')
+        return ui.html(self._vectordb_status_html(status))
 
     def select_repository(self, repo):
-        self.selected_repo = repo
+        # 같은 항목 재클릭은 무시
+        if self.selected_repo and self.selected_repo["id"] == repo["id"]:
+            return
 
-        # Update sidebar selection appearance
-        for repo_id, container in self.repo_containers.items():
-            if repo_id == repo["id"]:
-                # Selected style
-                container.style('width: 100%; padding: 12px; margin-bottom: 8px; border-radius: 8px; cursor: pointer; border: 2px solid #3b82f6; background-color: #dbeafe;')
-            else:
-                # Unselected style
-                container.style('width: 100%; padding: 12px; margin-bottom: 8px; border-radius: 8px; cursor: pointer; border: 1px solid #e5e7eb; background-color: white;')
+        # 빠른 연속 클릭은 마지막 클릭만 렌더링 (50ms 디바운스)
+        if self._select_task is not None and not self._select_task.done():
+            self._select_task.cancel()
+        self._select_task = asyncio.create_task(self._do_select(repo))
 
-        # Update the main content area
-        self.main_content_container.clear()
-        with self.main_content_container:
-            if not self.selected_repo:
-                self.render_empty_state()
-            else:
-                self.render_repository_details()
+    async def _do_select(self, repo):
+        """디바운스 후 실제 선택 처리"""
+        await asyncio.sleep(0.05)
+
+        previous_id = self._prev_selected_id
+        self.selected_repo = repo
+        self._prev_selected_id = repo["id"]
+
+        # 선택이 바뀐 두 항목만 클래스 교체 (와이어에는 짧은 클래스명만 전송)
+        if previous_id is not None and previous_id != repo["id"] and previous_id in self.repo_containers:
+            self.repo_containers[previous_id].classes(replace='repo-item')
+        if repo["id"] in self.repo_containers:
+            self.repo_containers[repo["id"]].classes(replace='repo-item-selected')
+
+        # 상세 영역은 재구축하지 않고 값 요소의 내용만 갱신
+        # (빈 상태에서 처음 선택될 때만 refreshable로 전체 재렌더링)
+        if self._detail_elements:
+            self._refresh_details(repo)
+        else:
+            self.render_main_content.refresh()
+
+    def _refresh_details(self, repo):
+        """보관된 값 요소들의 내용만 교체 (위젯 재생성 없음)"""
+        elements = self._detail_elements
+        elements['name'].set_content(
+            f'<h2 style="font-size: 24px; font-weight: 700; margin: 0;">{escape(repo["name"])}</h2>'
+        )
+        elements['status_badge'].set_content(self._status_badge_html(repo["status"]))
+        elements['vectordb_badge'].set_content(self._vectordb_status_html(repo["vectordb_status"]))
+        elements['collections'].set_content(
+            f'<span style="color: #6b7280;">{repo["collections_count"]} active</span>'
+        )
+        elements['info_table'].set_content(self._info_table_html(repo))
 
     def show_add_repository_dialog(self):
         with ui.dialog() as dialog, ui.card().classes('w-96'):
@@ -285,6 +465,10 @@ class RepositorySettingsPage:
             ui.notify(f'Repository "{repo_name}" added successfully! Processing...', color='green')
             dialog.close()
 
+            # 새 repository가 목록에 반영되도록 캐시 무효화 후 사이드바만 재렌더링
+            self._invalidate_repositories()
+            self.render_sidebar.refresh()
+
             # 상태 체크를 위한 타이머 시작 (reload 전에)
             self.start_repository_status_check(created_repo['id'], repo_name)
 
@@ -300,73 +484,109 @@ class RepositorySettingsPage:
                     pass
             ui.notify(f'Failed to add repository: {error_detail}', color='red', timeout=10000)
 
+    def _watch_repository_status(self, repo_id: str, callback):
+        """공유 폴링 타이머에 상태 감시 콜백 등록"""
+        self._status_watchers[repo_id] = callback
+        # 새 감시가 시작되면 짧은 간격부터 다시 시작
+        self._status_poll_interval = 1.0
+        if self._status_timer is None:
+            self._status_timer = ui.timer(self._status_poll_interval, self._poll_statuses, once=True)
+
+    def _unwatch_repository_status(self, repo_id: str):
+        """상태 감시 해제 (감시 대상이 없으면 타이머 중지)"""
+        self._status_watchers.pop(repo_id, None)
+        if not self._status_watchers and self._status_timer is not None:
+            self._status_timer.active = False
+            self._status_timer = None
+
+    def _poll_statuses(self):
+        """감시 중인 모든 repository의 상태를 한 번의 배치 요청으로 조회"""
+        self._status_timer = None
+        if not self._status_watchers:
+            return
+
+        changed = False
+        try:
+            statuses = self.api_service.get_repository_statuses(list(self._status_watchers))
+        except Exception as e:
+            print(f"Status poll error: {e}")
+        else:
+            by_id = {str(status["repo_id"]): status for status in statuses}
+            for repo_id, callback in list(self._status_watchers.items()):
+                status_data = by_id.get(str(repo_id))
+                if status_data is None:
+                    continue
+                state = (status_data.get('status'), status_data.get('vectordb_status'))
+                if self._last_statuses.get(repo_id) != state:
+                    self._last_statuses[repo_id] = state
+                    changed = True
+                callback(status_data)
+
+        # 다음 폴링 예약: 상태가 움직이면 1s로 복귀, 정체 구간은 최대 10s까지 백오프
+        if self._status_watchers:
+            if changed:
+                self._status_poll_interval = 1.0
+            else:
+                self._status_poll_interval = min(self._status_poll_interval * 1.5, 10.0)
+            self._status_timer = ui.timer(self._status_poll_interval, self._poll_statuses, once=True)
+
     def start_repository_status_check(self, repo_id: str, repo_name: str):
-        """Repository 처리 상태를 주기적으로 확인"""
+        """Repository 처리 상태 감시 (공유 배치 폴링 사용)"""
         check_count = 0
         max_checks = 60  # 최대 60번 확인 (약 1분)
 
-        def check_status():
+        def on_status(status_data):
             nonlocal check_count
             check_count += 1
 
-            try:
-                status_data = self.api_service.get_repository_status(repo_id)
-                current_status = status_data.get('status')
-                error_message = status_data.get('error_message')
-
-                # 에러 상태 확인
-                if current_status == 'error':
-                    # 타이머 중지
-                    if hasattr(self, 'status_timer'):
-                        self.status_timer.active = False
-                    # 에러 메시지가 있으면 함께 표시
-                    if error_message:
-                        ui.notify(f'❌ Failed to process repository "{repo_name}": {error_message}', color='negative', timeout=15000)
-                    else:
-                        ui.notify(f'❌ Failed to process repository "{repo_name}". Please check the repository URL and try again.', color='negative', timeout=10000)
-                    # 페이지 새로고침하여 에러 메시지를 사이드바에 표시
-                    ui.navigate.reload()
-                    return
-
-                # 완료 상태 확인
-                if current_status == 'active':
-                    # 타이머 중지
-                    if hasattr(self, 'status_timer'):
-                        self.status_timer.active = False
-                    ui.notify(f'✅ Repository "{repo_name}" processed successfully!', color='positive', timeout=5000)
-                    # 페이지 새로고침하여 업데이트된 상태 표시
-                    ui.navigate.reload()
-                    return
-
-                # 최대 확인 횟수 초과
-                if check_count >= max_checks:
-                    if hasattr(self, 'status_timer'):
-                        self.status_timer.active = False
-                    ui.notify(f'⏱️ Repository "{repo_name}" is still processing. Please check back later.', color='info', timeout=5000)
-                    return
+            current_status = status_data.get('status')
+            error_message = status_data.get('error_message')
 
+            # 에러 상태 확인
+            if current_status == 'error':
+                self._unwatch_repository_status(repo_id)
+                # 에러 메시지가 있으면 함께 표시
+                if error_message:
+                    ui.notify(f'❌ Failed to process repository "{repo_name}": {error_message}', color='negative', timeout=15000)
+                else:
+                    ui.notify(f'❌ Failed to process repository "{repo_name}". Please check the repository URL and try again.', color='negative', timeout=10000)
+                # 페이지 새로고침하여 에러 메시지를 사이드바에 표시
+                self._invalidate_repositories()
+                ui.navigate.reload()
+                return
+
+            # 완료 상태 확인
+            if current_status == 'active':
+                self._unwatch_repository_status(repo_id)
+                ui.notify(f'✅ Repository "{repo_name}" processed successfully!', color='positive', timeout=5000)
+                # 페이지 새로고침하여 업데이트된 상태 표시
+                self._invalidate_repositories()
+                ui.navigate.reload()
+                return
+
+            # 최대 확인 횟수 초과
+            if check_count >= max_checks:
+                self._unwatch_repository_status(repo_id)
+                ui.notify(f'⏱️ Repository "{repo_name}" is still processing. Please check back later.', color='info', timeout=5000)
+
+        self._watch_repository_status(repo_id, on_status)
+
+    async def show_members_dialog(self):
+        # 예열된 캐시를 우선 사용, 미스 시 이벤트 루프를 막지 않고 조회
+        members = self._members_cache.get(self.selected_repo["id"])
+        if members is None:
+            try:
+                members = await self.api_service.get_repository_members_async(self.selected_repo["id"])
+                self._members_cache[self.selected_repo["id"]] = members
             except Exception as e:
-                print(f"Status check error: {e}")
-                # 에러 발생 시 타이머 중지
-                if check_count >= 5:  # 5번 실패하면 중지
-                    if hasattr(self, 'status_timer'):
-                        self.status_timer.active = False
-
-        # 1초마다 상태 확인 (더 빠른 응답)
-        self.status_timer = ui.timer(1.0, check_status)
+                ui.notify(f"Failed to load members: {str(e)}", type='negative')
+                members = []
 
-    def show_members_dialog(self):
         with ui.dialog() as dialog, ui.card().style('width: 600px;'):
             with ui.row().style('display: flex; justify-content: space-between; align-items: center; margin-bottom: 16px;'):
                 ui.html('<h3 style="font-size: 18px; font-weight: 600;">Repository Members</h3>')
                 ui.button('➕ Invite Member', on_click=lambda: self.show_invite_member_dialog(dialog)).style('background-color: #3b82f6; color: white; padding: 6px 12px; border-radius: 4px; border: none; font-size: 12px;')
 
-            try:
-                members = self.api_service.get_repository_members(self.selected_repo["id"])
-            except Exception as e:
-                ui.notify(f"Failed to load members: {str(e)}", type='negative')
-                members = []
-
             with ui.column().style('gap: 8px; max-height: 400px; overflow-y: auto;'):
                 for member in members:
                     with ui.row().style('display: flex; align-items: center; justify-content: space-between; padding: 12px; border: 1px solid #e5e7eb; border-radius: 8px;'):
@@ -382,8 +602,8 @@ class RepositorySettingsPage:
                             role_select = ui.select(['admin', 'member'], value=member["role"], on_change=lambda e, m=member: self.change_member_role(m, e.value)).style('min-width: 80px; font-size: 12px;')
 
                             # Action buttons (only show if not current user or if admin)
-                            current_user = self.auth_service.get_current_user()
-                            if current_user["email"] != member["email"]:
+                            # current_user는 렌더 패스에서 캐시됨 (멤버마다 재조회하지 않음)
+                            if self._current_user["email"] != member["email"]:
                                 ui.button('🚪', on_click=lambda m=member: self.kick_member(m, dialog)).style('background-color: #fef2f2; color: #dc2626; padding: 4px; border-radius: 4px; border: none; font-size: 12px; cursor: pointer;').tooltip('Remove member')
 
             ui.button('Close', on_click=dialog.close).style('width: 100%; margin-top: 16px; background-color: #6b7280; color: white; padding: 8px; border-radius: 4px; border: none;')
@@ -417,66 +637,55 @@ class RepositorySettingsPage:
             ui.notify(f'❌ Failed to sync repository: {str(e)}', color='negative')
 
     def start_sync_status_check(self, repo_id: str, repo_name: str):
-        """동기화 상태를 주기적으로 확인"""
+        """동기화 상태 감시 (공유 배치 폴링 사용)"""
         check_count = 0
         max_checks = 120  # 최대 120번 확인 (약 2분)
 
-        def check_status():
+        def on_status(status_data):
             nonlocal check_count
             check_count += 1
 
-            try:
-                status_data = self.api_service.get_repository_status(repo_id)
-                current_status = status_data.get('status')
-                vectordb_status = status_data.get('vectordb_status')
-                error_message = status_data.get('error_message')
-
-                # 에러 상태 확인
-                if current_status == 'error' or vectordb_status == 'error':
-                    if hasattr(self, 'sync_timer'):
-                        self.sync_timer.active = False
-                    if error_message:
-                        ui.notify(f'❌ Sync failed for "{repo_name}": {error_message}', color='negative', timeout=15000)
-                    else:
-                        ui.notify(f'❌ Sync failed for "{repo_name}". Please try again.', color='negative', timeout=10000)
-
-                    # 에러 메시지를 볼 수 있도록 잠시 대기 후 reload
-                    ui.timer(5.0, lambda: ui.navigate.reload(), once=True)
-                    return
-
-                # 완료 상태 확인
-                if current_status == 'active' and vectordb_status == 'active':
-                    if hasattr(self, 'sync_timer'):
-                        self.sync_timer.active = False
-
-                    # 변경사항이 있었는지 확인 (last_sync 시간 체크)
-                    # 빠르게 완료된 경우 (1초 이내) "변경사항 없음"으로 간주
-                    if check_count <= 2:
-                        ui.notify(f'ℹ️ Repository "{repo_name}" is already up to date. No changes detected.',
-                                 color='info', timeout=5000)
-                    else:
-                        ui.notify(f'✅ Repository "{repo_name}" synchronized successfully!',
-                                 color='positive', timeout=5000)
-
-                    # 알림을 볼 수 있도록 잠시 대기 후 reload
-                    ui.timer(3.0, lambda: ui.navigate.reload(), once=True)
-                    return
-
-                # 최대 확인 횟수 초과
-                if check_count >= max_checks:
-                    if hasattr(self, 'sync_timer'):
-                        self.sync_timer.active = False
-                    ui.notify(f'⏱️ Sync is still in progress for "{repo_name}". Please check back later.', color='info', timeout=5000)
-                    return
+            current_status = status_data.get('status')
+            vectordb_status = status_data.get('vectordb_status')
+            error_message = status_data.get('error_message')
 
-            except Exception as e:
-                print(f"Sync status check error: {e}")
-                if check_count >= 5:
-                    if hasattr(self, 'sync_timer'):
-                        self.sync_timer.active = False
+            # 에러 상태 확인
+            if current_status == 'error' or vectordb_status == 'error':
+                self._unwatch_repository_status(repo_id)
+                if error_message:
+                    ui.notify(f'❌ Sync failed for "{repo_name}": {error_message}', color='negative', timeout=15000)
+                else:
+                    ui.notify(f'❌ Sync failed for "{repo_name}". Please try again.', color='negative', timeout=10000)
+
+                # 에러 메시지를 볼 수 있도록 잠시 대기 후 reload
+                self._invalidate_repositories()
+                ui.timer(5.0, lambda: ui.navigate.reload(), once=True)
+                return
+
+            # 완료 상태 확인
+            if current_status == 'active' and vectordb_status == 'active':
+                self._unwatch_repository_status(repo_id)
+
+                # 변경사항이 있었는지 확인 (last_sync 시간 체크)
+                # 빠르게 완료된 경우 (1초 이내) "변경사항 없음"으로 간주
+                if check_count <= 2:
+                    ui.notify(f'ℹ️ Repository "{repo_name}" is already up to date. No changes detected.',
+                             color='info', timeout=5000)
+                else:
+                    ui.notify(f'✅ Repository "{repo_name}" synchronized successfully!',
+                             color='positive', timeout=5000)
+
+                # 알림을 볼 수 있도록 잠시 대기 후 reload
+                self._invalidate_repositories()
+                ui.timer(3.0, lambda: ui.navigate.reload(), once=True)
+                return
+
+            # 최대 확인 횟수 초과
+            if check_count >= max_checks:
+                self._unwatch_repository_status(repo_id)
+                ui.notify(f'⏱️ Sync is still in progress for "{repo_name}". Please check back later.', color='info', timeout=5000)
 
-        # 1초마다 상태 확인
-        self.sync_timer = ui.timer(1.0, check_status)
+        self._watch_repository_status(repo_id, on_status)
 
     def show_sync_logs(self):
         ui.notify('Sync logs feature coming soon', color='blue')
@@ -539,8 +748,7 @@ class RepositorySettingsPage:
 
     def kick_member(self, member, dialog):
         """Remove a member from the repository"""
-        current_user = self.auth_service.get_current_user()
-        if current_user["email"] == member["email"]:
+        if self._current_user["email"] == member["email"]:
             ui.notify('You cannot remove yourself', color='red')
             return
 
@@ -562,7 +770,7 @@ class RepositorySettingsPage:
         confirm_dialog.close()
         members_dialog.close()
         # Refresh the members dialog
-        self.show_members_dialog()
+        asyncio.create_task(self.show_members_dialog())
 
     def show_invite_member_dialog(self, parent_dialog):
         """Show dialog to invite new member"""
@@ -118,6 +118,30 @@ class APIService:
         response = self._make_request("POST", "/api/repositories", data)
         return self._convert_datetime_fields(response)
 
+    async def get_repositories_async(self) -> List[Dict[str, Any]]:
+        """get_repositories의 비동기 래퍼 (이벤트 루프 비차단)"""
+        import asyncio
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.get_repositories)
+
+    async def get_repository_members_async(self, repo_id: str) -> List[Dict[str, Any]]:
+        """get_repository_members의 비동기 래퍼 (이벤트 루프 비차단)"""
+        import asyncio
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.get_repository_members, repo_id)
+
+    async def get_repository_status_async(self, repo_id: str) -> Dict[str, Any]:
+        """get_repository_status의 비동기 래퍼 (이벤트 루프 비차단)"""
+        import asyncio
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.get_repository_status, repo_id)
+
+    def get_repository_statuses(self, repo_ids: List[str]) -> List[Dict[str, Any]]:
+        """여러 repository의 처리 상태를 한 번의 요청으로 조회"""
+        ids = ",".join(str(repo_id) for repo_id in repo_ids)
+        data = self._make_request("GET", f"/api/repositories/status?ids={ids}")
+        return self._convert_datetime_fields(data.get("statuses", []))
+
     def get_repository_status(self, repo_id: str) -> Dict[str, Any]:
         """Get repository processing status"""
         data = self._make_request("GET", f"/api/repositories/{repo_id}/status")
@@ -134,6 +158,14 @@ class APIService:
                 "error": str(e)
             }
 
+    def get_chat_bootstrap(self, repo_id: str) -> Dict[str, Any]:
+        """채팅 페이지 초기 데이터 일괄 조회 (repository + chat_rooms + 첫 방 메시지)"""
+        data = self._make_request("GET", f"/api/repositories/{repo_id}/chat-bootstrap")
+        data["repository"] = self._convert_datetime_fields(data.get("repository"))
+        data["chat_rooms"] = self._convert_datetime_fields(data.get("chat_rooms", []))
+        data["initial_messages"] = self._convert_datetime_fields(data.get("initial_messages", []))
+        return data
+
     def get_chat_rooms(self, repo_id: str) -> List[Dict[str, Any]]:
         """Get chat rooms for a repository"""
         try:
@@ -143,11 +175,41 @@ class APIService:
             # API가 구현되지 않은 경우 더미 데이터 반환
             return []
 
-    def get_messages(self, chat_room_id: str) -> List[Dict[str, Any]]:
-        """Get messages for a chat room"""
-        messages = self._make_request("GET", f"/api/repositories/chat-rooms/{chat_room_id}/messages")
+    def get_messages(self, chat_room_id: str, limit: int = None, before_id: str = None) -> List[Dict[str, Any]]:
+        """Get messages for a chat room (optionally a page before a given message)"""
+        params = []
+        if limit:
+            params.append(f"limit={limit}")
+        if before_id:
+            params.append(f"before_id={before_id}")
+        query = f"?{'&'.join(params)}" if params else ""
+        messages = self._make_request("GET", f"/api/repositories/chat-rooms/{chat_room_id}/messages{query}")
         return self._convert_datetime_fields(messages)
 
+    async def wait_for_bot_response(self, chat_room_id: str, after: str = None, timeout: int = 25) -> Dict[str, Any]:
+        """새 bot 메시지가 도착할 때까지 대기 (롱폴링, 타임아웃 시 빈 목록)"""
+        import asyncio
+
+        url = f"{self.base_url}/api/repositories/chat-rooms/{chat_room_id}/messages/wait?timeout={timeout}"
+        if after:
+            url += f"&after={after}"
+
+        def _request():
+            headers = {"Content-Type": "application/json"}
+            if self.auth_service:
+                token = self.auth_service.get_token()
+                if token:
+                    headers["Authorization"] = f"Bearer {token}"
+            # 서버가 timeout 동안 응답을 보류하므로 여유를 두고 대기
+            response = self.session.get(url, headers=headers, timeout=timeout + 10)
+            response.raise_for_status()
+            return response.json()
+
+        loop = asyncio.get_event_loop()
+        data = await loop.run_in_executor(None, _request)
+        data["messages"] = self._convert_datetime_fields(data.get("messages", []))
+        return data
+
     def add_message(self, chat_room_id: str, sender_type: str, content: str) -> Dict[str, Any]:
         """Add a new message to a chat room"""
         data = {
@@ -221,7 +283,20 @@ class APIService:
         """Search user by email"""
         return self._make_request("GET", f"/auth/users/search?email={email}")
 
-    async def get_code_history(self, repo_id: str, file_path: str, line_info: str = None, node_name: str = None, node_type: str = "function") -> Dict[str, Any]:
+    async def get_code_history_page(self, task_id: str, offset: int = 0, limit: int = None) -> Dict[str, Any]:
+        """완료된 코드 히스토리 task의 결과를 구간 단위로 조회"""
+        import asyncio
+
+        url = f"/api/repositories/code-history/{task_id}?offset={offset}"
+        if limit:
+            url += f"&limit={limit}"
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, lambda: self._make_request("GET", url)
+        )
+
+    async def get_code_history(self, repo_id: str, file_path: str, line_info: str = None, node_name: str = None, node_type: str = "function", limit: int = 20) -> Dict[str, Any]:
         """Get code history for a specific node in a file"""
         try:
             data = {
@@ -244,7 +319,30 @@ class APIService:
                 None,
                 lambda: self._make_request("POST", "/api/repositories/code-history", data)
             )
-            return response
+
+            task_id = response.get("task_id")
+            if not task_id:
+                # task_id가 없으면 결과가 바로 온 경우
+                return response
+
+            # task 완료까지 폴링 (최대 30초, 첫 페이지만 수신)
+            for _ in range(60):
+                result = await loop.run_in_executor(
+                    None,
+                    lambda: self._make_request(
+                        "GET",
+                        f"/api/repositories/code-history/{task_id}?limit={limit}"
+                    )
+                )
+                if result.get("status") != "pending":
+                    return result
+                await asyncio.sleep(0.5)
+
+            return {
+                "success": False,
+                "error": "Code history task timed out",
+                "history": []
+            }
         except Exception as e:
             return {
                 "success": False,
@@ -252,6 +350,50 @@ class APIService:
                 "history": []
             }
 
+    async def get_code_history_batch(self, repo_id: str, queries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """여러 노드의 코드 히스토리를 한 번의 요청으로 디스패치 후 결과 폴링"""
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        data = {"repo_id": repo_id, "queries": queries}
+
+        try:
+            response = await loop.run_in_executor(
+                None,
+                lambda: self._make_request("POST", "/api/repositories/code-history/batch", data)
+            )
+        except Exception as e:
+            return [
+                {"success": False, "error": str(e), "history": []}
+                for _ in queries
+            ]
+
+        async def wait_result(task):
+            task_id = task["task_id"]
+            for _ in range(60):
+                try:
+                    result = await loop.run_in_executor(
+                        None,
+                        lambda tid=task_id: self._make_request(
+                            "GET", f"/api/repositories/code-history/{tid}"
+                        )
+                    )
+                except Exception as e:
+                    return {"success": False, "error": str(e), "history": []}
+                if result.get("status") != "pending":
+                    return result
+                await asyncio.sleep(0.5)
+            return {
+                "success": False,
+                "error": "Code history task timed out",
+                "history": []
+            }
+
+        return list(await asyncio.gather(
+            *(wait_result(task) for task in response.get("tasks", []))
+        ))
+
+
 # Global instance - will be initialized with auth_service in app.py
 api_service = None
 
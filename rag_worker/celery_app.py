@@ -66,10 +66,15 @@ app.conf.update(
     broker_url=REDIS_URL,
     result_backend=REDIS_URL,
     task_serializer='json',
-    accept_content=['json'],
+    accept_content=['msgpack', 'json'],  # backend는 msgpack으로 전송
     result_serializer='json',
     timezone='UTC',
     enable_utc=True,
+    # 장시간 파이프라인 task에 맞춘 튜닝:
+    # prefetch를 1로 낮춰 유휴 폴링/선점을 줄이고 동시 sync 요청 간 공정성 확보,
+    # acks_late로 워커가 죽어도 task가 재전달되도록 보장 (repo 단위 멱등)
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
     # 기본 celery queue 사용 (task_routes 제거)
 )
 
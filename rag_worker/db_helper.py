@@ -7,8 +7,24 @@ from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from datetime import datetime
+import os
 import uuid
 
+import redis
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+_redis_client = redis.from_url(REDIS_URL, decode_responses=True)
+
+
+def _bump_room_version(chat_room_id: str) -> None:
+    """메시지 목록 캐시 버전 증가 (backend의 get_messages 캐시 무효화)"""
+    try:
+        _redis_client.incr(f"room_ver:{chat_room_id}")
+    except Exception:
+        # Redis 장애 시 캐시 TTL 만료로 자연 무효화
+        pass
+
 
 class RepositoryDBHelper:
     """Repository DB 직접 업데이트를 위한 헬퍼 클래스"""
@@ -225,6 +241,9 @@ class ChatMessageDBHelper:
 
             db.commit()
 
+            # 메시지 목록 캐시 무효화 (버전 증가)
+            _bump_room_version(chat_room_id)
+
             return {
                 "id": str(message_id),
                 "chat_room_id": chat_room_id,